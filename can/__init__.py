@@ -5,9 +5,11 @@ different hardware devices, and a suite of utilities for sending and receiving
 messages on a can bus.
 """
 
+import importlib
 import logging
+import sys
 
-from typing import Dict, Any
+from typing import Any, Dict, List
 
 __version__ = "4.0.0-dev"
 
@@ -20,30 +22,78 @@ class CanError(IOError):
     """Indicates an error with the CAN network."""
 
 
-from .listener import Listener, BufferedReader, RedirectReader, AsyncBufferedReader
-
-from .io import Logger, SizedRotatingLogger, Printer, LogReader, MessageSync
-from .io import ASCWriter, ASCReader
-from .io import BLFReader, BLFWriter
-from .io import CanutilsLogReader, CanutilsLogWriter
-from .io import CSVWriter, CSVReader
-from .io import SqliteWriter, SqliteReader
-
 from .util import set_logging_level
 
-from .message import Message
-from .bus import BusABC, BusState
-from .thread_safe_bus import ThreadSafeBus
-from .notifier import Notifier
-from .interfaces import VALID_INTERFACES
+from .message import Message, pack_messages, unpack_messages
+from .bus import BusABC, BusState, BusStatistics, PreparedMessage
 from . import interface
 from .interface import Bus, detect_available_configs
 from .bit_timing import BitTiming
 
 from .broadcastmanager import (
     CyclicSendTaskABC,
+    CyclicSendTaskGroup,
     LimitedDurationCyclicSendTaskABC,
     ModifiableCyclicTaskABC,
     MultiRateCyclicSendTaskABC,
     RestartableCyclicTaskABC,
 )
+
+# These are only imported when they are accessed for the first time, since
+# some of them pull in modules which are slow to import (like sqlite3 or
+# asyncio) and many applications only need a bus.
+# name => module
+_LAZY_IMPORTS = {
+    "Listener": ".listener",
+    "BufferedReader": ".listener",
+    "RedirectReader": ".listener",
+    "AsyncBufferedReader": ".listener",
+    "Logger": ".io",
+    "SizedRotatingLogger": ".io",
+    "Printer": ".io",
+    "LogReader": ".io",
+    "MessageSync": ".io",
+    "ASCWriter": ".io",
+    "ASCReader": ".io",
+    "BLFReader": ".io",
+    "BLFWriter": ".io",
+    "BinaryReader": ".io",
+    "BinaryWriter": ".io",
+    "CanutilsLogReader": ".io",
+    "CanutilsLogWriter": ".io",
+    "CSVWriter": ".io",
+    "CSVReader": ".io",
+    "SqliteWriter": ".io",
+    "SqliteReader": ".io",
+    "ThreadSafeBus": ".thread_safe_bus",
+    "Notifier": ".notifier",
+    "SharedRingBuffer": ".fanout",
+    "RingBufferBus": ".fanout",
+    "CaptureProcess": ".fanout",
+    "VALID_INTERFACES": ".interfaces",
+}
+
+# submodules which used to be imported implicitly by the imports above
+_LAZY_SUBMODULES = {"io", "listener", "notifier", "thread_safe_bus"}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+    elif name in _LAZY_SUBMODULES:
+        value = importlib.import_module("." + name, __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS) | _LAZY_SUBMODULES)
+
+
+if sys.version_info < (3, 7):
+    # module level __getattr__ is not supported (PEP 562)
+    for _name in _LAZY_IMPORTS:
+        __getattr__(_name)
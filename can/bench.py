@@ -0,0 +1,436 @@
+"""
+Measures the performance of the hot paths of python-can, like creating and
+filtering messages, dispatching them with a :class:`can.Notifier`, and
+reading and writing the log file formats.
+
+No hardware is needed: the messages are generated synthetically and sent
+over the :class:`~can.interfaces.virtual.VirtualBus`. If a ``vcan``
+interface is available, the SocketCAN backend is measured as well.
+
+The results are written as JSON, and two such files can be compared::
+
+    python -m can.bench -o before.json
+    # change something
+    python -m can.bench -o after.json
+    python -m can.bench --compare before.json after.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+import can
+from can import Message
+
+#: name => function that measures the benchmark for the given messages
+#: and returns the elapsed time in seconds
+BENCHMARKS: Dict[str, Callable[[List[Message]], float]] = {}
+
+
+class BenchmarkSkipped(Exception):
+    """Raised by a benchmark that cannot run in the current environment."""
+
+
+def benchmark(name: str):
+    """Register the decorated function under the given name in :data:`BENCHMARKS`."""
+
+    def decorator(function: Callable[[List[Message]], float]):
+        BENCHMARKS[name] = function
+        return function
+
+    return decorator
+
+
+def generate_messages(count: int, seed: int = 0) -> List[Message]:
+    """Generate reproducible, synthetic traffic.
+
+    :param count: The number of messages to generate.
+    :param seed: The seed of the random generator.
+    """
+    rng = random.Random(seed)
+    messages = []
+    timestamp = 1000.0
+    for _ in range(count):
+        is_extended_id = rng.random() < 0.3
+        dlc = rng.randint(0, 8)
+        timestamp += rng.uniform(0.0001, 0.001)
+        messages.append(
+            Message(
+                timestamp=timestamp,
+                arbitration_id=rng.getrandbits(29 if is_extended_id else 11),
+                is_extended_id=is_extended_id,
+                data=bytes(rng.getrandbits(8) for _ in range(dlc)),
+                channel=0,
+            )
+        )
+    return messages
+
+
+@benchmark("message.construct")
+def _message_construct(messages: List[Message]) -> float:
+    fields = [
+        (msg.arbitration_id, msg.is_extended_id, bytes(msg.data)) for msg in messages
+    ]
+    started = time.perf_counter()
+    for arbitration_id, is_extended_id, data in fields:
+        Message(arbitration_id=arbitration_id, is_extended_id=is_extended_id, data=data)
+    return time.perf_counter() - started
+
+
+@benchmark("message.filter")
+def _message_filter(messages: List[Message]) -> float:
+    filters = [
+        {"can_id": 0x100, "can_mask": 0x700, "extended": False},
+        {"can_id": 0x7E8, "can_mask": 0x7F8, "extended": False},
+        {"can_id": 0x18DAF100, "can_mask": 0x1FFFFF00, "extended": True},
+        {"can_id": 0x0, "can_mask": 0x1, "extended": True},
+    ]
+    with can.Bus(
+        interface="virtual", channel="bench_filter", can_filters=filters
+    ) as bus:
+        started = time.perf_counter()
+        for msg in messages:
+            bus._matches_filters(msg)  # pylint: disable=protected-access
+        return time.perf_counter() - started
+
+
+@benchmark("virtual.send_recv")
+def _virtual_send_recv(messages: List[Message]) -> float:
+    with can.Bus(interface="virtual", channel="bench_send_recv") as sender:
+        with can.Bus(interface="virtual", channel="bench_send_recv") as receiver:
+            started = time.perf_counter()
+            for msg in messages:
+                sender.send(msg)
+            for _ in messages:
+                receiver.recv(1.0)
+            return time.perf_counter() - started
+
+
+@benchmark("notifier.dispatch")
+def _notifier_dispatch(messages: List[Message]) -> float:
+    done = threading.Event()
+    received = [0]
+
+    def count(_msg: Message) -> None:
+        received[0] += 1
+        if received[0] == len(messages):
+            done.set()
+
+    def ignore(_msg: Message) -> None:
+        pass
+
+    with can.Bus(interface="virtual", channel="bench_notifier") as sender:
+        with can.Bus(interface="virtual", channel="bench_notifier") as receiver:
+            notifier = can.Notifier(receiver, [ignore, ignore, count], timeout=0.1)
+            try:
+                started = time.perf_counter()
+                for msg in messages:
+                    sender.send(msg)
+                if not done.wait(60.0):
+                    raise RuntimeError("The notifier did not receive all messages")
+                return time.perf_counter() - started
+            finally:
+                notifier.stop()
+
+
+def _register_io_benchmarks(
+    name: str, suffix: str, writer: Callable, reader: Callable
+) -> None:
+    def write(messages: List[Message]) -> float:
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "bench" + suffix)
+            return _write_log(writer(file_name), messages)
+
+    def read(messages: List[Message]) -> float:
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "bench" + suffix)
+            _write_log(writer(file_name), messages)
+            started = time.perf_counter()
+            for _ in reader(file_name):
+                pass
+            return time.perf_counter() - started
+
+    BENCHMARKS["io.{}.write".format(name)] = write
+    BENCHMARKS["io.{}.read".format(name)] = read
+
+
+def _write_log(writer: can.Listener, messages: List[Message]) -> float:
+    started = time.perf_counter()
+    for msg in messages:
+        writer.on_message_received(msg)
+    writer.stop()
+    return time.perf_counter() - started
+
+
+_register_io_benchmarks(
+    "asc", ".asc", lambda path: can.ASCWriter(path), lambda path: can.ASCReader(path)
+)
+_register_io_benchmarks(
+    "blf", ".blf", lambda path: can.BLFWriter(path), lambda path: can.BLFReader(path)
+)
+_register_io_benchmarks(
+    "csv", ".csv", lambda path: can.CSVWriter(path), lambda path: can.CSVReader(path)
+)
+_register_io_benchmarks(
+    "canutils",
+    ".log",
+    lambda path: can.CanutilsLogWriter(path),
+    lambda path: can.CanutilsLogReader(path),
+)
+_register_io_benchmarks(
+    "sqlite",
+    ".db",
+    lambda path: can.SqliteWriter(path),
+    lambda path: can.SqliteReader(path),
+)
+
+#: The channel used by the SocketCAN benchmark
+VCAN_CHANNEL = "vcan0"
+
+
+@benchmark("socketcan.send_recv")
+def _socketcan_send_recv(messages: List[Message]) -> float:
+    try:
+        sender = can.Bus(interface="socketcan", channel=VCAN_CHANNEL)
+        receiver = can.Bus(interface="socketcan", channel=VCAN_CHANNEL)
+    except (OSError, ImportError) as exc:
+        raise BenchmarkSkipped("{} is not available: {}".format(VCAN_CHANNEL, exc))
+    with sender, receiver:
+        started = time.perf_counter()
+        received = 0
+        for msg in messages:
+            sender.send(msg, timeout=1.0)
+            # read along, so the receive buffer of the socket does not overflow
+            while receiver.recv(0) is not None:
+                received += 1
+        while received < len(messages) and receiver.recv(1.0) is not None:
+            received += 1
+        return time.perf_counter() - started
+
+
+def run(names: List[str], count: int = 10000, repeat: int = 3, seed: int = 0) -> Dict:
+    """Run the given benchmarks.
+
+    :param names: The names of the benchmarks to run, see :data:`BENCHMARKS`.
+    :param count: The number of messages every benchmark processes.
+    :param repeat: How often every benchmark is repeated. The best run counts.
+    :param seed: The seed for generating the messages.
+
+    :return: The results, ready to be serialized as JSON.
+    """
+    messages = generate_messages(count, seed)
+    results: Dict[str, Dict] = {}
+    for name in names:
+        try:
+            timings = [BENCHMARKS[name](messages) for _ in range(repeat)]
+        except BenchmarkSkipped as exc:
+            results[name] = {"skipped": str(exc)}
+            continue
+        best = min(timings)
+        results[name] = {
+            "best": best,
+            "mean": sum(timings) / len(timings),
+            "messages_per_second": count / best if best > 0 else None,
+            "us_per_message": 1e6 * best / count,
+        }
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "can_version": can.__version__,
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "count": count,
+        "repeat": repeat,
+        "seed": seed,
+        "benchmarks": results,
+    }
+
+
+def compare(before: Dict, after: Dict, threshold: float = 0.1) -> List[Dict]:
+    """Compare two results of :func:`run`.
+
+    :param before: The reference results.
+    :param after: The new results.
+    :param threshold:
+        The relative slowdown above which a benchmark counts as regressed.
+
+    :return:
+        One entry per benchmark present in both results, with the time per
+        message before and after, their ratio and whether it regressed.
+    """
+    rows = []
+    for name, old in before["benchmarks"].items():
+        new = after["benchmarks"].get(name)
+        if new is None or "skipped" in old or "skipped" in new:
+            continue
+        if not old["us_per_message"]:
+            # too fast for the clock, there is nothing to compare with
+            continue
+        ratio = new["us_per_message"] / old["us_per_message"]
+        rows.append(
+            {
+                "name": name,
+                "before": old["us_per_message"],
+                "after": new["us_per_message"],
+                "ratio": ratio,
+                "regressed": ratio > 1 + threshold,
+            }
+        )
+    return rows
+
+
+def _print_results(results: Dict, file) -> None:
+    print(
+        "python-can {can_version} on {implementation} {python}, "
+        "{count} messages, best of {repeat}".format(**results),
+        file=file,
+    )
+    for name, result in results["benchmarks"].items():
+        if "skipped" in result:
+            print("{:<24} skipped: {}".format(name, result["skipped"]), file=file)
+        else:
+            print(
+                "{:<24} {:>10.2f} us/msg {:>12.0f} msg/s".format(
+                    name,
+                    result["us_per_message"],
+                    result["messages_per_second"] or float("inf"),
+                ),
+                file=file,
+            )
+
+
+def _print_comparison(rows: List[Dict], file) -> None:
+    print(
+        "{:<24} {:>12} {:>12} {:>8}".format("benchmark", "before", "after", "ratio"),
+        file=file,
+    )
+    for row in rows:
+        print(
+            "{name:<24} {before:>9.2f} us {after:>9.2f} us {ratio:>8.2f}{marker}".format(
+                marker="  <-- slower" if row["regressed"] else "", **row
+            ),
+            file=file,
+        )
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be at least 1, got {}".format(value))
+    return number
+
+
+def main(args: Optional[List[str]] = None) -> int:
+    global VCAN_CHANNEL  # pylint: disable=global-statement
+
+    parser = argparse.ArgumentParser(
+        "python -m can.bench",
+        description="Benchmark the hot paths of python-can without hardware.",
+    )
+
+    parser.add_argument(
+        "-n",
+        "--count",
+        type=_positive_int,
+        default=10000,
+        help="The number of messages each benchmark processes (default: 10000).",
+    )
+
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=_positive_int,
+        default=3,
+        help="How often to repeat each benchmark, the best run counts (default: 3).",
+    )
+
+    parser.add_argument(
+        "-k",
+        "--select",
+        action="append",
+        help="Only run the benchmarks whose name contains this text. "
+        "May be given several times.",
+    )
+
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="The seed for generating the synthetic traffic (default: 0).",
+    )
+
+    parser.add_argument(
+        "--vcan-channel",
+        default=VCAN_CHANNEL,
+        help="The vcan interface to benchmark SocketCAN on (default: vcan0).",
+    )
+
+    parser.add_argument(
+        "-o", "--output", help="Write the results as JSON to this file."
+    )
+
+    parser.add_argument(
+        "--list", action="store_true", help="List the benchmarks and exit."
+    )
+
+    parser.add_argument(
+        "--compare",
+        nargs=2,
+        metavar=("BEFORE", "AFTER"),
+        help="Compare two JSON result files instead of running the benchmarks. "
+        "Exits with status 1 if a benchmark regressed.",
+    )
+
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="The relative slowdown that counts as a regression (default: 0.1).",
+    )
+
+    results = parser.parse_args(args)
+
+    if results.list:
+        for name in BENCHMARKS:
+            print(name)
+        return 0
+
+    if results.compare:
+        with open(results.compare[0]) as before_file:
+            before = json.load(before_file)
+        with open(results.compare[1]) as after_file:
+            after = json.load(after_file)
+        rows = compare(before, after, results.threshold)
+        _print_comparison(rows, sys.stdout)
+        return 1 if any(row["regressed"] for row in rows) else 0
+
+    VCAN_CHANNEL = results.vcan_channel
+
+    names = [
+        name
+        for name in BENCHMARKS
+        if not results.select or any(text in name for text in results.select)
+    ]
+    benchmark_results = run(names, results.count, results.repeat, results.seed)
+
+    if results.output:
+        with open(results.output, "w") as output_file:
+            json.dump(benchmark_results, output_file, indent=2)
+        _print_results(benchmark_results, sys.stdout)
+    else:
+        _print_results(benchmark_results, sys.stderr)
+        json.dump(benchmark_results, sys.stdout, indent=2)
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
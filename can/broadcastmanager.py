@@ -5,7 +5,7 @@ The main entry point to these classes should be through
 :meth:`can.BusABC.send_periodic`.
 """
 
-from typing import Optional, Sequence, Tuple, Union, Callable, TYPE_CHECKING
+from typing import Optional, Sequence, Tuple, Union, Callable, TYPE_CHECKING, cast
 
 from can import typechecking
 
@@ -193,6 +193,52 @@ class MultiRateCyclicSendTaskABC(CyclicSendTaskABC):
         self._channel = channel
 
 
+class CyclicSendTaskGroup(CyclicTask):
+    """A group of periodic tasks that are controlled together.
+
+    Returned by :meth:`can.BusABC.send_periodic_group`.
+    """
+
+    def __init__(self, tasks: Sequence[CyclicSendTaskABC]):
+        """
+        :param tasks: The started tasks making up this group.
+        """
+        self.tasks = list(tasks)
+
+    def stop(self):
+        """Stop all tasks of the group."""
+        for task in self.tasks:
+            task.stop()
+
+    def start(self):
+        """Restart all tasks of the group.
+
+        Requires all tasks to be :class:`RestartableCyclicTaskABC` instances.
+        """
+        for task in self.tasks:
+            task.start()
+
+    def modify_data(self, messages: Sequence[Union[Sequence[Message], Message]]):
+        """Update the contents of the messages of all tasks, without altering
+        the timing.
+
+        Requires all tasks to be :class:`ModifiableCyclicTaskABC` instances.
+
+        :param messages:
+            The new messages, one entry (a message or a sequence of messages)
+            per task in the order of :attr:`tasks`.
+
+        :raises ValueError:
+            If the number of entries does not match the number of tasks.
+        """
+        if len(messages) != len(self.tasks):
+            raise ValueError(
+                "The number of message entries must be equal to the number of tasks"
+            )
+        for task, task_messages in zip(self.tasks, messages):
+            cast(ModifiableCyclicTaskABC, task).modify_data(task_messages)
+
+
 class ThreadBasedCyclicSendTask(
     ModifiableCyclicTaskABC, LimitedDurationCyclicSendTaskABC, RestartableCyclicTaskABC
 ):
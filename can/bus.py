@@ -2,19 +2,38 @@
 Contains the ABC bus implementation and its documentation.
 """
 
-from typing import cast, Any, Iterator, List, Optional, Sequence, Tuple, Union
+from typing import (
+    cast,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import can.typechecking
 
 from abc import ABCMeta, abstractmethod
 import can
+import functools
 import logging
 import threading
+from copy import deepcopy
 from time import time
 from enum import Enum, auto
 
-from can.broadcastmanager import ThreadBasedCyclicSendTask
+from can.broadcastmanager import (
+    CyclicSendTaskABC,
+    CyclicSendTaskGroup,
+    ThreadBasedCyclicSendTask,
+)
 from can.message import Message
+from can.trace import ERROR, GLOBAL_HOOKS, RX, TX, TraceHook, TraceHooks, call_hooks
 
 LOG = logging.getLogger(__name__)
 
@@ -27,6 +46,142 @@ class BusState(Enum):
     ERROR = auto()
 
 
+class PreparedMessage:
+    """A message that was encoded once by :meth:`BusABC.prepare` for repeated
+    transmission with :meth:`BusABC.send_prepared`.
+
+    Only the payload can be changed after preparation, in place through
+    :attr:`data` or with :meth:`update`. The size of the payload and all other
+    attributes of the message are fixed.
+    """
+
+    def __init__(self, msg: Message):
+        """
+        :param msg:
+            The message to prepare. It is copied, so later changes to it do
+            not affect the prepared message.
+        """
+        #: A copy of the prepared message. Interfaces may keep the payload
+        #: elsewhere, so always access it through :attr:`data`.
+        self.message = deepcopy(msg)
+
+    @property
+    def data(self) -> Union[bytearray, memoryview]:
+        """The writable payload of the prepared message."""
+        return self.message.data
+
+    def update(self, data: bytes, offset: int = 0) -> None:
+        """Overwrite a part of the payload in place.
+
+        :param data: The new bytes.
+        :param offset: The index of the first payload byte to overwrite.
+
+        :raises ValueError: If the new bytes do not fit into the payload.
+        """
+        if offset < 0 or offset + len(data) > len(self.data):
+            raise ValueError("The data does not fit into the prepared payload")
+        self.data[offset : offset + len(data)] = data
+
+
+class BusStatistics:
+    """Counters which every :class:`BusABC` maintains on its receive and send
+    paths, see :attr:`BusABC.statistics`.
+
+    Updating them costs a few integer additions per message, so they are
+    always enabled. The counters are not synchronized: they are exact as long
+    as each of the receive and the send path is only used by one thread at a
+    time, which e.g. :class:`~can.ThreadSafeBus` ensures.
+    """
+
+    __slots__ = (
+        "rx_frames",
+        "rx_bytes",
+        "tx_frames",
+        "tx_bytes",
+        "filtered",
+        "error_frames",
+        "send_errors",
+        "recv_calls",
+        "recv_time",
+        "recv_time_max",
+        "driver",
+    )
+
+    def __init__(self) -> None:
+        #: Messages returned by :meth:`BusABC.recv`
+        self.rx_frames = 0
+        #: Payload bytes of the messages returned by :meth:`BusABC.recv`
+        self.rx_bytes = 0
+        #: Messages sent successfully
+        self.tx_frames = 0
+        #: Payload bytes of the messages sent successfully
+        self.tx_bytes = 0
+        #: Received messages which were dropped by the software filters
+        self.filtered = 0
+        #: Error frames returned by :meth:`BusABC.recv`
+        self.error_frames = 0
+        #: Calls to :meth:`BusABC.send` which raised an exception
+        self.send_errors = 0
+        #: Calls to :meth:`BusABC.recv`, including the ones that timed out
+        self.recv_calls = 0
+        #: Seconds spent in the calls to :meth:`BusABC.recv` and
+        #: :meth:`BusABC.recv_batch` which returned messages, including the
+        #: time spent waiting for them to arrive
+        self.recv_time = 0.0
+        #: The longest of the calls counted in :attr:`recv_time` in seconds
+        self.recv_time_max = 0.0
+        #: Counters of the hardware, driver or operating system, like dropped
+        #: frames or the bus load. Which ones are available depends on the
+        #: interface. They are updated every time :attr:`BusABC.statistics`
+        #: is accessed.
+        self.driver: Dict[str, Any] = {}
+
+    def reset(self) -> None:
+        """Set all counters maintained by python-can back to zero."""
+        self.__init__()  # type: ignore
+
+    @property
+    def recv_time_mean(self) -> float:
+        """The mean time spent in the calls counted in :attr:`recv_time` per
+        received message in seconds."""
+        return self.recv_time / self.rx_frames if self.rx_frames else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return all counters as a flat dictionary, e.g. for exporting them
+        to a metrics system. The counters of the driver are prefixed with
+        ``driver_``.
+        """
+        result = {
+            name: getattr(self, name) for name in self.__slots__ if name != "driver"
+        }
+        result["recv_time_mean"] = self.recv_time_mean
+        for name, value in self.driver.items():
+            result["driver_" + name] = value
+        return result
+
+    def __str__(self) -> str:
+        return ", ".join(
+            "{}: {}".format(name, value) for name, value in self.as_dict().items()
+        )
+
+
+def _instrument_send(send: Callable) -> Callable:
+    """Wrap the :meth:`~BusABC.send` method of an interface to update
+    its :class:`BusStatistics` and call its trace hooks."""
+
+    @functools.wraps(send)
+    def wrapper(self: "BusABC", msg: Message, *args: Any, **kwargs: Any) -> Any:
+        try:
+            result = send(self, msg, *args, **kwargs)
+        except Exception as exc:
+            self._on_send_error(exc)
+            raise
+        self._on_sent(msg)
+        return result
+
+    return wrapper
+
+
 class BusABC(metaclass=ABCMeta):
     """The CAN Bus Abstract Base Class that serves as the basis
     for all concrete interfaces.
@@ -37,9 +192,18 @@ class BusABC(metaclass=ABCMeta):
     #: a string describing the underlying bus and/or channel
     channel_info = "unknown"
 
-    #: Log level for received messages
+    #: Log level for received messages. Deprecated: buses no longer log the
+    #: messages themselves, this is only the default level of
+    #: :func:`can.trace.log_frames`.
     RECV_LOGGING_LEVEL = 9
 
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        # count and trace the messages sent by every interface, without each
+        # one having to do so in its own implementation of send()
+        if "send" in cls.__dict__:
+            cls.send = _instrument_send(cls.__dict__["send"])  # type: ignore
+
     @abstractmethod
     def __init__(
         self,
@@ -61,7 +225,9 @@ class BusABC(metaclass=ABCMeta):
         :param dict kwargs:
             Any backend dependent configurations are passed in this dictionary
         """
-        self._periodic_tasks: List[can.broadcastmanager.CyclicSendTaskABC] = []
+        self._periodic_tasks: List[can.broadcastmanager.CyclicTask] = []
+        self._statistics = BusStatistics()
+        self._trace_hooks = TraceHooks()
         self.set_filters(can_filters)
 
     def __str__(self) -> str:
@@ -80,19 +246,38 @@ class BusABC(metaclass=ABCMeta):
         """
         start = time()
         time_left = timeout
+        statistics = self._statistics
+        statistics.recv_calls += 1
 
         while True:
 
             # try to get a message
-            msg, already_filtered = self._recv_internal(timeout=time_left)
+            try:
+                msg, already_filtered = self._recv_internal(timeout=time_left)
+            except Exception as exc:
+                if self._trace_hooks.error or GLOBAL_HOOKS.error:
+                    call_hooks(self, self._trace_hooks, ERROR, exc)
+                raise
 
             # return it, if it matches
             if msg and (already_filtered or self._matches_filters(msg)):
-                LOG.log(self.RECV_LOGGING_LEVEL, "Received: %s", msg)
+                if self._trace_hooks.rx or GLOBAL_HOOKS.rx:
+                    call_hooks(self, self._trace_hooks, RX, msg)
+                duration = time() - start
+                statistics.rx_frames += 1
+                statistics.rx_bytes += msg.dlc
+                statistics.recv_time += duration
+                if duration > statistics.recv_time_max:
+                    statistics.recv_time_max = duration
+                if msg.is_error_frame:
+                    statistics.error_frames += 1
                 return msg
 
+            if msg:
+                statistics.filtered += 1
+
             # if not, and timeout is None, try indefinitely
-            elif timeout is None:
+            if timeout is None:
                 continue
 
             # try next one only if there still is time, and with
@@ -106,6 +291,118 @@ class BusABC(metaclass=ABCMeta):
                 else:
                     return None
 
+    def recv_batch(
+        self, max_messages: int = 100, timeout: Optional[float] = None
+    ) -> List[Message]:
+        """Block waiting for messages from the Bus and return all that are
+        available at once.
+
+        This waits for the first message like :meth:`recv`, and then also
+        returns the messages that are already queued behind it, without
+        waiting any further. Interfaces that can fetch many messages from
+        the driver in one go (like :doc:`interfaces/kvaser`) do so with
+        considerably less overhead per message than repeated calls to
+        :meth:`recv`. The :class:`~can.Notifier` uses this method.
+
+        :param max_messages:
+            The maximum number of messages to return.
+        :param timeout:
+            seconds to wait for the first message or None to wait indefinitely
+
+        :return:
+            The received messages in order, or an empty list on timeout.
+        :raises can.CanError:
+            if an error occurred while reading
+        """
+        if type(self).recv is not BusABC.recv:
+            # a legacy interface which implements recv() instead of _recv_internal()
+            msgs = []
+            msg = self.recv(timeout)
+            while msg is not None:
+                msgs.append(msg)
+                if len(msgs) >= max_messages:
+                    break
+                msg = self.recv(0)
+            return msgs
+
+        start = time()
+        time_left = timeout
+        statistics = self._statistics
+        statistics.recv_calls += 1
+
+        while True:
+
+            try:
+                msgs, already_filtered = self._recv_batch_internal(
+                    max_messages, time_left
+                )
+            except Exception as exc:
+                if self._trace_hooks.error or GLOBAL_HOOKS.error:
+                    call_hooks(self, self._trace_hooks, ERROR, exc)
+                raise
+
+            if msgs and not already_filtered:
+                received = len(msgs)
+                msgs = [msg for msg in msgs if self._matches_filters(msg)]
+                statistics.filtered += received - len(msgs)
+
+            if msgs:
+                duration = time() - start
+                statistics.recv_time += duration
+                if duration > statistics.recv_time_max:
+                    statistics.recv_time_max = duration
+                statistics.rx_frames += len(msgs)
+                tracing = self._trace_hooks.rx or GLOBAL_HOOKS.rx
+                for msg in msgs:
+                    statistics.rx_bytes += msg.dlc
+                    if msg.is_error_frame:
+                        statistics.error_frames += 1
+                    if tracing:
+                        call_hooks(self, self._trace_hooks, RX, msg)
+                return msgs
+
+            # if nothing matched, and timeout is None, try indefinitely
+            if timeout is None:
+                continue
+
+            time_left = timeout - (time() - start)
+            if time_left <= 0:
+                return []
+
+    def _recv_batch_internal(
+        self, max_messages: int, timeout: Optional[float]
+    ) -> Tuple[List[Message], bool]:
+        """
+        Read up to *max_messages* messages from the bus, waiting only for the
+        first one, and tell whether they were filtered.
+        This method may be called by :meth:`~can.BusABC.recv_batch`
+        repeatedly, like :meth:`~can.BusABC._recv_internal`.
+
+        The default implementation calls :meth:`~can.BusABC._recv_internal`
+        once with the timeout and then with a timeout of zero until no more
+        messages are queued. Interfaces which can read many messages from
+        the driver at once override this method.
+
+        :param max_messages: the maximum number of messages to return
+        :param float timeout: seconds to wait for the first message,
+                              see :meth:`~can.BusABC.recv_batch`
+
+        :return:
+            1.  the messages that were read, an empty list on timeout
+            2.  a bool that is True if message filtering has already
+                been done and else False
+        """
+        msg, already_filtered = self._recv_internal(timeout=timeout)
+        if msg is None:
+            return [], already_filtered
+        msgs = [msg]
+        while len(msgs) < max_messages:
+            msg, _ = self._recv_internal(timeout=0.0)
+            if msg is None:
+                break
+            msgs.append(msg)
+        return msgs, already_filtered
+
     def _recv_internal(
         self, timeout: Optional[float]
     ) -> Tuple[Optional[Message], bool]:
@@ -170,6 +467,108 @@ class BusABC(metaclass=ABCMeta):
         """
         raise NotImplementedError("Trying to write to a readonly bus?")
 
+    def send_batch(
+        self, msgs: Iterable[Message], timeout: Optional[float] = None
+    ) -> int:
+        """Transmit several messages to the CAN bus in one call.
+
+        The default implementation simply calls :meth:`~can.BusABC.send`
+        for every message. Interfaces which can hand many frames to the
+        driver at once override this method to reduce the per message overhead.
+
+        :param msgs: The messages to transmit, in order.
+
+        :param timeout:
+            See :meth:`~can.BusABC.send`. The default implementation applies
+            it to every message individually, optimized implementations
+            may apply it to the whole batch.
+
+        :return:
+            The number of messages that were sent. This may be less than the
+            number of given messages if an implementation ran out of time
+            while waiting for the transmit queue to be ready.
+
+        :raises can.CanError:
+            if a message could not be sent
+        """
+        sent = 0
+        for msg in msgs:
+            self.send(msg, timeout)
+            sent += 1
+        return sent
+
+    def _on_sent(self, msg: Message) -> None:
+        """Update the statistics and call the trace hooks after *msg* was sent.
+
+        This is done automatically for :meth:`send`. Interfaces that send
+        messages without calling it, e.g. in an optimized :meth:`send_batch`,
+        call this method for every message themselves.
+        """
+        statistics = self._statistics
+        statistics.tx_frames += 1
+        statistics.tx_bytes += msg.dlc
+        if self._trace_hooks.tx or GLOBAL_HOOKS.tx:
+            call_hooks(self, self._trace_hooks, TX, msg)
+
+    def _on_send_error(self, exc: Exception) -> None:
+        """Like :meth:`_on_sent`, but for a message that could not be sent."""
+        self._statistics.send_errors += 1
+        if self._trace_hooks.error or GLOBAL_HOOKS.error:
+            call_hooks(self, self._trace_hooks, ERROR, exc)
+
+    def add_trace_hook(self, event: str, hook: TraceHook) -> None:
+        """Call *hook* for every *event* on this bus.
+
+        See :mod:`can.trace` for hooks which are called for all buses.
+
+        :param event:
+            One of :data:`can.trace.RX` (a message was received and passed
+            the filters), :data:`can.trace.TX` (a message was sent) or
+            :data:`can.trace.ERROR` (receiving or sending raised an exception).
+        :param hook:
+            Called as ``hook(bus, event, msg)``, or with the exception instead
+            of the message for :data:`can.trace.ERROR`. Exceptions raised by
+            it are logged and ignored.
+
+        :raises ValueError: if *event* is unknown
+        """
+        self._trace_hooks.add(event, hook)
+
+    def remove_trace_hook(self, event: str, hook: TraceHook) -> None:
+        """Remove a hook added with :meth:`add_trace_hook`.
+
+        :raises ValueError: if *hook* is not registered for *event*
+        """
+        self._trace_hooks.remove(event, hook)
+
+    def prepare(self, msg: Message) -> PreparedMessage:
+        """Encode a message once for repeated transmission with
+        :meth:`send_prepared`.
+
+        Interfaces which encode each message before handing it to the driver
+        override this to store the encoded form, so that sending the same
+        message again and again only costs the actual transmission. The
+        payload can still be changed in place, e.g. to update a counter.
+
+        :param msg: The message to prepare.
+
+        :return: A handle to pass to :meth:`send_prepared`.
+        """
+        return PreparedMessage(msg)
+
+    def send_prepared(
+        self, prepared: PreparedMessage, timeout: Optional[float] = None
+    ) -> None:
+        """Transmit a message that was prepared with :meth:`prepare` on this bus.
+
+        :param prepared: The handle returned by :meth:`prepare`.
+        :param timeout: See :meth:`send`.
+
+        :raises can.CanError:
+            if the message could not be sent
+        """
+        self.send(prepared.message, timeout)
+
     def send_periodic(
         self,
         msgs: Union[Sequence[Message], Message],
@@ -223,6 +622,52 @@ class BusABC(metaclass=ABCMeta):
         if not msgs:
             raise ValueError("Must be at least a list or tuple of length 1")
         task = self._send_periodic_internal(msgs, period, duration)
+        self._track_periodic_task(task, store_task)
+        return task
+
+    def send_periodic_group(
+        self,
+        tasks: Sequence[Tuple[Union[Sequence[Message], Message], float]],
+        duration: Optional[float] = None,
+        store_task: bool = True,
+    ) -> CyclicSendTaskGroup:
+        """Start many periodic transmissions at once, e.g. for a rest-bus
+        simulation.
+
+        Behaves like calling :meth:`send_periodic` for every entry, but
+        interfaces may set up all tasks in a single, cheaper pass.
+        The returned group can be stopped or modified as a whole.
+
+        :param tasks:
+            A sequence of ``(msgs, period)`` tuples, where *msgs* is a message
+            or a sequence of messages with the same arbitration ID, and
+            *period* is the period in seconds between each message.
+        :param duration:
+            Approximate duration in seconds to continue sending the messages
+            of all tasks. If no duration is provided, the tasks will continue
+            indefinitely.
+        :param store_task:
+            If True (the default) the group will be attached to this Bus instance
+            and be stopped by :meth:`stop_all_periodic_tasks`.
+        :return:
+            A started :class:`~can.broadcastmanager.CyclicSendTaskGroup`.
+
+        :raises ValueError:
+            If no tasks or invalid messages are given.
+        """
+        if not tasks:
+            raise ValueError("Must be at least one task")
+        checked_tasks = [
+            (CyclicSendTaskABC._check_and_convert_messages(msgs), period)
+            for msgs, period in tasks
+        ]
+        group = self._send_periodic_group_internal(checked_tasks, duration)
+        self._track_periodic_task(group, store_task)
+        return group
+
+    def _track_periodic_task(
+        self, task: can.broadcastmanager.CyclicTask, store_task: bool
+    ):
         # we wrap the task's stop method to also remove it from the Bus's list of tasks
         original_stop_method = task.stop
 
@@ -239,8 +684,6 @@ class BusABC(metaclass=ABCMeta):
         if store_task:
             self._periodic_tasks.append(task)
 
-        return task
-
     def _send_periodic_internal(
         self,
         msgs: Union[Sequence[Message], Message],
@@ -273,6 +716,37 @@ class BusABC(metaclass=ABCMeta):
         )
         return task
 
+    def _send_periodic_group_internal(
+        self,
+        tasks: Sequence[Tuple[Sequence[Message], float]],
+        duration: Optional[float] = None,
+    ) -> CyclicSendTaskGroup:
+        """Default implementation of setting up many periodic tasks, which
+        starts each of them with :meth:`_send_periodic_internal`.
+
+        Override this method if the backend can set up the tasks more efficiently.
+
+        :param tasks:
+            A sequence of ``(messages, period)`` tuples, already checked and
+            converted to tuples of messages.
+        :param duration:
+            See :meth:`send_periodic_group`.
+        :return:
+            A group of started tasks.
+        """
+        started_tasks = []
+        try:
+            for msgs, period in tasks:
+                started_tasks.append(
+                    self._send_periodic_internal(msgs, period, duration)
+                )
+        except Exception:
+            # do not leave the tasks started so far running untracked
+            for task in started_tasks:
+                task.stop()
+            raise
+        return CyclicSendTaskGroup(started_tasks)
+
     def stop_all_periodic_tasks(self, remove_tasks=True):
         """Stop sending any messages that were started using **bus.send_periodic**.
 
@@ -387,6 +861,30 @@ class BusABC(metaclass=ABCMeta):
         # nothing matched
         return False
 
+    @property
+    def statistics(self) -> BusStatistics:
+        """The counters of this bus, see :class:`BusStatistics`.
+
+        The counters of the driver in :attr:`BusStatistics.driver` are
+        read from the interface on every access, the others are always up to
+        date. Use like so:
+
+        >>> stats = bus.statistics
+        >>> print(stats.rx_frames, stats.tx_frames, stats.filtered)
+        """
+        self._statistics.driver = self._get_driver_statistics()
+        return self._statistics
+
+    def _get_driver_statistics(self) -> Dict[str, Any]:
+        """Read the counters of the hardware, driver or operating system.
+
+        Interfaces that have such counters override this method, the
+        default implementation returns an empty dictionary.
+
+        :return: counter name => value
+        """
+        return {}
+
     def flush_tx_buffer(self):
         """Discard every message that may be queued in the output buffer(s)."""
 
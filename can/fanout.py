@@ -0,0 +1,292 @@
+"""
+Distributes the messages of one bus to several processes through shared
+memory.
+
+A :class:`CaptureProcess` reads the bus and writes the messages into a
+:class:`SharedRingBuffer`. Every worker process reads them with its own
+:class:`RingBufferBus`, which can be used like any other bus, e.g. with a
+:class:`~can.Notifier`. A worker that falls behind by more than the size of
+the ring loses the oldest messages, it never slows down the capture or the
+other workers.
+
+.. code-block:: python
+
+    import multiprocessing
+    import can
+
+    def analyse(ring):
+        with can.RingBufferBus(ring) as bus:
+            for msg in bus:
+                ...
+
+    if __name__ == "__main__":
+        ring = can.SharedRingBuffer()
+        capture = can.CaptureProcess(ring, interface="socketcan", channel="can0")
+        capture.start()
+        for _ in range(4):
+            multiprocessing.Process(target=analyse, args=(ring,)).start()
+"""
+
+import logging
+import multiprocessing
+import struct
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import can
+from can.bus import BusABC
+from can.message import RECORD_HEADER, Message, _message_from_record
+
+log = logging.getLogger("can.fanout")
+
+#: The size of every slot of the ring in bytes, a message record
+#: (see :meth:`can.Message.to_bytes`) with a channel name of up to 48
+#: bytes fits into it
+SLOT_SIZE = 128
+
+# the header holds the number of written messages, which is only changed by
+# the writer, and the number of waiting readers and whether the writer was
+# closed, which are changed while holding the lock of the condition
+_HEADER_SIZE = 64
+_WRITTEN = struct.Struct("<Q")
+_WAITING = struct.Struct("<q")
+_WAITING_OFFSET = 8
+_CLOSED_OFFSET = 16
+
+
+class SharedRingBuffer:
+    """A ring buffer of messages in shared memory, with one writer and any
+    number of readers.
+
+    Like a :class:`multiprocessing.Queue`, it is passed to the processes
+    using it as argument when they are created. The messages are written
+    into slots of :data:`SLOT_SIZE` bytes, readers check that the slots they
+    copied were not overwritten in the meantime, so no lock is needed for
+    reading and writing. Readers which wait for messages are woken up once
+    per written batch.
+    """
+
+    def __init__(self, slots: int = 65536) -> None:
+        """
+        :param slots:
+            The number of messages the ring holds, a reader which falls behind
+            by more than this loses messages. Uses *slots* times
+            :data:`SLOT_SIZE` bytes of shared memory. The slot the writer
+            is writing to can not be read, so at least two are needed.
+        """
+        if slots < 2:
+            raise ValueError("The ring needs at least two slots")
+        self.slots = slots
+        self._memory = multiprocessing.RawArray("B", _HEADER_SIZE + slots * SLOT_SIZE)
+        self._condition = multiprocessing.Condition()
+        self._view = memoryview(self._memory).cast("B")
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_view"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._view = memoryview(self._memory).cast("B")
+
+    @property
+    def written(self) -> int:
+        """The number of messages written so far."""
+        return _WRITTEN.unpack_from(self._view)[0]
+
+    @property
+    def closed(self) -> bool:
+        """True if the writer was closed, no more messages will follow."""
+        return bool(self._view[_CLOSED_OFFSET])
+
+    def write(self, msgs: Iterable[Message]) -> None:
+        """Write messages, overwriting the oldest ones, and wake up the readers.
+
+        Must only be called by one process.
+
+        :raises ValueError: if the record of a message does not fit into a slot
+        :raises TypeError: if the channel of a message can not be serialized
+        """
+        view = self._view
+        slots = self.slots
+        written = self.written
+        for msg in msgs:
+            record = msg.to_bytes()
+            if len(record) > SLOT_SIZE:
+                raise ValueError("The channel name is too long for the ring")
+            offset = _HEADER_SIZE + (written % slots) * SLOT_SIZE
+            view[offset : offset + len(record)] = record
+            # publish every message, so readers can tell which slot is being
+            # overwritten right now
+            written += 1
+            _WRITTEN.pack_into(view, 0, written)
+        if _WAITING.unpack_from(view, _WAITING_OFFSET)[0]:
+            with self._condition:
+                self._condition.notify_all()
+
+    def close(self) -> None:
+        """Tell the readers that no more messages will be written."""
+        with self._condition:
+            self._view[_CLOSED_OFFSET] = 1
+            self._condition.notify_all()
+
+    def read(self, position: int, max_messages: int) -> Tuple[List[Message], int]:
+        """Read the messages from *position* on, without waiting.
+
+        :param position: The number of the first message to read.
+        :param max_messages: The maximum number of messages to read.
+        :return:
+            The messages and the position after them. If messages were
+            overwritten before they could be read, the position skips them.
+        """
+        view = self._view
+        slots = self.slots
+        written = self.written
+        # the slot of message "written" may be being overwritten right now
+        position = max(position, written - slots + 1)
+        end = min(written, position + max_messages)
+        if position >= end:
+            return [], position
+
+        # copy at most two contiguous ranges of slots
+        first = position % slots
+        count = end - position
+        start = _HEADER_SIZE + first * SLOT_SIZE
+        if first + count <= slots:
+            copy = bytes(view[start : start + count * SLOT_SIZE])
+        else:
+            copy = bytes(view[start:]) + bytes(
+                view[_HEADER_SIZE : _HEADER_SIZE + (first + count - slots) * SLOT_SIZE]
+            )
+
+        # skip the slots which were overwritten while they were copied
+        valid = max(position, self.written - slots + 1)
+        msgs = []
+        unpack_from = RECORD_HEADER.unpack_from
+        for index in range(valid - position, count):
+            offset = index * SLOT_SIZE
+            header = unpack_from(copy, offset)
+            msgs.append(_message_from_record(header, copy, offset + RECORD_HEADER.size))
+        return msgs, end
+
+    def wait(self, position: int, timeout: Optional[float]) -> bool:
+        """Wait until the message at *position* was written or the ring was
+        closed.
+
+        :return: False on timeout
+        """
+        with self._condition:
+            self._add_waiting(1)
+            try:
+                return self._condition.wait_for(
+                    lambda: self.written > position or self.closed, timeout
+                )
+            finally:
+                self._add_waiting(-1)
+
+    def _add_waiting(self, count: int) -> None:
+        waiting = _WAITING.unpack_from(self._view, _WAITING_OFFSET)[0]
+        _WAITING.pack_into(self._view, _WAITING_OFFSET, waiting + count)
+
+
+class RingBufferBus(BusABC):
+    """Receives the messages written into a :class:`SharedRingBuffer`.
+
+    Every instance reads with its own position and counts the messages it
+    lost, see :attr:`lag`, :attr:`dropped` and :attr:`~can.BusABC.statistics`.
+    Messages can not be sent.
+    """
+
+    def __init__(
+        self, channel: SharedRingBuffer, from_start: bool = False, **kwargs: Any
+    ) -> None:
+        """
+        :param channel: The ring to read from.
+        :param from_start:
+            Start with the oldest message in the ring instead of the next one.
+        """
+        super().__init__(channel=channel, **kwargs)
+        self.ring = channel
+        self.channel_info = f"Shared ring buffer of {channel.slots} messages"
+        written = channel.written
+        self._position = max(written - channel.slots + 1, 0) if from_start else written
+        #: The number of messages which were overwritten before they were read
+        self.dropped = 0
+
+    @property
+    def lag(self) -> int:
+        """The number of messages in the ring which were not read yet."""
+        return min(self.ring.written - self._position, self.ring.slots)
+
+    def _recv_internal(
+        self, timeout: Optional[float]
+    ) -> Tuple[Optional[Message], bool]:
+        msgs, already_filtered = self._recv_batch_internal(1, timeout)
+        return (msgs[0] if msgs else None), already_filtered
+
+    def _recv_batch_internal(
+        self, max_messages: int, timeout: Optional[float]
+    ) -> Tuple[List[Message], bool]:
+        ring = self.ring
+        if ring.written <= self._position:
+            if ring.closed:
+                raise can.CanError("The ring buffer was closed")
+            if not ring.wait(self._position, timeout):
+                return [], False
+
+        position = self._position
+        msgs, self._position = ring.read(position, max_messages)
+        self.dropped += self._position - position - len(msgs)
+        return msgs, False
+
+    def send(self, msg: Message, timeout: Optional[float] = None) -> None:
+        raise can.CanError("Messages can not be sent to a ring buffer")
+
+    def _get_driver_statistics(self) -> Dict[str, Any]:
+        return {"lag": self.lag, "dropped": self.dropped}
+
+
+class CaptureProcess(multiprocessing.Process):
+    """Reads a bus in a separate process and writes the messages into a
+    :class:`SharedRingBuffer`.
+
+    The ring is closed when the process ends, also if opening or reading
+    the bus failed.
+    """
+
+    def __init__(
+        self, ring: SharedRingBuffer, max_batch_size: int = 100, **config: Any
+    ) -> None:
+        """
+        :param ring: The ring to write to.
+        :param max_batch_size:
+            The maximum number of messages read and written at once.
+        :param config:
+            The arguments of :class:`can.Bus`, like *interface* and *channel*.
+        """
+        super().__init__(name="can.fanout capture", daemon=True)
+        self.ring = ring
+        self.max_batch_size = max_batch_size
+        self.config = config
+        self._stop_event = multiprocessing.Event()
+
+    def run(self) -> None:
+        try:
+            with can.Bus(**self.config) as bus:
+                while not self._stop_event.is_set():
+                    msgs = bus.recv_batch(self.max_batch_size, 0.1)
+                    if msgs:
+                        self.ring.write(msgs)
+        except Exception:
+            log.exception("Capturing messages failed")
+            raise
+        finally:
+            self.ring.close()
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """Stop capturing and wait for the process to end.
+
+        :param timeout: The maximum time in seconds to wait for the process.
+        """
+        self._stop_event.set()
+        self.join(timeout)
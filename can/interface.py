@@ -9,7 +9,7 @@ import logging
 
 from .bus import BusABC
 from .util import load_config
-from .interfaces import BACKENDS
+from .interfaces import BACKENDS, _load_entry_points
 
 log = logging.getLogger("can.interface")
 log_autodetect = log.getChild("detect_available_configs")
@@ -26,6 +26,9 @@ def _get_class_for_interface(interface):
                         interface or the bus class within that
     """
     # Find the correct backend
+    if interface not in BACKENDS:
+        # it might be provided by another package
+        _load_entry_points()
     try:
         module_name, class_name = BACKENDS[interface]
     except KeyError:
@@ -136,6 +139,7 @@ def detect_available_configs(interfaces=None):
 
     # Figure out where to search
     if interfaces is None:
+        _load_entry_points()
         interfaces = BACKENDS
     elif isinstance(interfaces, str):
         interfaces = (interfaces,)
@@ -2,12 +2,12 @@
 Interfaces contain low level implementations that interact with CAN hardware.
 """
 
-import warnings
-from pkg_resources import iter_entry_points
+import sys
+from typing import Dict, Tuple
 
 
 # interface_name => (module, classname)
-BACKENDS = {
+BACKENDS: Dict[str, Tuple[str, str]] = {
     "kvaser": ("can.interfaces.kvaser", "KvaserBus"),
     "socketcan": ("can.interfaces.socketcan", "SocketcanBus"),
     "serial": ("can.interfaces.serial.serial_can", "SerialBus"),
@@ -26,13 +26,46 @@ BACKENDS = {
     "systec": ("can.interfaces.systec", "UcanBus"),
     "seeedstudio": ("can.interfaces.seeedstudio", "SeeedBus"),
     "cantact": ("can.interfaces.cantact", "CantactBus"),
+    "udp_bridge": ("can.interfaces.udp_bridge", "UdpBridgeBus"),
+    "socketcand": ("can.interfaces.socketcand", "SocketcandBus"),
 }
 
-BACKENDS.update(
-    {
-        interface.name: (interface.module_name, interface.attrs[0])
-        for interface in iter_entry_points("can.interface")
-    }
-)
+_entry_points_loaded = False
 
-VALID_INTERFACES = frozenset(list(BACKENDS.keys()))
+
+def _load_entry_points() -> None:
+    """Add the interfaces other packages provide via the ``can.interface``
+    entry point group to :data:`BACKENDS`.
+
+    Searching the installed packages is slow, so this is only done once, and
+    only when an interface is requested that is not built in.
+    """
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+
+    from can.util import _get_entry_points
+
+    BACKENDS.update(
+        {
+            interface.name: (interface.module_name, interface.attribute)
+            for interface in _get_entry_points("can.interface")
+        }
+    )
+    _entry_points_loaded = True
+
+
+def __getattr__(name: str) -> object:
+    # VALID_INTERFACES includes the interfaces of other packages,
+    # thus it is only built when it is accessed for the first time
+    if name == "VALID_INTERFACES":
+        _load_entry_points()
+        globals()[name] = frozenset(BACKENDS)
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if sys.version_info < (3, 7):
+    # module level __getattr__ is not supported (PEP 562)
+    _load_entry_points()
+    VALID_INTERFACES = frozenset(BACKENDS)
@@ -1,4 +1,6 @@
+from collections import deque
 from ctypes import *
+from itertools import groupby
 import logging
 import platform
 from can import BusABC, Message
@@ -37,6 +39,9 @@ VCI_USBCAN2 = 4
 STATUS_OK = 0x01
 STATUS_ERR = 0x00
 
+#: The number of frames read with one VCI_Receive call, as recommended by the vendor
+RECEIVE_BUFFER_SIZE = 2500
+
 TIMING_DICT = {
     5000: (0xBF, 0xFF),
     10000: (0x31, 0x1C),
@@ -116,6 +121,11 @@ class CANalystIIBus(BusABC):
 
         self.init_config = VCI_INIT_CONFIG(0, 0xFFFFFFFF, 0, 1, Timing0, Timing1, 0)
 
+        # VCI_Receive fills this array, the converted frames are kept in the
+        # queue until they are returned
+        self._rx_objects = (VCI_CAN_OBJ * RECEIVE_BUFFER_SIZE)()
+        self._rx_queue = deque()
+
         if CANalystII.VCI_OpenDevice(VCI_USBCAN2, self.device, 0) == STATUS_ERR:
             logger.error("VCI_OpenDevice Error")
 
@@ -133,6 +143,25 @@ class CANalystIIBus(BusABC):
                 self.shutdown()
                 return
 
+    def _get_channel(self, msg):
+        if msg.channel is not None:
+            return msg.channel
+        elif len(self.channels) == 1:
+            return self.channels[0]
+        else:
+            raise ValueError("msg.channel must be set when using multiple channels.")
+
+    @staticmethod
+    def _fill_can_obj(raw_message, msg):
+        raw_message.ID = msg.arbitration_id
+        raw_message.TimeStamp = 0
+        raw_message.TimeFlag = 0
+        raw_message.SendType = 1
+        raw_message.RemoteFlag = msg.is_remote_frame
+        raw_message.ExternFlag = 1 if msg.is_extended_id else 0
+        raw_message.DataLen = msg.dlc
+        raw_message.Data = (c_ubyte * 8)(*msg.data)
+
     def send(self, msg, timeout=None):
         """
 
@@ -140,57 +169,81 @@ class CANalystIIBus(BusABC):
         :param timeout: timeout is not used here
         :return:
         """
-        extern_flag = 1 if msg.is_extended_id else 0
-        raw_message = VCI_CAN_OBJ(
-            msg.arbitration_id,
-            0,
-            0,
-            1,
-            msg.is_remote_frame,
-            extern_flag,
-            msg.dlc,
-            (c_ubyte * 8)(*msg.data),
-            (c_byte * 3)(*[0, 0, 0]),
-        )
-
-        if msg.channel is not None:
-            channel = msg.channel
-        elif len(self.channels) == 1:
-            channel = self.channels[0]
-        else:
-            raise ValueError("msg.channel must be set when using multiple channels.")
+        raw_message = VCI_CAN_OBJ()
+        self._fill_can_obj(raw_message, msg)
+        channel = self._get_channel(msg)
 
         CANalystII.VCI_Transmit(
             VCI_USBCAN2, self.device, channel, byref(raw_message), 1
         )
 
+    def send_batch(self, msgs, timeout=None):
+        """Transmit several messages, with one VCI_Transmit call per channel.
+
+        Consecutive messages for the same channel are passed to the driver
+        together.
+
+        :param msgs: The messages to transmit, in order.
+        :param timeout: timeout is not used here
+        :return: The number of messages that were sent.
+        """
+        sent = 0
+        for channel, group in groupby(msgs, key=self._get_channel):
+            group = list(group)
+            raw_messages = (VCI_CAN_OBJ * len(group))()
+            for raw_message, msg in zip(raw_messages, group):
+                self._fill_can_obj(raw_message, msg)
+
+            count = CANalystII.VCI_Transmit(
+                VCI_USBCAN2, self.device, channel, raw_messages, len(group)
+            )
+            for msg in group[: max(count, 0)]:
+                self._on_sent(msg)
+            sent += max(count, 0)
+            if count < len(group):
+                break
+        return sent
+
     def _recv_internal(self, timeout=None):
         """
 
         :param timeout: float in seconds
         :return:
         """
-        raw_message = VCI_CAN_OBJ()
-
-        timeout = -1 if timeout is None else int(timeout * 1000)
-
-        status = CANalystII.VCI_Receive(
-            VCI_USBCAN2, self.device, self.channels[0], byref(raw_message), 1, timeout
-        )
-        if status <= STATUS_ERR:
-            return None, False
-        else:
-            return (
-                Message(
-                    timestamp=raw_message.TimeStamp if raw_message.TimeFlag else 0.0,
-                    arbitration_id=raw_message.ID,
-                    is_remote_frame=raw_message.RemoteFlag,
-                    channel=0,
-                    dlc=raw_message.DataLen,
-                    data=raw_message.Data,
-                ),
-                False,
+        msgs, filtered = self._recv_batch_internal(1, timeout)
+        return (msgs[0] if msgs else None), filtered
+
+    def _recv_batch_internal(self, max_messages, timeout):
+        rx_queue = self._rx_queue
+        if not rx_queue:
+            timeout = -1 if timeout is None else int(timeout * 1000)
+
+            # VCI_Receive returns the number of frames it copied to the array
+            count = CANalystII.VCI_Receive(
+                VCI_USBCAN2,
+                self.device,
+                self.channels[0],
+                self._rx_objects,
+                RECEIVE_BUFFER_SIZE,
+                timeout,
             )
+            if count <= STATUS_ERR:
+                return [], False
+            rx_queue.extend(map(self._message_from_can_obj, self._rx_objects[:count]))
+
+        count = min(max_messages, len(rx_queue))
+        return [rx_queue.popleft() for _ in range(count)], False
+
+    @staticmethod
+    def _message_from_can_obj(raw_message):
+        return Message(
+            timestamp=raw_message.TimeStamp if raw_message.TimeFlag else 0.0,
+            arbitration_id=raw_message.ID,
+            is_remote_frame=raw_message.RemoteFlag,
+            channel=0,
+            dlc=raw_message.DataLen,
+            data=raw_message.Data,
+        )
 
     def flush_tx_buffer(self):
         for channel in self.channels:
@@ -11,9 +11,9 @@ Implementation references:
 import logging
 import os
 import tempfile
-from collections import deque, defaultdict
+from collections import deque
 from itertools import cycle
-from threading import Event
+from threading import Condition
 
 from can import Message, CanError, BusABC
 
@@ -150,6 +150,7 @@ class NeoViBus(BusABC):
             # Assume comma separated string of channels
             self.channels = [ch.strip() for ch in channel.split(",")]
         self.channels = [NeoViBus.channel_to_netid(ch) for ch in self.channels]
+        self._channel_set = frozenset(self.channels)
 
         type_filter = kwargs.get("type_filter")
         serial = kwargs.get("serial")
@@ -187,8 +188,16 @@ class NeoViBus(BusABC):
         )
         logger.info("Using device: {}".format(self.channel_info))
 
+        #: Received messages which were not returned yet
         self.rx_buffer = deque()
-        self.message_receipts = defaultdict(Event)
+        # The receipts of sent messages are only tracked while a call of
+        # send() waits for them. _pending_receipts holds the keys send() waits
+        # for, _received_receipts the keys which were received since, both are
+        # changed while holding _receipt_condition. The receive path checks
+        # _pending_receipts without the lock first and again while holding it.
+        self._receipt_condition = Condition()
+        self._pending_receipts = set()
+        self._received_receipts = set()
 
     @staticmethod
     def channel_to_netid(channel_name_or_id):
@@ -271,22 +280,38 @@ class NeoViBus(BusABC):
             messages, errors = ics.get_messages(self.dev, False, timeout)
         except ics.RuntimeError:
             return
+        channels = self._channel_set
+        pending_receipts = self._pending_receipts
+        receive_own_messages = self._receive_own_messages
+        tx_flag = ics.SPY_STATUS_TX_MSG
+        error_flag = ics.SPY_STATUS_GLOBAL_ERR
+        received_receipts = []
+        rx_messages = []
         for ics_msg in messages:
-            if ics_msg.NetworkID not in self.channels:
+            if ics_msg.NetworkID not in channels:
                 continue
 
-            is_tx = bool(ics_msg.StatusBitField & ics.SPY_STATUS_TX_MSG)
-
-            if is_tx:
-                if bool(ics_msg.StatusBitField & ics.SPY_STATUS_GLOBAL_ERR):
+            if ics_msg.StatusBitField & tx_flag:
+                if ics_msg.StatusBitField & error_flag:
                     continue
-                if ics_msg.DescriptionID:
+                if ics_msg.DescriptionID and pending_receipts:
                     receipt_key = (ics_msg.ArbIDOrHeader, ics_msg.DescriptionID)
-                    self.message_receipts[receipt_key].set()
-                if not self._receive_own_messages:
+                    if receipt_key in pending_receipts:
+                        received_receipts.append(receipt_key)
+                if not receive_own_messages:
                     continue
 
-            self.rx_buffer.append(ics_msg)
+            rx_messages.append(self._ics_msg_to_message(ics_msg))
+        self.rx_buffer.extend(rx_messages)
+
+        if received_receipts:
+            with self._receipt_condition:
+                # the waiter may have timed out in the meantime
+                self._received_receipts.update(
+                    key for key in received_receipts if key in pending_receipts
+                )
+                self._receipt_condition.notify_all()
+
         if errors:
             logger.warning("%d error(s) found", errors)
 
@@ -356,14 +381,15 @@ class NeoViBus(BusABC):
             )
 
     def _recv_internal(self, timeout=0.1):
-        if not self.rx_buffer:
+        msgs, filtered = self._recv_batch_internal(1, timeout)
+        return (msgs[0] if msgs else None), filtered
+
+    def _recv_batch_internal(self, max_messages, timeout=0.1):
+        rx_buffer = self.rx_buffer
+        if not rx_buffer:
             self._process_msg_queue(timeout=timeout)
-        try:
-            ics_msg = self.rx_buffer.popleft()
-            msg = self._ics_msg_to_message(ics_msg)
-        except IndexError:
-            return None, False
-        return msg, False
+        count = min(max_messages, len(rx_buffer))
+        return [rx_buffer.popleft() for _ in range(count)], False
 
     def send(self, msg, timeout=0):
         """Transmit a message to the CAN bus.
@@ -418,15 +444,29 @@ class NeoViBus(BusABC):
         receipt_key = (msg.arbitration_id, msg_desc_id)
 
         if timeout != 0:
-            self.message_receipts[receipt_key].clear()
+            with self._receipt_condition:
+                self._pending_receipts.add(receipt_key)
 
         try:
             ics.transmit_messages(self.dev, message)
         except ics.RuntimeError:
+            with self._receipt_condition:
+                self._pending_receipts.discard(receipt_key)
             raise ICSApiError(*ics.get_last_api_error(self.dev))
 
         # If timeout is set, wait for ACK
         # This requires a notifier for the bus or
         # some other thread calling recv periodically
-        if timeout != 0 and not self.message_receipts[receipt_key].wait(timeout):
+        if timeout != 0 and not self._wait_for_receipt(receipt_key, timeout):
             raise CanError("Transmit timeout")
+
+    def _wait_for_receipt(self, receipt_key, timeout):
+        received_receipts = self._received_receipts
+        with self._receipt_condition:
+            try:
+                return self._receipt_condition.wait_for(
+                    lambda: receipt_key in received_receipts, timeout
+                )
+            finally:
+                self._pending_receipts.discard(receipt_key)
+                received_receipts.discard(receipt_key)
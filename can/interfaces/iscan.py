@@ -7,6 +7,7 @@ import time
 import logging
 
 from can import CanError, BusABC, Message
+from can.interfaces.poller import DriverPoller
 
 logger = logging.getLogger(__name__)
 
@@ -69,7 +70,9 @@ class IscanBus(BusABC):
         :param int bitrate:
             Bitrate in bits/s
         :param float poll_interval:
-            Poll interval in seconds when reading messages
+            The longest interval in seconds between two polls of the driver
+            while no messages are received. The interval is shorter while
+            messages are received.
         """
         if iscan is None:
             raise ImportError("Could not load isCAN driver")
@@ -83,14 +86,22 @@ class IscanBus(BusABC):
 
         self.poll_interval = poll_interval
         iscan.isCAN_DeviceInitEx(self.channel, self.BAUDRATES[bitrate])
+        self._raw_msg = MessageExStruct()
 
         super().__init__(
             channel=channel, bitrate=bitrate, poll_interval=poll_interval, **kwargs
         )
 
-    def _recv_internal(self, timeout):
-        raw_msg = MessageExStruct()
-        end_time = time.time() + timeout if timeout is not None else None
+        self._poller = DriverPoller(
+            self._read_messages,
+            name="can.iscan receiver {}".format(channel),
+            max_interval=poll_interval,
+        )
+
+    def _read_messages(self, timeout):
+        # called by the poller thread, reads until the driver queue is empty
+        raw_msg = self._raw_msg
+        msgs = []
         while True:
             try:
                 iscan.isCAN_ReceiveMessageEx(self.channel, ctypes.byref(raw_msg))
@@ -98,25 +109,27 @@ class IscanBus(BusABC):
                 if e.error_code != 8:
                     # An error occurred
                     raise
-                if end_time is not None and time.time() > end_time:
-                    # No message within timeout
-                    return None, False
-                # Sleep a short time to avoid hammering
-                time.sleep(self.poll_interval)
-            else:
-                # A message was received
-                break
-
-        msg = Message(
-            arbitration_id=raw_msg.message_id,
-            is_extended_id=bool(raw_msg.is_extended),
-            timestamp=time.time(),  # Better than nothing...
-            is_remote_frame=bool(raw_msg.remote_req),
-            dlc=raw_msg.data_len,
-            data=raw_msg.data[: raw_msg.data_len],
-            channel=self.channel.value,
-        )
-        return msg, False
+                # No more messages
+                return msgs
+
+            msgs.append(
+                Message(
+                    arbitration_id=raw_msg.message_id,
+                    is_extended_id=bool(raw_msg.is_extended),
+                    timestamp=time.time(),  # Better than nothing...
+                    is_remote_frame=bool(raw_msg.remote_req),
+                    dlc=raw_msg.data_len,
+                    data=raw_msg.data[: raw_msg.data_len],
+                    channel=self.channel.value,
+                )
+            )
+
+    def _recv_internal(self, timeout):
+        msgs = self._poller.get(1, timeout)
+        return (msgs[0] if msgs else None), False
+
+    def _recv_batch_internal(self, max_messages, timeout):
+        return self._poller.get(max_messages, timeout), False
 
     def send(self, msg, timeout=None):
         raw_msg = MessageExStruct(
@@ -128,7 +141,16 @@ class IscanBus(BusABC):
         )
         iscan.isCAN_TransmitMessageEx(self.channel, ctypes.byref(raw_msg))
 
+    def fileno(self):
+        """A file descriptor which is readable while received messages are queued."""
+        return self._poller.fileno()
+
+    def _get_driver_statistics(self):
+        """Report the received messages dropped because nobody fetched them."""
+        return {"dropped": self._poller.dropped}
+
     def shutdown(self):
+        self._poller.stop()
         iscan.isCAN_CloseDevice(self.channel)
 
 
@@ -17,6 +17,7 @@ import logging
 import sys
 
 from can import BusABC, Message
+from can.trace import ERROR, GLOBAL_HOOKS, call_hooks
 from can.broadcastmanager import (
     LimitedDurationCyclicSendTaskABC,
     RestartableCyclicTaskABC,
@@ -41,6 +42,9 @@ from time import perf_counter as _timer_function
 # Hack to have vciFormatError as a free function, see below
 vciFormatError = None
 
+# Whether the library supports reading several messages with one call
+HAS_READ_MULTIPLE = False
+
 # main ctypes instance
 _canlib = None
 if sys.platform == "win32":
@@ -331,6 +335,24 @@ try:
         (HANDLE, ctypes.c_uint32),
         __check_status,
     )
+    # canChannelReadMultipleMessages is missing in older versions of the library
+    try:
+        # HRESULT VCIAPI canChannelReadMultipleMessages( IN HANDLE hCanChn, IN UINT32 dwMsTimeout, IN OUT PUINT32 pdwNum, OUT PCANMSG paMessages );
+        _canlib.map_symbol(
+            "canChannelReadMultipleMessages",
+            ctypes.c_long,
+            (
+                HANDLE,
+                ctypes.c_uint32,
+                ctypes.POINTER(ctypes.c_uint32),
+                structures.PCANMSG,
+            ),
+            __check_status,
+        )
+    except ImportError as e:
+        log.info("Reading single messages only: %s", e)
+    else:
+        HAS_READ_MULTIPLE = True
     _canlib.vciInitialize()
 except AttributeError:
     # In case _canlib == None meaning we're not on win32/no lib found
@@ -354,6 +376,16 @@ CAN_ERROR_MESSAGES = {
     constants.CAN_ERROR_CRC: "CAN CRC error",
     constants.CAN_ERROR_OTHER: "Other (unknown) CAN error",
 }
+
+# Driver statistics counting the error messages of each type
+CAN_ERROR_COUNTERS = {
+    constants.CAN_ERROR_STUFF: "stuff_errors",
+    constants.CAN_ERROR_FORM: "form_errors",
+    constants.CAN_ERROR_ACK: "ack_errors",
+    constants.CAN_ERROR_BIT: "bit_errors",
+    constants.CAN_ERROR_CRC: "crc_errors",
+    constants.CAN_ERROR_OTHER: "other_errors",
+}
 # ----------------------------------------------------------------------------
 
 
@@ -443,7 +475,20 @@ class IXXATBus(BusABC):
         self._channel_handle = HANDLE()
         self._channel_capabilities = structures.CANCAPABILITIES()
         self._message = structures.CANMSG()
+        self._messages = (structures.CANMSG * rxFifoSize)()
+        self._message_count = ctypes.c_uint32()
         self._payload = (ctypes.c_byte * 8)()
+        self._driver_statistics = dict.fromkeys(
+            (
+                "info_messages",
+                "error_messages",
+                *CAN_ERROR_COUNTERS.values(),
+                "overruns",
+                "timer_overruns",
+                "other_messages",
+            ),
+            0,
+        )
 
         # Search for supplied device
         if UniqueHardwareId is None:
@@ -583,8 +628,6 @@ class IXXATBus(BusABC):
 
     def _recv_internal(self, timeout):
         """ Read a message from IXXAT device. """
-
-        # TODO: handling CAN error messages?
         data_received = False
 
         if timeout == 0:
@@ -598,6 +641,8 @@ class IXXATBus(BusABC):
             else:
                 if self._message.uMsgInfo.Bits.type == constants.CAN_MSGTYPE_DATA:
                     data_received = True
+                else:
+                    self._handle_status_message(self._message)
         else:
             # Wait if no message available
             if timeout is None or timeout < 0:
@@ -621,36 +666,7 @@ class IXXATBus(BusABC):
                     if self._message.uMsgInfo.Bits.type == constants.CAN_MSGTYPE_DATA:
                         data_received = True
                         break
-
-                    elif self._message.uMsgInfo.Bits.type == constants.CAN_MSGTYPE_INFO:
-                        log.info(
-                            CAN_INFO_MESSAGES.get(
-                                self._message.abData[0],
-                                "Unknown CAN info message code {}".format(
-                                    self._message.abData[0]
-                                ),
-                            )
-                        )
-
-                    elif (
-                        self._message.uMsgInfo.Bits.type == constants.CAN_MSGTYPE_ERROR
-                    ):
-                        log.warning(
-                            CAN_ERROR_MESSAGES.get(
-                                self._message.abData[0],
-                                "Unknown CAN error message code {}".format(
-                                    self._message.abData[0]
-                                ),
-                            )
-                        )
-
-                    elif (
-                        self._message.uMsgInfo.Bits.type
-                        == constants.CAN_MSGTYPE_TIMEOVR
-                    ):
-                        pass
-                    else:
-                        log.warning("Unexpected message info type")
+                    self._handle_status_message(self._message)
 
                 if t0 is not None:
                     remaining_ms = timeout_ms - int((_timer_function() - t0) * 1000)
@@ -661,20 +677,97 @@ class IXXATBus(BusABC):
             # Timed out / can message type is not DATA
             return None, True
 
-        # The _message.dwTime is a 32bit tick value and will overrun,
+        return self._message_from_canmsg(self._message), True
+
+    def _recv_batch_internal(self, max_messages, timeout):
+        """
+        Read all queued messages, up to *max_messages*, into a preallocated
+        array with a single call of ``canChannelReadMultipleMessages``.
+        """
+        if not HAS_READ_MULTIPLE:
+            return super()._recv_batch_internal(max_messages, timeout)
+
+        if timeout is None or timeout < 0:
+            remaining_ms = constants.INFINITE
+            t0 = None
+        else:
+            timeout_ms = int(timeout * 1000)
+            remaining_ms = timeout_ms
+            t0 = _timer_function()
+
+        count = self._message_count
+        while True:
+            count.value = min(max_messages, len(self._messages))
+            try:
+                _canlib.canChannelReadMultipleMessages(
+                    self._channel_handle,
+                    remaining_ms,
+                    ctypes.byref(count),
+                    self._messages,
+                )
+            except (VCITimeout, VCIRxQueueEmptyError):
+                count.value = 0
+
+            msgs = []
+            for message in self._messages[: count.value]:
+                if message.uMsgInfo.Bits.type == constants.CAN_MSGTYPE_DATA:
+                    msgs.append(self._message_from_canmsg(message))
+                else:
+                    self._handle_status_message(message)
+            if msgs:
+                return msgs, True
+
+            if t0 is not None:
+                remaining_ms = timeout_ms - int((_timer_function() - t0) * 1000)
+                if remaining_ms <= 0:
+                    return [], True
+
+    def _message_from_canmsg(self, message):
+        """Convert a received data message."""
+        info = message.uMsgInfo.Bits
+        if info.ovr:
+            self._driver_statistics["overruns"] += 1
+        dlc = info.dlc
+        # The dwTime is a 32bit tick value and will overrun,
         # so expect to see the value restarting from 0
-        rx_msg = Message(
-            timestamp=self._message.dwTime
-            / self._tick_resolution,  # Relative time in s
-            is_remote_frame=bool(self._message.uMsgInfo.Bits.rtr),
-            is_extended_id=bool(self._message.uMsgInfo.Bits.ext),
-            arbitration_id=self._message.dwMsgId,
-            dlc=self._message.uMsgInfo.Bits.dlc,
-            data=self._message.abData[: self._message.uMsgInfo.Bits.dlc],
+        return Message(
+            timestamp=message.dwTime / self._tick_resolution,  # Relative time in s
+            is_remote_frame=bool(info.rtr),
+            is_extended_id=bool(info.ext),
+            arbitration_id=message.dwMsgId,
+            dlc=dlc,
+            data=message.abData[:dlc],
             channel=self.channel,
         )
 
-        return rx_msg, True
+    def _handle_status_message(self, message):
+        """
+        Count a received info, error or timer overrun message in the driver
+        statistics. Error messages are also passed to the
+        :data:`~can.trace.ERROR` trace hooks as a :class:`VCIError`.
+        """
+        msg_type = message.uMsgInfo.Bits.type
+        statistics = self._driver_statistics
+        if msg_type == constants.CAN_MSGTYPE_INFO:
+            statistics["info_messages"] += 1
+        elif msg_type == constants.CAN_MSGTYPE_ERROR:
+            code = message.abData[0]
+            statistics["error_messages"] += 1
+            statistics[CAN_ERROR_COUNTERS.get(code, "other_errors")] += 1
+            if self._trace_hooks.error or GLOBAL_HOOKS.error:
+                error = VCIError(
+                    CAN_ERROR_MESSAGES.get(
+                        code, "Unknown CAN error message code {}".format(code)
+                    )
+                )
+                call_hooks(self, self._trace_hooks, ERROR, error)
+        elif msg_type == constants.CAN_MSGTYPE_TIMEOVR:
+            statistics["timer_overruns"] += 1
+        else:
+            statistics["other_messages"] += 1
+
+    def _get_driver_statistics(self):
+        return dict(self._driver_statistics)
 
     def send(self, msg, timeout=None):
 
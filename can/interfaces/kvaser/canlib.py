@@ -236,6 +236,20 @@ if __canlib is not None:
         errcheck=__check_status_read,
     )
 
+    canRead = __get_canlib_function(
+        "canRead",
+        argtypes=[
+            c_canHandle,
+            ctypes.c_void_p,
+            ctypes.c_void_p,
+            ctypes.c_void_p,
+            ctypes.c_void_p,
+            ctypes.c_void_p,
+        ],
+        restype=canstat.c_canStatus,
+        errcheck=__check_status_read,
+    )
+
     canWrite = __get_canlib_function(
         "canWrite",
         argtypes=[
@@ -498,6 +512,21 @@ class KvaserBus(BusABC):
             log.info(str(exc))
         self._timestamp_offset = time.time() - (timer.value * TIMESTAMP_FACTOR)
 
+        # The received frames are read into these buffers, which are reused
+        # to not allocate new ctypes objects for every message
+        self._rx_arb_id = ctypes.c_long(0)
+        self._rx_data = ctypes.create_string_buffer(64)
+        self._rx_dlc = ctypes.c_uint(0)
+        self._rx_flags = ctypes.c_uint(0)
+        self._rx_timestamp = ctypes.c_ulong(0)
+        self._rx_args = (
+            ctypes.byref(self._rx_arb_id),
+            ctypes.byref(self._rx_data),
+            ctypes.byref(self._rx_dlc),
+            ctypes.byref(self._rx_flags),
+            ctypes.byref(self._rx_timestamp),
+        )
+
         self._is_filtered = False
         super().__init__(channel=channel, can_filters=can_filters, **kwargs)
 
@@ -535,12 +564,6 @@ class KvaserBus(BusABC):
         """
         Read a message from kvaser device and return whether filtering has taken place.
         """
-        arb_id = ctypes.c_long(0)
-        data = ctypes.create_string_buffer(64)
-        dlc = ctypes.c_uint(0)
-        flags = ctypes.c_uint(0)
-        timestamp = ctypes.c_ulong(0)
-
         if timeout is None:
             # Set infinite timeout
             # http://www.kvaser.com/canlib-webhelp/group___c_a_n.html#ga2edd785a87cc16b49ece8969cad71e5b
@@ -549,46 +572,50 @@ class KvaserBus(BusABC):
             timeout = int(timeout * 1000)
 
         # log.log(9, 'Reading for %d ms on handle: %s' % (timeout, self._read_handle))
-        status = canReadWait(
-            self._read_handle,
-            ctypes.byref(arb_id),
-            ctypes.byref(data),
-            ctypes.byref(dlc),
-            ctypes.byref(flags),
-            ctypes.byref(timestamp),
-            timeout,  # This is an X ms blocking read
-        )
+        # This is an X ms blocking read
+        status = canReadWait(self._read_handle, *self._rx_args, timeout)
 
         if status == canstat.canOK:
-            # log.debug('read complete -> status OK')
-            data_array = data.raw
-            flags = flags.value
-            is_extended = bool(flags & canstat.canMSG_EXT)
-            is_remote_frame = bool(flags & canstat.canMSG_RTR)
-            is_error_frame = bool(flags & canstat.canMSG_ERROR_FRAME)
-            is_fd = bool(flags & canstat.canFDMSG_FDF)
-            bitrate_switch = bool(flags & canstat.canFDMSG_BRS)
-            error_state_indicator = bool(flags & canstat.canFDMSG_ESI)
-            msg_timestamp = timestamp.value * TIMESTAMP_FACTOR
-            rx_msg = Message(
-                arbitration_id=arb_id.value,
-                data=data_array[: dlc.value],
-                dlc=dlc.value,
-                is_extended_id=is_extended,
-                is_error_frame=is_error_frame,
-                is_remote_frame=is_remote_frame,
-                is_fd=is_fd,
-                bitrate_switch=bitrate_switch,
-                error_state_indicator=error_state_indicator,
-                channel=self.channel,
-                timestamp=msg_timestamp + self._timestamp_offset,
-            )
-            # log.debug('Got message: %s' % rx_msg)
-            return rx_msg, self._is_filtered
+            return self._get_received_message(), self._is_filtered
         else:
             # log.debug('read complete -> status not okay')
             return None, self._is_filtered
 
+    def _recv_batch_internal(self, max_messages, timeout):
+        """
+        Wait for a message like :meth:`_recv_internal`, then drain the receive
+        queue of the channel with non-blocking reads.
+        """
+        msg, already_filtered = self._recv_internal(timeout)
+        if msg is None:
+            return [], already_filtered
+
+        msgs = [msg]
+        handle = self._read_handle
+        args = self._rx_args
+        while len(msgs) < max_messages and canRead(handle, *args) == canstat.canOK:
+            msgs.append(self._get_received_message())
+        return msgs, already_filtered
+
+    def _get_received_message(self):
+        """Create a message from the receive buffers."""
+        flags = self._rx_flags.value
+        dlc = self._rx_dlc.value
+        return Message(
+            arbitration_id=self._rx_arb_id.value,
+            data=self._rx_data[:dlc],
+            dlc=dlc,
+            is_extended_id=bool(flags & canstat.canMSG_EXT),
+            is_error_frame=bool(flags & canstat.canMSG_ERROR_FRAME),
+            is_remote_frame=bool(flags & canstat.canMSG_RTR),
+            is_fd=bool(flags & canstat.canFDMSG_FDF),
+            bitrate_switch=bool(flags & canstat.canFDMSG_BRS),
+            error_state_indicator=bool(flags & canstat.canFDMSG_ESI),
+            channel=self.channel,
+            timestamp=self._rx_timestamp.value * TIMESTAMP_FACTOR
+            + self._timestamp_offset,
+        )
+
     def send(self, msg, timeout=None):
         # log.debug("Writing a message: {}".format(msg))
         flags = canstat.canMSG_EXT if msg.is_extended_id else canstat.canMSG_STD
@@ -656,6 +683,14 @@ class KvaserBus(BusABC):
         )
         return stats
 
+    def _get_driver_statistics(self):
+        stats = self.get_stats()
+        return {
+            "bus_load": stats.bus_load / 100.0,
+            "overruns": stats.overruns,
+            "error_frames": stats.err_frame,
+        }
+
     @staticmethod
     def _detect_available_configs():
         num_channels = ctypes.c_int(0)
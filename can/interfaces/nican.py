@@ -18,6 +18,7 @@ import logging
 import sys
 
 from can import CanError, BusABC, Message
+from can.interfaces.poller import DriverPoller
 
 logger = logging.getLogger(__name__)
 
@@ -217,6 +218,10 @@ class NicanBus(BusABC):
         self.handle = ctypes.c_ulong()
         nican.ncOpenObject(channel, ctypes.byref(self.handle))
 
+        # only one thread may wait for the state of an object, so all
+        # messages are read by the poller thread
+        self._state = ctypes.c_ulong()
+        self._raw_msg = RxMessageStruct()
         super().__init__(
             channel=channel,
             can_filters=can_filters,
@@ -225,33 +230,37 @@ class NicanBus(BusABC):
             **kwargs
         )
 
-    def _recv_internal(self, timeout):
-        """
-        Read a message from a NI-CAN bus.
-
-        :param float timeout:
-            Max time to wait in seconds or None if infinite
-
-        :raises can.interfaces.nican.NicanError:
-            If reception fails
-        """
-        if timeout is None:
-            timeout = NC_DURATION_INFINITE
-        else:
-            timeout = int(timeout * 1000)
+        self._poller = DriverPoller(
+            self._read_messages,
+            name="can.nican receiver {}".format(self.channel),
+            blocking=True,
+            max_interval=0.1,
+        )
 
-        state = ctypes.c_ulong()
+    def _wait_for_message(self, timeout):
         try:
             nican.ncWaitForState(
-                self.handle, NC_ST_READ_AVAIL, timeout, ctypes.byref(state)
+                self.handle, NC_ST_READ_AVAIL, timeout, ctypes.byref(self._state)
             )
         except NicanError as e:
             if e.error_code == TIMEOUT_ERROR_CODE:
-                return None, True
+                return False
             else:
                 raise
-
-        raw_msg = RxMessageStruct()
+        return True
+
+    def _read_messages(self, timeout):
+        # called by the poller thread, waits for the first message and then
+        # reads until no more messages are available
+        msgs = []
+        wait_time = int(timeout * 1000)
+        while self._wait_for_message(wait_time):
+            msgs.append(self._read_message())
+            wait_time = 0
+        return msgs
+
+    def _read_message(self):
+        raw_msg = self._raw_msg
         nican.ncRead(self.handle, ctypes.sizeof(raw_msg), ctypes.byref(raw_msg))
         # http://stackoverflow.com/questions/6161776/convert-windows-filetime-to-second-in-unix-linux
         timestamp = raw_msg.timestamp / 10000000.0 - 11644473600
@@ -262,7 +271,7 @@ class NicanBus(BusABC):
         if not is_error_frame:
             arb_id &= 0x1FFFFFFF
         dlc = raw_msg.dlc
-        msg = Message(
+        return Message(
             timestamp=timestamp,
             channel=self.channel,
             is_remote_frame=is_remote_frame,
@@ -272,7 +281,30 @@ class NicanBus(BusABC):
             dlc=dlc,
             data=raw_msg.data[:dlc],
         )
-        return msg, True
+
+    def _recv_internal(self, timeout):
+        """
+        Read a message from a NI-CAN bus.
+
+        :param float timeout:
+            Max time to wait in seconds or None if infinite
+
+        :raises can.interfaces.nican.NicanError:
+            If reception fails
+        """
+        msgs = self._poller.get(1, timeout)
+        return (msgs[0] if msgs else None), True
+
+    def _recv_batch_internal(self, max_messages, timeout):
+        return self._poller.get(max_messages, timeout), True
+
+    def fileno(self):
+        """A file descriptor which is readable while received messages are queued."""
+        return self._poller.fileno()
+
+    def _get_driver_statistics(self):
+        """Report the received messages dropped because nobody fetched them."""
+        return {"dropped": self._poller.dropped}
 
     def send(self, msg, timeout=None):
         """
@@ -312,6 +344,7 @@ class NicanBus(BusABC):
 
     def shutdown(self):
         """Close object."""
+        self._poller.stop()
         nican.ncCloseObject(self.handle)
 
 
@@ -7,7 +7,6 @@ import struct
 
 from can.interfaces.nixnet import _cconsts
 from can.interfaces.nixnet import _errors
-from can.interfaces.nixnet._enums import FrameType
 
 from can import Message
 
@@ -109,15 +108,14 @@ def _split_payload_length(payload_length):
     return base_unit_length, payload_unit_length
 
 
-def parse_single_frame(raw_frame):
-    """Create can.Message from raw_frame"""
-    next_pos = nxFrameFixed_t.size
+def _parse_frame(raw_frames, pos):
+    """Create can.Message from the frame at pos, return it and the next position"""
+    next_pos = pos + nxFrameFixed_t.size
 
-    if len(raw_frame) < next_pos:
+    if len(raw_frames) < next_pos:
         _errors.check_for_error(_cconsts.NX_ERR_INTERNAL_ERROR)
 
-    raw_base = raw_frame[:next_pos]
-    base_unit = nxFrameFixed_t.unpack(raw_base)
+    base_unit = nxFrameFixed_t.unpack_from(raw_frames, pos)
     payload_length = _get_frame_payload_length(base_unit)
     base_unit_length, payload_unit_length = _split_payload_length(payload_length)
 
@@ -126,30 +124,51 @@ def parse_single_frame(raw_frame):
     next_pos += _calculate_payload_unit_size(payload_length)
 
     base_unit_payload = base_unit[FRAME_PAYLOAD_INDEX][0:base_unit_length]
-    payload_unit = raw_frame[payload_pos:payload_pad_pos]
+    payload_unit = raw_frames[payload_pos:payload_pad_pos]
     payload = base_unit_payload + payload_unit
 
     _id = base_unit[FRAME_IDENTIFIER_INDEX] & 0x1FFFFFFF
+    frame_type = base_unit[FRAME_TYPE_INDEX]
 
     msg = Message(
         arbitration_id=_id,
         dlc=len(payload),
-        data=list(payload),
+        data=payload,
         timestamp=base_unit[FRAME_TIMESTAMP_INDEX],
         # channel=self.channel_info,
-        is_remote_frame=False,
-        is_error_frame=False,
+        is_remote_frame=frame_type == _cconsts.NX_FRAME_TYPE_CAN_REMOTE,
+        is_error_frame=frame_type == _cconsts.NX_FRAME_TYPE_CAN_BUS_ERROR,
         is_extended_id=bool(base_unit[FRAME_IDENTIFIER_INDEX] > 0x7FF),
     )
 
-    if FrameType(base_unit[FRAME_TYPE_INDEX]) == FrameType.CAN_REMOTE:
-        msg.is_remote_frame = True
-    if FrameType(base_unit[FRAME_TYPE_INDEX]) == FrameType.CAN_BUS_ERROR:
-        msg.is_error_frame = True
+    return msg, next_pos
+
 
+def parse_single_frame(raw_frame):
+    """Create can.Message from raw_frame"""
+    msg, _ = _parse_frame(raw_frame, 0)
     return msg
 
 
+def parse_frames(raw_frames):
+    """Create a can.Message for every frame in raw_frames.
+
+    The frames are unpacked in place, one base unit after the other, without
+    copying the buffer for every frame.
+
+    >>> frame = nxFrameFixed_t.pack(1, 2, 0, 0, 0, 1, 8 * b'\\x01')
+    >>> [msg.arbitration_id for msg in parse_frames(frame + frame)]
+    [2, 2]
+    """
+    frames = []
+    pos = 0
+    end = len(raw_frames)
+    while pos < end:
+        msg, pos = _parse_frame(raw_frames, pos)
+        frames.append(msg)
+    return frames
+
+
 _FRAME_ID_MASK = 0x000007FF
 _EXTENDED_FRAME_ID_MASK = 0x1FFFFFFF
 
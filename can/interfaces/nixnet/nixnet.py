@@ -7,6 +7,8 @@ Enable basic CAN over a NI XNet device.
 
 from __future__ import absolute_import, print_function, division
 
+from collections import deque
+
 from can import BusABC
 from can.bus import BusState
 
@@ -22,6 +24,9 @@ import can.interfaces.nixnet.system as system
 
 from can.interfaces.nixnet._session import base
 
+#: The maximum number of frames read with one nx_read_frame call
+READ_FRAMES = 1000
+
 
 class NiXnetBus(BusABC):
     """A NI XNet Bus."""
@@ -81,6 +86,9 @@ class NiXnetBus(BusABC):
         self.input_session.flush()
         self.output_session.flush()
 
+        # frames that were read from the session but not returned yet
+        self._rx_queue = deque()
+
         super(NiXnetBus, self).__init__(
             channel=channel, state=state, bitrate=bitrate, *args, **kwargs
         )
@@ -124,6 +132,9 @@ class NiXnetBus(BusABC):
         """
         return self.input_session.num_pend
 
+    def _get_driver_statistics(self):
+        return {"rx_pending": self.rx_num_pend, "tx_pending": self.tx_num_pend}
+
     def flush_tx_buffer(self):
         """
         Flush NiXnet TX buffer
@@ -134,21 +145,36 @@ class NiXnetBus(BusABC):
         """
         Read a msg from NIXnet BUS
         """
-        if timeout is None:
-            timeout = constants.Timeouts.TIMEOUT_NONE.value
+        msgs, filtered = self._recv_batch_internal(1, timeout)
+        return (msgs[0] if msgs else None), filtered
 
-        if self.input_session.num_pend:
+    def _recv_batch_internal(self, max_messages, timeout):
+        """
+        Read all pending frames with one nx_read_frame call
+        """
+        rx_queue = self._rx_queue
+        if not rx_queue:
+            if timeout is None:
+                timeout = constants.Timeouts.TIMEOUT_NONE.value
+
+            num_pend = self.input_session.num_pend
+            if not num_pend:
+                # no pending Message
+                return [], True
+
+            # frames with a payload unit are longer than the fixed frame, so
+            # this may read less than all pending frames
             buffer, num = _funcs.nx_read_frame(
-                self.input_session.handle, _frames.nxFrameFixed_t.size, timeout
+                self.input_session.handle,
+                _frames.nxFrameFixed_t.size * min(num_pend, READ_FRAMES),
+                timeout,
             )
+            for frame in _frames.parse_frames(memoryview(buffer)[:num]):
+                frame.channel = self.channel_info
+                rx_queue.append(frame)
 
-            frame = _frames.parse_single_frame(buffer[:num])
-            frame.channel = self.channel_info
-
-            if frame:
-                return frame, True
-        # no pending Message
-        return None, True
+        count = min(max_messages, len(rx_queue))
+        return [rx_queue.popleft() for _ in range(count)], True
 
     def send(self, msg, timeout=constants.Timeouts.TIMEOUT_INFINITE.value):
         if timeout is None:
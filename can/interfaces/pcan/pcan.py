@@ -3,6 +3,8 @@ Enable basic CAN over a PCAN USB device.
 """
 
 import logging
+import platform
+import select
 import time
 
 from typing import Optional
@@ -221,6 +223,7 @@ class PcanBus(BusABC):
         if result != PCAN_ERROR_OK:
             raise PcanError(self._get_formatted_error(result))
 
+        self._recv_fd = None
         if HAS_EVENTS:
             self._recv_event = CreateEvent(None, 0, 0, None)
             result = self.m_objPCANBasic.SetValue(
@@ -228,6 +231,19 @@ class PcanBus(BusABC):
             )
             if result != PCAN_ERROR_OK:
                 raise PcanError(self._get_formatted_error(result))
+        elif platform.system() == "Linux":
+            # PCAN-Basic for Linux provides a file descriptor instead of an
+            # event, which becomes readable when messages were received
+            result, recv_fd = self.m_objPCANBasic.GetValue(
+                self.m_PcanHandle, PCAN_RECEIVE_EVENT
+            )
+            if result == PCAN_ERROR_OK:
+                self._recv_fd = recv_fd
+            else:
+                log.warning(
+                    "Cannot wait for messages, falling back to polling: %s",
+                    self._get_formatted_error(result),
+                )
 
         super().__init__(channel=channel, state=state, bitrate=bitrate, *args, **kwargs)
 
@@ -297,40 +313,71 @@ class PcanBus(BusABC):
         status = self.m_objPCANBasic.Reset(self.m_PcanHandle)
         return status == PCAN_ERROR_OK
 
-    def _recv_internal(self, timeout):
+    def _read(self):
+        if self.fd:
+            return self.m_objPCANBasic.ReadFD(self.m_PcanHandle)
+        return self.m_objPCANBasic.Read(self.m_PcanHandle)
 
+    def _wait_for_messages(self, timeout):
+        """Wait until messages were received or the timeout expired.
+
+        :return: False on timeout
+        """
         if HAS_EVENTS:
-            # We will utilize events for the timeout handling
             timeout_ms = int(timeout * 1000) if timeout is not None else INFINITE
-        elif timeout is not None:
+            return WaitForSingleObject(self._recv_event, timeout_ms) == WAIT_OBJECT_0
+        if self._recv_fd is not None:
+            return bool(select.select([self._recv_fd], [], [], timeout)[0])
+        # Use polling instead
+        time.sleep(0.001)
+        return True
+
+    def _recv_internal(self, timeout):
+        if timeout is not None:
             # Calculate max time
             end_time = time.perf_counter() + timeout
 
         # log.debug("Trying to read a msg")
 
-        result = None
-        while result is None:
-            if self.fd:
-                result = self.m_objPCANBasic.ReadFD(self.m_PcanHandle)
-            else:
-                result = self.m_objPCANBasic.Read(self.m_PcanHandle)
-            if result[0] == PCAN_ERROR_QRCVEMPTY:
-                if HAS_EVENTS:
-                    result = None
-                    val = WaitForSingleObject(self._recv_event, timeout_ms)
-                    if val != WAIT_OBJECT_0:
-                        return None, False
-                elif timeout is not None and time.perf_counter() >= end_time:
+        result = self._read()
+        while result[0] == PCAN_ERROR_QRCVEMPTY:
+            time_left = None
+            if timeout is not None:
+                time_left = end_time - time.perf_counter()
+                if time_left <= 0:
                     return None, False
-                else:
-                    result = None
-                    time.sleep(0.001)
-            elif result[0] & (PCAN_ERROR_BUSLIGHT | PCAN_ERROR_BUSHEAVY):
-                log.warning(self._get_formatted_error(result[0]))
+            if not self._wait_for_messages(time_left):
                 return None, False
-            elif result[0] != PCAN_ERROR_OK:
-                raise PcanError(self._get_formatted_error(result[0]))
+            result = self._read()
+
+        if result[0] & (PCAN_ERROR_BUSLIGHT | PCAN_ERROR_BUSHEAVY):
+            log.warning(self._get_formatted_error(result[0]))
+            return None, False
+        elif result[0] != PCAN_ERROR_OK:
+            raise PcanError(self._get_formatted_error(result[0]))
 
+        return self._message_from_result(result), False
+
+    def _recv_batch_internal(self, max_messages, timeout):
+        """
+        Wait for a message like :meth:`_recv_internal`, then drain the
+        receive queue without waiting any further. Errors reported while
+        draining end the batch and are left to the next call.
+        """
+        msg, _ = self._recv_internal(timeout)
+        if msg is None:
+            return [], False
+
+        msgs = [msg]
+        while len(msgs) < max_messages:
+            result = self._read()
+            if result[0] != PCAN_ERROR_OK:
+                break
+            msgs.append(self._message_from_result(result))
+        return msgs, False
+
+    def _message_from_result(self, result):
+        """Convert the result of ``Read()`` or ``ReadFD()`` to a message."""
         theMsg = result[1]
         itsTimeStamp = result[2]
 
@@ -380,7 +427,7 @@ class PcanBus(BusABC):
             error_state_indicator=error_state_indicator,
         )
 
-        return rx_msg, False
+        return rx_msg
 
     def send(self, msg, timeout=None):
         msgType = (
@@ -446,6 +493,18 @@ class PcanBus(BusABC):
         if result != PCAN_ERROR_OK:
             raise PcanError("Failed to send: " + self._get_formatted_error(result))
 
+    def fileno(self):
+        """The file descriptor of PCAN-Basic for Linux, which becomes readable
+        when messages were received.
+
+        :raises NotImplementedError: on other platforms
+        """
+        if self._recv_fd is None:
+            raise NotImplementedError(
+                "fileno is only available with PCAN-Basic for Linux"
+            )
+        return self._recv_fd
+
     def flash(self, flash):
         """
         Turn on or off flashing of the device's LED for physical
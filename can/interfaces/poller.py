@@ -0,0 +1,180 @@
+"""
+Background reception for interfaces whose driver can only be polled, or
+only be waited on by a single thread, shared by the isCAN, NI-CAN and
+USB2CAN interfaces.
+"""
+
+import logging
+import select
+import socket
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, List, Optional
+
+from can.message import Message
+
+log = logging.getLogger(__name__)
+
+#: Called as ``read(timeout)`` in the background thread. Returns all messages
+#: the driver has queued, or an empty list if there are none. Drivers that
+#: can wait for messages wait at most *timeout* seconds for the first one.
+DriverRead = Callable[[float], List[Message]]
+
+
+class DriverPoller:
+    """Reads messages from a driver in a background thread.
+
+    The thread calls the read function of the interface as long as it
+    returns messages and appends them to a queue. When the driver has no
+    messages, the thread waits before trying again: drivers that can wait
+    for messages do so themselves, for the others the thread sleeps. The
+    sleep starts at *min_interval* and doubles while no messages arrive,
+    up to *max_interval*.
+
+    The queue holds at most *max_queue_size* messages. If nobody receives
+    them, the oldest ones are dropped and counted in :attr:`dropped`.
+
+    The file descriptor returned by :meth:`fileno` is readable while the
+    queue holds messages, so :meth:`can.BusABC.fileno` can be implemented
+    with it.
+    """
+
+    def __init__(
+        self,
+        read: DriverRead,
+        name: str,
+        blocking: bool = False,
+        min_interval: float = 0.0001,
+        max_interval: float = 0.01,
+        max_queue_size: int = 100000,
+    ):
+        """
+        :param read:
+            The function that reads the messages from the driver,
+            see :data:`DriverRead`.
+        :param name:
+            The name of the background thread.
+        :param blocking:
+            True if *read* waits for messages itself, it is then called with a
+            timeout of *max_interval*, so :meth:`stop` takes at most that long.
+        :param min_interval:
+            The first sleep in seconds after the driver had no messages.
+        :param max_interval:
+            The longest sleep in seconds while the driver has no messages.
+        :param max_queue_size:
+            The maximum number of received messages which are kept until
+            they are fetched with :meth:`get`.
+        """
+        self._read = read
+        self._blocking = blocking
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+
+        self.max_queue_size = max_queue_size
+        self._queue: Deque[Message] = deque(maxlen=max_queue_size)
+        #: The number of messages dropped because the queue was full
+        self.dropped = 0
+        #: The exception raised by *read*, which stopped the thread
+        self.exception: Optional[Exception] = None
+        # a byte is written to the socket pair when the queue becomes non empty,
+        # it is drained again once the queue was emptied
+        self._signaled = False
+        self._receiver, self._sender = socket.socketpair()
+        self._receiver.setblocking(False)
+
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        queue = self._queue
+        interval = self.min_interval
+        while self._running:
+            try:
+                msgs = self._read(self.max_interval if self._blocking else 0.0)
+            except Exception as exc:  # pylint: disable=broad-except
+                log.debug("Reading from the driver failed: %s", exc)
+                self.exception = exc
+                self._running = False
+                self._signal()
+                return
+
+            if msgs:
+                overflow = len(queue) + len(msgs) - self.max_queue_size
+                if overflow > 0:
+                    self.dropped += overflow
+                queue.extend(msgs)
+                if not self._signaled:
+                    self._signal()
+                interval = self.min_interval
+            elif not self._blocking:
+                time.sleep(interval)
+                interval = min(interval * 2, self.max_interval)
+
+    def _signal(self) -> None:
+        self._signaled = True
+        try:
+            self._sender.send(b"\0")
+        except OSError:
+            # the poller was stopped
+            pass
+
+    def _clear_signal(self) -> None:
+        self._signaled = False
+        try:
+            while self._receiver.recv(4096):
+                pass
+        except OSError:
+            pass
+        # messages may have been queued while the signal was cleared
+        if self._queue or self.exception is not None:
+            self._signal()
+
+    def get(self, max_messages: int, timeout: Optional[float]) -> List[Message]:
+        """Return up to *max_messages* received messages.
+
+        :param max_messages: The maximum number of messages to return.
+        :param timeout:
+            Seconds to wait for the first message, or None to wait
+            indefinitely.
+        :return: The messages, in the order they were received.
+        :raises Exception: the exception raised by the read function
+        """
+        queue = self._queue
+        end_time = None if timeout is None else time.perf_counter() + timeout
+        while not queue:
+            if self.exception is not None:
+                raise self.exception
+            if end_time is None:
+                remaining = None
+            else:
+                remaining = max(end_time - time.perf_counter(), 0.0)
+            if not select.select([self._receiver], [], [], remaining)[0]:
+                return []
+            if not queue:
+                # the signal is outdated
+                self._clear_signal()
+                if remaining == 0.0:
+                    return []
+
+        count = min(max_messages, len(queue))
+        msgs = [queue.popleft() for _ in range(count)]
+        if not queue:
+            self._clear_signal()
+        return msgs
+
+    def fileno(self) -> int:
+        """The file descriptor which is readable while messages are queued."""
+        return self._receiver.fileno()
+
+    def stop(self, timeout: Optional[float] = 1.0) -> None:
+        """Stop the background thread and close the file descriptor.
+
+        :param timeout: The maximum time in seconds to wait for the thread.
+        """
+        self._running = False
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        self._receiver.close()
+        self._sender.close()
@@ -2,10 +2,13 @@
 Interface for Chinese Robotell compatible interfaces (win32/linux).
 """
 
+import re
+import struct
 import time
 import logging
 
 from can import BusABC, Message
+from can.interfaces.serial.framing import FrameReader
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +54,13 @@ class robotellBus(BusABC):
     _CAN_DATA_FRAME = 0  # Send data frame
     _CAN_REMOTE_FRAME = 1  # Request remote frame
 
+    # A packet with escaped HEAD, TAIL and ESC bytes between the HEAD and TAIL bytes
+    _PACKET = re.compile(b"\xaa\xaa((?:\xa5[\x00-\xff]|[^\xa5\xaa\x55])*)\x55\x55")
+    _ESCAPED_BYTE = re.compile(b"\xa5([\x00-\xff])")
+    _SPECIAL_BYTE = re.compile(b"([\xa5\xaa\x55])")
+    # ID, data, data length, channel, format and type
+    _MESSAGE = struct.Struct("<I8sBBBB")
+
     def __init__(
         self, channel, ttyBaudrate=115200, bitrate=None, rtscts=False, **kwargs
     ):
@@ -77,7 +87,8 @@ class robotellBus(BusABC):
         ## Disable flushing queued config ACKs on lookup channel (for unit tests)
         self._loopback_test = channel == "loop://"
 
-        self._rxbuffer = bytearray()  # raw bytes from the serial port
+        # splits the raw bytes from the serial port into packets
+        self._reader = FrameReader(self.serialPortOrig, self._parse_packets)
         self._rxmsg = []  # extracted CAN messages waiting to be read
         self._configmsg = []  # extracted config channel messages
 
@@ -215,123 +226,90 @@ class robotellBus(BusABC):
                 + str(configid)
             )
 
-    def _readmessage(self, flushold, cfgchannel, timeout):
-        header = bytearray([self._PACKET_HEAD, self._PACKET_HEAD])
-        terminator = bytearray([self._PACKET_TAIL, self._PACKET_TAIL])
+    def _parse_packets(self, buffer):
+        """
+        Extract the packets from *buffer* into the message queues, see
+        :data:`~can.interfaces.serial.framing.FrameParser`.
+        """
+        header = b"\xaa\xaa"
+        pos = 0
+        while True:
+            headpos = buffer.find(header, pos)
+            if headpos < 0:
+                # discard the rest, except for a HEAD byte that may start a packet
+                if buffer.endswith(header[:1]):
+                    return [], len(buffer) - 1
+                return [], len(buffer)
+            if headpos > pos:
+                # data does not start with expected header bytes. Log error and ignore garbage
+                logger.warning("Ignoring extra %d garbage bytes", headpos - pos)
+
+            packet = self._PACKET.match(buffer, headpos)
+            if packet is None:
+                if buffer.find(header, headpos + len(header)) < 0:
+                    # wait for the rest of the packet
+                    return [], headpos
+                # invalid packet, continue with the next one
+                logger.warning("Invalid packet, ignoring message")
+                pos = headpos + len(header)
+                continue
+            pos = packet.end()
+
+            newmsg = self._ESCAPED_BYTE.sub(b"\\1", packet.group(1))
+            # Check one - make sure message structure is the correct length
+            if len(newmsg) != 17:
+                logger.warning(
+                    "Invalid message structure length %d, ignoring message", len(newmsg)
+                )
+            # Check two - verify the checksum
+            elif newmsg[16] != sum(newmsg[:16]) & 0xFF:
+                logger.warning("Incorrect message checksum, discarded message")
+            # OK, valid message - place it in the correct queue
+            elif newmsg[13] == self._CAN_CONFIG_CHANNEL:
+                self._configmsg.append(newmsg)
+            else:
+                self._rxmsg.append(newmsg)
 
+    def _readmessage(self, flushold, cfgchannel, timeout):
         msgqueue = self._configmsg if cfgchannel else self._rxmsg
         if flushold:
             del msgqueue[:]
 
-        # read what is already in serial port receive buffer - unless we are doing loopback testing
-        if not self._loopback_test:
-            while self.serialPortOrig.in_waiting:
-                self._rxbuffer += self.serialPortOrig.read()
-
         # loop until we have read an appropriate message
         start = time.time()
         time_left = timeout
         while True:
-            # make sure first bytes in RX buffer is a new packet header
-            headpos = self._rxbuffer.find(header)
-            if headpos > 0:
-                # data does not start with expected header bytes. Log error and ignore garbage
-                logger.warning("Ignoring extra " + str(headpos) + " garbage bytes")
-                del self._rxbuffer[:headpos]
-                headpos = self._rxbuffer.find(header)  # should now be at index 0!
-
-            # check to see if we have a complete packet in the RX buffer
-            termpos = self._rxbuffer.find(terminator)
-            if headpos == 0 and termpos > headpos:
-                # copy packet into message structure and un-escape bytes
-                newmsg = bytearray()
-                idx = headpos + len(header)
-                while idx < termpos:
-                    if self._rxbuffer[idx] == self._PACKET_ESC:
-                        idx += 1
-                    newmsg.append(self._rxbuffer[idx])
-                    idx += 1
-                del self._rxbuffer[: termpos + len(terminator)]
-
-                # Check one - make sure message structure is the correct length
-                if len(newmsg) == 17:
-                    # Check two - verify the checksum
-                    cs = 0
-                    for idx in range(16):
-                        cs = (cs + newmsg[idx]) & 0xFF
-                    if newmsg[16] == cs:
-                        # OK, valid message - place it in the correct queue
-                        if newmsg[13] == 0xFF:  ## Check for config channel
-                            self._configmsg.append(newmsg)
-                        else:
-                            self._rxmsg.append(newmsg)
-                    else:
-                        logger.warning("Incorrect message checksum, discarded message")
-                else:
-                    logger.warning(
-                        "Invalid message structure length "
-                        + str(len(newmsg))
-                        + ", ignoring message"
-                    )
-
             # Check if we have a message in the desired queue - if so copy and return
-            if len(msgqueue) > 0:
-                newmsg = msgqueue[0]
-                del msgqueue[:1]
-                return newmsg
+            if msgqueue:
+                return msgqueue.pop(0)
 
-            # if we still don't have a complete message, do a blocking read
+            # read everything that is waiting, or block until the next byte arrives.
+            # Read single bytes when testing, to leave the sent packets in the loop
             self.serialPortOrig.timeout = time_left
-            byte = self.serialPortOrig.read()
-            if byte:
-                self._rxbuffer += byte
+            self._reader.read(1 if self._loopback_test else None)
             # If there is time left, try next one with reduced timeout
             if timeout is not None:
                 time_left = timeout - (time.time() - start)
                 if time_left <= 0:
-                    return None
+                    return msgqueue.pop(0) if msgqueue else None
 
     def _writemessage(self, msgid, msgdata, datalen, msgchan, msgformat, msgtype):
-        msgbuf = bytearray(17)  # Message structure plus checksum byte
-
-        msgbuf[0] = msgid & 0xFF
-        msgbuf[1] = (msgid >> 8) & 0xFF
-        msgbuf[2] = (msgid >> 16) & 0xFF
-        msgbuf[3] = (msgid >> 24) & 0xFF
-
         if msgtype == self._CAN_DATA_FRAME:
-            for idx in range(datalen):
-                msgbuf[idx + 4] = msgdata[idx]
-
-        msgbuf[12] = datalen
-        msgbuf[13] = msgchan
-        msgbuf[14] = msgformat
-        msgbuf[15] = msgtype
-
-        cs = 0
-        for idx in range(16):
-            cs = (cs + msgbuf[idx]) & 0xFF
-        msgbuf[16] = cs
-
-        packet = bytearray()
-        packet.append(self._PACKET_HEAD)
-        packet.append(self._PACKET_HEAD)
-        for msgbyte in msgbuf:
-            if (
-                msgbyte == self._PACKET_ESC
-                or msgbyte == self._PACKET_HEAD
-                or msgbyte == self._PACKET_TAIL
-            ):
-                packet.append(self._PACKET_ESC)
-            packet.append(msgbyte)
-        packet.append(self._PACKET_TAIL)
-        packet.append(self._PACKET_TAIL)
+            data = bytes(msgdata[:datalen])
+        else:
+            data = b""
+        # Message structure plus checksum byte
+        msgbuf = self._MESSAGE.pack(
+            msgid & 0xFFFFFFFF, data, datalen, msgchan, msgformat, msgtype
+        )
+        msgbuf += bytes([sum(msgbuf) & 0xFF])
 
+        packet = b"\xaa\xaa" + self._SPECIAL_BYTE.sub(b"\xa5\\1", msgbuf) + b"\x55\x55"
         self.serialPortOrig.write(packet)
         self.serialPortOrig.flush()
 
     def flush(self):
-        del self._rxbuffer[:]
+        self._reader.clear()
         del self._rxmsg[:]
         del self._configmsg[:]
         while self.serialPortOrig.in_waiting:
@@ -11,6 +11,7 @@ import struct
 import io
 from time import time
 from can import BusABC, Message
+from can.interfaces.serial.framing import FrameReader
 
 logger = logging.getLogger("seeedbus")
 
@@ -97,6 +98,9 @@ class SeeedBus(BusABC):
         self.ser = serial.Serial(
             channel, baudrate=baudrate, timeout=timeout, rtscts=False
         )
+        self._reader = FrameReader(
+            self.ser, self._parse_frames, read_errors=(serial.SerialException,)
+        )
 
         super(SeeedBus, self).__init__(channel=channel, *args, **kwargs)
         self.init_frame()
@@ -174,31 +178,81 @@ class SeeedBus(BusABC):
             used instead.
         """
 
-        byte_msg = bytearray()
-        byte_msg.append(0xAA)
-
-        m_type = 0xC0
-        if msg.is_extended_id:
-            m_type += 1 << 5
-
-        if msg.is_remote_frame:
-            m_type += 1 << 4
-
-        m_type += msg.dlc
-        byte_msg.append(m_type)
-
+        m_type = 0xC0 | msg.dlc
         if msg.is_extended_id:
-            a_id = struct.pack("<I", msg.arbitration_id)
+            m_type |= 1 << 5
+            id_format = "I"
         else:
-            a_id = struct.pack("<H", msg.arbitration_id)
-
-        byte_msg.extend(a_id)
-        byte_msg.extend(msg.data)
-        byte_msg.append(0x55)
-
-        logger.debug("sending:\t%s", byte_msg.hex())
+            id_format = "H"
+        if msg.is_remote_frame:
+            m_type |= 1 << 4
+
+        byte_msg = struct.pack(
+            "<BB{}{}sB".format(id_format, len(msg.data)),
+            0xAA,
+            m_type,
+            msg.arbitration_id,
+            bytes(msg.data),
+            0x55,
+        )
         self.ser.write(byte_msg)
 
+    def _parse_frames(self, buffer):
+        """
+        Extract the frames from *buffer*, see
+        :data:`~can.interfaces.serial.framing.FrameParser`.
+        """
+        msgs = []
+        length = len(buffer)
+        pos = 0
+        time_stamp = time()
+        while True:
+            start = buffer.find(0xAA, pos)
+            if start < 0:
+                # only garbage left
+                return msgs, length
+            if length - start < 2:
+                return msgs, start
+
+            m_type = buffer[start + 1]
+            if m_type == 0x55:
+                # response to a status request
+                end = start + 20
+                if end > length:
+                    return msgs, start
+                logger.debug("status resp:\t%s", buffer[start:end].hex())
+                pos = end
+                continue
+            if m_type & 0xC0 != 0xC0:
+                # not the start of a frame, search for the next one
+                pos = start + 1
+                continue
+
+            dlc = m_type & 0x0F
+            is_extended = bool(m_type & 0x20)
+            id_end = start + (6 if is_extended else 4)
+            end = id_end + dlc
+            if end >= length:
+                return msgs, start
+            if buffer[end] != 0x55:
+                pos = start + 1
+                continue
+            if is_extended:
+                (arb_id,) = struct.unpack_from("<I", buffer, start + 2)
+            else:
+                (arb_id,) = struct.unpack_from("<H", buffer, start + 2)
+            msgs.append(
+                Message(
+                    timestamp=time_stamp,
+                    arbitration_id=arb_id,
+                    is_extended_id=is_extended,
+                    is_remote_frame=bool(m_type & 0x10),
+                    dlc=dlc,
+                    data=buffer[id_end:end],
+                )
+            )
+            pos = end + 1
+
     def _recv_internal(self, timeout):
         """
         Read a message from the serial device.
@@ -215,52 +269,12 @@ class SeeedBus(BusABC):
         :rtype:
             can.Message, bool
         """
-        try:
-            # ser.read can return an empty string
-            # or raise a SerialException
-            rx_byte_1 = self.ser.read()
-
-        except serial.SerialException:
-            return None, False
+        msgs = self._reader.get(1)
+        return (msgs[0] if msgs else None), False
 
-        if rx_byte_1 and ord(rx_byte_1) == 0xAA:
-            rx_byte_2 = ord(self.ser.read())
-            time_stamp = time()
-            if rx_byte_2 == 0x55:
-                status = bytearray([0xAA, 0x55])
-                status += bytearray(self.ser.read(18))
-                logger.debug("status resp:\t%s", status.hex())
-
-            else:
-                length = int(rx_byte_2 & 0x0F)
-                is_extended = bool(rx_byte_2 & 0x20)
-                is_remote = bool(rx_byte_2 & 0x10)
-                if is_extended:
-                    s_3_4_5_6 = bytearray(self.ser.read(4))
-                    arb_id = (struct.unpack("<I", s_3_4_5_6))[0]
-
-                else:
-                    s_3_4 = bytearray(self.ser.read(2))
-                    arb_id = (struct.unpack("<H", s_3_4))[0]
-
-                data = bytearray(self.ser.read(length))
-                end_packet = ord(self.ser.read())
-                if end_packet == 0x55:
-                    msg = Message(
-                        timestamp=time_stamp,
-                        arbitration_id=arb_id,
-                        is_extended_id=is_extended,
-                        is_remote_frame=is_remote,
-                        dlc=length,
-                        data=data,
-                    )
-                    logger.debug("recv message: %s", str(msg))
-                    return msg, False
-
-                else:
-                    return None, False
-
-        return None, None
+    def _recv_batch_internal(self, max_messages, timeout):
+        # the timeout is ignored like in _recv_internal()
+        return self._reader.get(max_messages), False
 
     def fileno(self):
         try:
@@ -0,0 +1,97 @@
+"""
+Incremental framing of the byte stream of serial ports, shared by the
+interfaces that talk to their adapter over a (virtual) serial port.
+"""
+
+from collections import deque
+from typing import Any, Callable, Deque, List, Optional, Tuple, Type
+
+#: Called as ``parse(buffer)`` with the received but not yet consumed bytes.
+#: Returns the complete frames found in *buffer* and the number of bytes
+#: at the start of *buffer* that are consumed (frames and garbage).
+FrameParser = Callable[[bytearray], Tuple[List[Any], int]]
+
+
+class FrameReader:
+    """Reads from a serial port in chunks and splits the data into frames.
+
+    Every :meth:`read` fetches all bytes the port has buffered with a single
+    call, appends them to an internal buffer and extracts all frames that
+    are complete. Incomplete frames stay in the buffer until the rest of
+    them is received.
+
+    Interfaces which return the frames one by one or in batches of limited
+    size fetch them with :meth:`get`, which queues the remaining ones.
+    """
+
+    def __init__(
+        self, ser, parse: FrameParser, read_errors: Tuple[Type[Exception], ...] = ()
+    ):
+        """
+        :param ser:
+            A :class:`serial.Serial` like object.
+        :param parse:
+            The protocol specific function that extracts the frames from the
+            buffer, see :data:`FrameParser`.
+        :param read_errors:
+            The exceptions of the port which :meth:`get` treats like a read
+            without data, e.g. :class:`serial.SerialException`.
+        """
+        self.ser = ser
+        self.parse = parse
+        self.read_errors = read_errors
+        self.buffer = bytearray()
+        #: The complete frames not returned by :meth:`get` yet
+        self.queue: Deque[Any] = deque()
+
+    def feed(self, data: bytes) -> List[Any]:
+        """Append received *data* to the buffer.
+
+        :return: The frames that are complete now.
+        """
+        buffer = self.buffer
+        buffer += data
+        frames, consumed = self.parse(buffer)
+        if consumed:
+            del buffer[:consumed]
+        return frames
+
+    def read(self, size: Optional[int] = None) -> List[Any]:
+        """Read everything that is waiting in the port.
+
+        If nothing is waiting, this blocks until the first byte arrives or
+        the timeout of the port expires.
+
+        :param size:
+            Read at most this many bytes instead of everything that is
+            waiting.
+        :return: The frames that are complete now.
+        """
+        data = self.ser.read(size or self.ser.in_waiting or 1)
+        if not data:
+            return []
+        return self.feed(data)
+
+    def get(self, max_frames: int = 1) -> List[Any]:
+        """Return up to *max_frames* frames.
+
+        Only reads from the port, like :meth:`read`, if no frames are queued,
+        so the timeout of the port applies instead of a timeout given to the
+        bus.
+
+        :param max_frames: The maximum number of frames to return.
+        :return: The frames, or an empty list if none were received.
+        """
+        queue = self.queue
+        if not queue:
+            try:
+                queue.extend(self.read())
+            except self.read_errors:
+                return []
+        count = min(max_frames, len(queue))
+        return [queue.popleft() for _ in range(count)]
+
+    def clear(self) -> None:
+        """Discard the buffered data and the queued frames."""
+        del self.buffer[:]
+        self.queue.clear()
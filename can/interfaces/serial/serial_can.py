@@ -9,6 +9,7 @@ import logging
 import struct
 
 from can import BusABC, Message
+from can.interfaces.serial.framing import FrameReader
 
 logger = logging.getLogger("can.serial")
 
@@ -26,6 +27,45 @@ try:
 except ImportError:
     list_ports = None
 
+# start byte, timestamp, DLC and arbitration ID
+_HEADER = struct.Struct("<BIBI")
+_START_OF_FRAME = 0xAA
+_END_OF_FRAME = 0xBB
+
+
+def _parse_frames(buffer):
+    """
+    Extract the frames from *buffer*, see
+    :data:`~can.interfaces.serial.framing.FrameParser`.
+    """
+    msgs = []
+    length = len(buffer)
+    pos = 0
+    while True:
+        start = buffer.find(_START_OF_FRAME, pos)
+        if start < 0:
+            # only garbage left
+            return msgs, length
+        if length - start < _HEADER.size:
+            return msgs, start
+        _, timestamp, dlc, arb_id = _HEADER.unpack_from(buffer, start)
+        end = start + _HEADER.size + dlc
+        if end >= length:
+            return msgs, start
+        if buffer[end] != _END_OF_FRAME:
+            # not the start of a frame, search for the next one
+            pos = start + 1
+            continue
+        msgs.append(
+            Message(
+                timestamp=timestamp / 1000,
+                arbitration_id=arb_id,
+                dlc=dlc,
+                data=buffer[start + _HEADER.size : end],
+            )
+        )
+        pos = end + 1
+
 
 class SerialBus(BusABC):
     """
@@ -64,6 +104,9 @@ class SerialBus(BusABC):
         self.ser = serial.serial_for_url(
             channel, baudrate=baudrate, timeout=timeout, rtscts=rtscts
         )
+        self._reader = FrameReader(
+            self.ser, _parse_frames, read_errors=(serial.SerialException,)
+        )
 
         super().__init__(channel=channel, *args, **kwargs)
 
@@ -91,24 +134,20 @@ class SerialBus(BusABC):
             used instead.
 
         """
-        try:
-            timestamp = struct.pack("<I", int(msg.timestamp * 1000))
-        except struct.error:
+        timestamp = int(msg.timestamp * 1000)
+        if not 0 <= timestamp <= 0xFFFFFFFF:
             raise ValueError("Timestamp is out of range")
-        try:
-            a_id = struct.pack("<I", msg.arbitration_id)
-        except struct.error:
+        if not 0 <= msg.arbitration_id <= 0xFFFFFFFF:
             raise ValueError("Arbitration Id is out of range")
-        byte_msg = bytearray()
-        byte_msg.append(0xAA)
-        for i in range(0, 4):
-            byte_msg.append(timestamp[i])
-        byte_msg.append(msg.dlc)
-        for i in range(0, 4):
-            byte_msg.append(a_id[i])
-        for i in range(0, msg.dlc):
-            byte_msg.append(msg.data[i])
-        byte_msg.append(0xBB)
+        byte_msg = struct.pack(
+            "<BIBI{}sB".format(msg.dlc),
+            _START_OF_FRAME,
+            timestamp,
+            msg.dlc,
+            msg.arbitration_id,
+            bytes(msg.data),
+            _END_OF_FRAME,
+        )
         self.ser.write(byte_msg)
 
     def _recv_internal(self, timeout):
@@ -131,36 +170,12 @@ class SerialBus(BusABC):
         :rtype:
             Tuple[can.Message, Bool]
         """
-        try:
-            # ser.read can return an empty string
-            # or raise a SerialException
-            rx_byte = self.ser.read()
-        except serial.SerialException:
-            return None, False
-
-        if rx_byte and ord(rx_byte) == 0xAA:
-            s = bytearray(self.ser.read(4))
-            timestamp = (struct.unpack("<I", s))[0]
-            dlc = ord(self.ser.read())
-
-            s = bytearray(self.ser.read(4))
-            arb_id = (struct.unpack("<I", s))[0]
-
-            data = self.ser.read(dlc)
-
-            rxd_byte = ord(self.ser.read())
-            if rxd_byte == 0xBB:
-                # received message data okay
-                msg = Message(
-                    timestamp=timestamp / 1000,
-                    arbitration_id=arb_id,
-                    dlc=dlc,
-                    data=data,
-                )
-                return msg, False
-
-        else:
-            return None, False
+        msgs = self._reader.get(1)
+        return (msgs[0] if msgs else None), False
+
+    def _recv_batch_internal(self, max_messages, timeout):
+        # the timeout is ignored like in _recv_internal()
+        return self._reader.get(max_messages), False
 
     def fileno(self):
         if hasattr(self.ser, "fileno"):
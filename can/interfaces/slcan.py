@@ -7,13 +7,15 @@ Interface for slcan compatible interfaces (win32/linux).
 
 """
 
-from typing import Any, Optional, Tuple
+from collections import deque
+from typing import Any, Deque, Iterable, List, Optional, Tuple
 from can import typechecking
 
 import time
 import logging
 
 from can import BusABC, Message
+from can.interfaces.serial.framing import FrameReader
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +29,27 @@ except ImportError:
     serial = None
 
 
+def _split_lines(buffer: bytearray) -> Tuple[List[bytes], int]:
+    """
+    Split *buffer* into the lines terminated by OK or ERROR, see
+    :data:`~can.interfaces.serial.framing.FrameParser`.
+    """
+    lines: List[bytes] = []
+    start = 0
+    # errors are rare, only search for them if there are any
+    has_errors = 7 in buffer
+    while True:
+        end = buffer.find(b"\r", start)
+        if has_errors:
+            error = buffer.find(b"\a", start)
+            if error >= 0 and (end < 0 or error < end):
+                end = error
+        if end < 0:
+            return lines, start
+        lines.append(bytes(buffer[start : end + 1]))
+        start = end + 1
+
+
 class slcanBus(BusABC):
     """
     slcan interface
@@ -48,6 +71,17 @@ class slcanBus(BusABC):
 
     _SLEEP_AFTER_SERIAL_OPEN = 2  # in seconds
 
+    # the device timestamps count milliseconds and wrap around every minute
+    _TIMESTAMP_PERIOD = 60.0
+
+    # frame type => is_extended_id, is_remote_frame, length of the ID
+    _FRAME_TYPES = {
+        "t": (False, False, 3),
+        "T": (True, False, 8),
+        "r": (False, True, 3),
+        "R": (True, True, 8),
+    }
+
     _OK = b"\r"
     _ERROR = b"\a"
 
@@ -61,6 +95,7 @@ class slcanBus(BusABC):
         btr: Optional[str] = None,
         sleep_after_open: float = _SLEEP_AFTER_SERIAL_OPEN,
         rtscts: bool = False,
+        device_timestamps: bool = False,
         **kwargs: Any
     ) -> None:
         """
@@ -81,6 +116,11 @@ class slcanBus(BusABC):
             Time to wait in seconds after opening serial connection
         :param rtscts:
             turn hardware handshake (RTS/CTS) on and off
+        :param device_timestamps:
+            Enable the timestamps of the device (``Z1``). They are more
+            accurate than the time of reception on the host, which is used
+            otherwise. Frames are timestamped by the device whenever it sends
+            timestamps, e.g. if the setting was stored in the device before.
         """
 
         if not channel:  # if None or empty
@@ -92,7 +132,9 @@ class slcanBus(BusABC):
             channel, baudrate=ttyBaudrate, rtscts=rtscts
         )
 
-        self._buffer = bytearray()
+        self._reader = FrameReader(self.serialPortOrig, _split_lines)
+        self._lines: Deque[bytes] = deque()
+        self._timestamp_base: Optional[float] = None
 
         time.sleep(sleep_after_open)
 
@@ -102,6 +144,8 @@ class slcanBus(BusABC):
             self.set_bitrate(bitrate)
         if btr is not None:
             self.set_bitrate_reg(btr)
+        if device_timestamps:
+            self._write("Z1")
         self.open()
 
         super().__init__(
@@ -139,42 +183,39 @@ class slcanBus(BusABC):
         self.serialPortOrig.write(string.encode() + self.LINE_TERMINATOR)
         self.serialPortOrig.flush()
 
-    def _read(self, timeout: Optional[float]) -> Optional[str]:
+    def _read_lines(self, timeout: Optional[float]) -> bool:
+        """Wait until at least one line is received.
 
-        # first read what is already in receive buffer
-        while self.serialPortOrig.in_waiting:
-            self._buffer += self.serialPortOrig.read()
-        # if we still don't have a complete message, do a blocking read
+        :return: False if no line was received within *timeout*
+        """
+        lines = self._lines
+        ser = self.serialPortOrig
         start = time.time()
         time_left = timeout
-        while not (ord(self._OK) in self._buffer or ord(self._ERROR) in self._buffer):
-            self.serialPortOrig.timeout = time_left
-            byte = self.serialPortOrig.read()
-            if byte:
-                self._buffer += byte
+        while not lines:
+            if ser.timeout != time_left:
+                ser.timeout = time_left
+            # read everything that is waiting, or wait for the next byte
+            lines.extend(self._reader.read())
             # if timeout is None, try indefinitely
-            if timeout is None:
-                continue
-            # try next one only if there still is time, and with
-            # reduced timeout
-            else:
+            if timeout is not None and not lines:
+                # try again only if there still is time, and with
+                # reduced timeout
                 time_left = timeout - (time.time() - start)
-                if time_left > 0:
-                    continue
-                else:
-                    return None
-        # return first message
-        for i in range(len(self._buffer)):
-            if self._buffer[i] == ord(self._OK) or self._buffer[i] == ord(self._ERROR):
-                string = self._buffer[: i + 1].decode()
-                del self._buffer[: i + 1]
-                break
-        return string
+                if time_left <= 0:
+                    return False
+        return True
+
+    def _read(self, timeout: Optional[float]) -> Optional[str]:
+        if not self._read_lines(timeout):
+            return None
+        return self._lines.popleft().decode()
 
     def flush(self) -> None:
-        del self._buffer[:]
+        self._reader.clear()
+        self._lines.clear()
         while self.serialPortOrig.in_waiting:
-            self.serialPortOrig.read()
+            self.serialPortOrig.read(self.serialPortOrig.in_waiting)
 
     def open(self) -> None:
         self._write("O")
@@ -185,55 +226,84 @@ class slcanBus(BusABC):
     def _recv_internal(
         self, timeout: Optional[float]
     ) -> Tuple[Optional[Message], bool]:
+        msgs, already_filtered = self._recv_batch_internal(1, timeout)
+        return (msgs[0] if msgs else None), already_filtered
 
-        canId = None
-        remote = False
-        extended = False
-        frame = []
-
-        string = self._read(timeout)
-
-        if not string:
-            pass
-        elif string[0] == "T":
-            # extended frame
-            canId = int(string[1:9], 16)
-            dlc = int(string[9])
-            extended = True
-            for i in range(0, dlc):
-                frame.append(int(string[10 + i * 2 : 12 + i * 2], 16))
-        elif string[0] == "t":
-            # normal frame
-            canId = int(string[1:4], 16)
-            dlc = int(string[4])
-            for i in range(0, dlc):
-                frame.append(int(string[5 + i * 2 : 7 + i * 2], 16))
-        elif string[0] == "r":
-            # remote frame
-            canId = int(string[1:4], 16)
-            dlc = int(string[4])
-            remote = True
-        elif string[0] == "R":
-            # remote extended frame
-            canId = int(string[1:9], 16)
-            dlc = int(string[9])
-            extended = True
-            remote = True
-        if canId is not None:
-            msg = Message(
-                arbitration_id=canId,
-                is_extended_id=extended,
-                timestamp=time.time(),  # Better than nothing...
-                is_remote_frame=remote,
-                dlc=dlc,
-                data=frame,
-            )
-            return msg, False
-        return None, False
+    def _recv_batch_internal(
+        self, max_messages: int, timeout: Optional[float]
+    ) -> Tuple[List[Message], bool]:
+        lines = self._lines
+        start = time.time()
+        time_left = timeout
+        while True:
+            if not self._read_lines(time_left):
+                return [], False
+
+            msgs: List[Message] = []
+            while lines and len(msgs) < max_messages:
+                msg = self._parse_frame(lines.popleft().decode())
+                # responses to commands are not messages
+                if msg is not None:
+                    msgs.append(msg)
+            if msgs:
+                return msgs, False
+
+            if timeout is not None:
+                time_left = timeout - (time.time() - start)
+                if time_left <= 0:
+                    return [], False
+
+    def _parse_frame(self, string: str) -> Optional[Message]:
+        """Convert a received line to a message, if it is a CAN frame."""
+        frame_type = self._FRAME_TYPES.get(string[0])
+        if frame_type is None:
+            return None
+        extended, remote, id_length = frame_type
+
+        dlc_pos = 1 + id_length
+        dlc = int(string[dlc_pos])
+        data_end = dlc_pos + 1
+        if remote:
+            data = None
+        else:
+            data_end += 2 * dlc
+            data = bytes.fromhex(string[dlc_pos + 1 : data_end])
 
-    def send(self, msg: Message, timeout: Optional[float] = None) -> None:
-        if timeout != self.serialPortOrig.write_timeout:
-            self.serialPortOrig.write_timeout = timeout
+        # the line ends with a 4 digit timestamp if the device sends them
+        if len(string) == data_end + 5:
+            timestamp = self._device_time(int(string[data_end : data_end + 4], 16))
+        else:
+            timestamp = time.time()  # Better than nothing...
+
+        return Message(
+            arbitration_id=int(string[1:dlc_pos], 16),
+            is_extended_id=extended,
+            timestamp=timestamp,
+            is_remote_frame=remote,
+            dlc=dlc,
+            data=data,
+        )
+
+    def _device_time(self, milliseconds: int) -> float:
+        """Convert a timestamp of the device to the time of the host.
+
+        The timestamps of the device wrap around every minute, so they are
+        placed in the minute that is closest to the time of reception.
+        """
+        now = time.time()
+        base = self._timestamp_base
+        if base is None:
+            base = now - milliseconds / 1000
+        timestamp = base + milliseconds / 1000
+        if abs(now - timestamp) > self._TIMESTAMP_PERIOD / 2:
+            minutes = round((now - timestamp) / self._TIMESTAMP_PERIOD)
+            base += minutes * self._TIMESTAMP_PERIOD
+            timestamp += minutes * self._TIMESTAMP_PERIOD
+        self._timestamp_base = base
+        return timestamp
+
+    @staticmethod
+    def _encode(msg: Message) -> bytes:
         if msg.is_remote_frame:
             if msg.is_extended_id:
                 sendStr = "R%08X%d" % (msg.arbitration_id, msg.dlc)
@@ -244,8 +314,39 @@ class slcanBus(BusABC):
                 sendStr = "T%08X%d" % (msg.arbitration_id, msg.dlc)
             else:
                 sendStr = "t%03X%d" % (msg.arbitration_id, msg.dlc)
-            sendStr += "".join(["%02X" % b for b in msg.data])
-        self._write(sendStr)
+            sendStr += msg.data.hex().upper()
+        return sendStr.encode() + slcanBus.LINE_TERMINATOR
+
+    def send(self, msg: Message, timeout: Optional[float] = None) -> None:
+        if timeout != self.serialPortOrig.write_timeout:
+            self.serialPortOrig.write_timeout = timeout
+        self.serialPortOrig.write(self._encode(msg))
+        self.serialPortOrig.flush()
+
+    def send_batch(
+        self, msgs: Iterable[Message], timeout: Optional[float] = None
+    ) -> int:
+        """Transmit many messages with a single write to the serial port.
+
+        :param msgs: The messages to transmit, in order.
+        :param timeout:
+            The write timeout for all messages together, see
+            :meth:`~can.BusABC.send`.
+
+        :return: The number of messages that were sent.
+        """
+        msgs = list(msgs)
+        if timeout != self.serialPortOrig.write_timeout:
+            self.serialPortOrig.write_timeout = timeout
+        try:
+            self.serialPortOrig.write(b"".join(self._encode(msg) for msg in msgs))
+            self.serialPortOrig.flush()
+        except Exception as exc:
+            self._on_send_error(exc)
+            raise
+        for msg in msgs:
+            self._on_sent(msg)
+        return len(msgs)
 
     def shutdown(self) -> None:
         self.close()
@@ -10,6 +10,15 @@ CAN_EFF_FLAG = 0x80000000
 CAN_BCM_TX_SETUP = 1
 CAN_BCM_TX_DELETE = 2
 CAN_BCM_TX_READ = 3
+CAN_BCM_TX_SEND = 4
+CAN_BCM_RX_SETUP = 5
+CAN_BCM_RX_DELETE = 6
+CAN_BCM_RX_READ = 7
+CAN_BCM_TX_STATUS = 8
+CAN_BCM_TX_EXPIRED = 9
+CAN_BCM_RX_STATUS = 10
+CAN_BCM_RX_TIMEOUT = 11
+CAN_BCM_RX_CHANGED = 12
 
 # BCM flags
 SETTIMER = 0x0001
@@ -40,6 +49,8 @@ CAN_RAW_FD_FRAMES = 5
 MSK_ARBID = 0x1FFFFFFF
 MSK_FLAGS = 0xE0000000
 
+SO_RXQ_OVFL = 40
+
 PF_CAN = 29
 SOCK_RAW = 3
 SOCK_DGRAM = 2
@@ -53,6 +64,7 @@ EXTFLG = 0x0004
 CANFD_BRS = 0x01
 CANFD_ESI = 0x02
 
+CAN_MTU = 16
 CANFD_MTU = 72
 
 STD_ACCEPTANCE_MASK_ALL_BITS = 2 ** 11 - 1
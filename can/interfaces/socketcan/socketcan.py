@@ -5,7 +5,18 @@ along some internal methods.
 At the end of the file the usage of the internal methods is shown.
 """
 
-from typing import Dict, List, Optional, Sequence, Tuple, Type, Union
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 import logging
 import ctypes
@@ -18,8 +29,6 @@ import threading
 import errno
 
 log = logging.getLogger(__name__)
-log_tx = log.getChild("tx")
-log_rx = log.getChild("rx")
 
 try:
     import fcntl
@@ -29,7 +38,11 @@ except ImportError:
 
 import can
 from can import Message, BusABC
+from can.bus import PreparedMessage
+from can.trace import GLOBAL_HOOKS
 from can.broadcastmanager import (
+    CyclicSendTaskGroup,
+    CyclicTask,
     ModifiableCyclicTaskABC,
     RestartableCyclicTaskABC,
     LimitedDurationCyclicSendTaskABC,
@@ -38,6 +51,12 @@ from can.typechecking import CanFilters
 from can.interfaces.socketcan.constants import *  # CAN_RAW, CAN_*_FLAG
 from can.interfaces.socketcan.utils import pack_filters, find_available_interfaces
 
+# Bounds (in seconds) of the back-off used by SocketcanBus.send_batch()
+# while the transmit queue of the interface is full
+SEND_BATCH_MIN_BACKOFF = 0.0001
+SEND_BATCH_MAX_BACKOFF = 0.01
+
+
 # Setup BCM struct
 def bcm_header_factory(
     fields: List[Tuple[str, Union[Type[ctypes.c_uint32], Type[ctypes.c_long]]]],
@@ -200,6 +219,13 @@ def build_bcm_header(
     return ctypes.string_at(ctypes.addressof(result), ctypes.sizeof(result))
 
 
+def split_time(value: float) -> Tuple[int, int]:
+    """Given seconds as a float, return whole seconds and microseconds"""
+    seconds = int(value)
+    microseconds = int(1e6 * (value - seconds))
+    return seconds, microseconds
+
+
 def build_bcm_tx_delete_header(can_id: int, flags: int) -> bytes:
     opcode = CAN_BCM_TX_DELETE
     return build_bcm_header(opcode, flags, 0, 0, 0, 0, 0, can_id, 1)
@@ -221,12 +247,6 @@ def build_bcm_transmit_header(
         # Note `TX_COUNTEVT` creates the message TX_EXPIRED when count expires
         flags |= TX_COUNTEVT
 
-    def split_time(value: float) -> Tuple[int, int]:
-        """Given seconds as a float, return whole seconds and microseconds"""
-        seconds = int(value)
-        microseconds = int(1e6 * (value - seconds))
-        return seconds, microseconds
-
     ival1_seconds, ival1_usec = split_time(initial_period)
     ival2_seconds, ival2_usec = split_time(subsequent_period)
 
@@ -247,6 +267,36 @@ def build_bcm_update_header(can_id: int, msg_flags: int, nframes: int = 1) -> by
     return build_bcm_header(CAN_BCM_TX_SETUP, msg_flags, 0, 0, 0, 0, 0, can_id, nframes)
 
 
+def build_bcm_rx_setup_header(
+    can_id: int, flags: int, timeout: float, throttle: float, nframes: int = 1
+) -> bytes:
+    ival1_seconds, ival1_usec = split_time(timeout)
+    ival2_seconds, ival2_usec = split_time(throttle)
+
+    return build_bcm_header(
+        CAN_BCM_RX_SETUP,
+        flags,
+        0,
+        ival1_seconds,
+        ival1_usec,
+        ival2_seconds,
+        ival2_usec,
+        can_id,
+        nframes,
+    )
+
+
+def build_bcm_rx_delete_header(can_id: int, flags: int) -> bytes:
+    return build_bcm_header(CAN_BCM_RX_DELETE, flags, 0, 0, 0, 0, 0, can_id, 0)
+
+
+def dissect_bcm_message(data: bytes) -> Tuple[ctypes.Structure, bytes]:
+    """Split a message read from a BCM socket into its header and the
+    appended frames."""
+    header_size = ctypes.sizeof(BcmMsgHead)
+    return BcmMsgHead.from_buffer_copy(data[:header_size]), data[header_size:]
+
+
 def dissect_can_frame(frame: bytes) -> Tuple[int, int, int, bytes]:
     can_id, can_dlc, flags = CAN_FRAME_HEADER_STRUCT.unpack_from(frame)
     if len(frame) != CANFD_MTU:
@@ -291,13 +341,10 @@ def send_bcm(bcm_socket: socket.socket, data: bytes) -> int:
 def _compose_arbitration_id(message: Message) -> int:
     can_id = message.arbitration_id
     if message.is_extended_id:
-        log.debug("sending an extended id type message")
         can_id |= CAN_EFF_FLAG
     if message.is_remote_frame:
-        log.debug("requesting a remote frame")
         can_id |= CAN_RTR_FLAG
     if message.is_error_frame:
-        log.debug("sending error frame")
         can_id |= CAN_ERR_FLAG
     return can_id
 
@@ -320,6 +367,7 @@ class CyclicSendTask(
         messages: Union[Sequence[Message], Message],
         period: float,
         duration: Optional[float] = None,
+        autostart: bool = True,
     ):
         """Construct and :meth:`~start` a task.
 
@@ -333,6 +381,9 @@ class CyclicSendTask(
             The rate in seconds at which to send the messages.
         :param duration:
             Approximate duration in seconds to send the messages for.
+        :param autostart:
+            If False, the task is not set up in the kernel right away. The
+            caller is responsible for sending :meth:`_build_tx_setup`.
         """
         # The following are assigned by LimitedDurationCyclicSendTaskABC:
         #   - self.messages
@@ -342,9 +393,16 @@ class CyclicSendTask(
 
         self.bcm_socket = bcm_socket
         self.task_id = task_id
-        self._tx_setup(self.messages)
+        self.flags = CAN_FD_FRAME if self.messages[0].is_fd else 0
+        if autostart:
+            self._tx_setup(self.messages)
 
     def _tx_setup(self, messages: Sequence[Message]) -> None:
+        self._check_bcm_task()
+        log.debug("Sending BCM command")
+        send_bcm(self.bcm_socket, self._build_tx_setup(messages))
+
+    def _build_tx_setup(self, messages: Sequence[Message]) -> bytes:
         # Create a low level packed frame to pass to the kernel
         body = bytearray()
         self.flags = CAN_FD_FRAME if messages[0].is_fd else 0
@@ -358,15 +416,12 @@ class CyclicSendTask(
             ival1 = 0.0
             ival2 = self.period
 
-        self._check_bcm_task()
-
         header = build_bcm_transmit_header(
             self.task_id, count, ival1, ival2, self.flags, nframes=len(messages)
         )
         for message in messages:
             body += build_can_frame(message)
-        log.debug("Sending BCM command")
-        send_bcm(self.bcm_socket, header + body)
+        return header + body
 
     def _check_bcm_task(self):
         # Do a TX_READ on a task ID, and check if we get EINVAL. If so,
@@ -477,6 +532,119 @@ class MultiRateCyclicSendTask(CyclicSendTask):
         send_bcm(self.bcm_socket, header + body)
 
 
+class BcmReceiveEvent(NamedTuple):
+    """A notification read from the Broadcast Manager by
+    :meth:`SocketcanBus.recv_bcm`."""
+
+    #: The BCM opcode, usually ``CAN_BCM_RX_CHANGED`` or ``CAN_BCM_RX_TIMEOUT``
+    opcode: int
+    #: The CAN ID of the :class:`BcmReceiveTask` that caused this event
+    arbitration_id: int
+    #: The time of reception of the frame, or of the notification if there is none
+    timestamp: float
+    #: The received frame, or None for timeouts
+    message: Optional[Message]
+
+    @property
+    def is_timeout(self) -> bool:
+        """True if no frame was received within the monitoring timeout."""
+        return self.opcode == CAN_BCM_RX_TIMEOUT
+
+
+class BcmReceiveTask(CyclicTask):
+    """
+    Lets the Linux Broadcast Manager watch a single CAN ID (``RX_SETUP``).
+
+    The kernel only forwards a frame to user space if its payload changed
+    in the bits selected by the data mask, and reports a timeout if no frame
+    arrived in time. Notifications are read with :meth:`SocketcanBus.recv_bcm`.
+    """
+
+    def __init__(
+        self,
+        bcm_socket: socket.socket,
+        arbitration_id: int,
+        is_extended_id: bool = False,
+        data_mask: Optional[can.typechecking.CanData] = None,
+        timeout: float = 0.0,
+        throttle: float = 0.0,
+        only_changes: bool = True,
+        check_dlc: bool = True,
+        is_fd: bool = False,
+    ):
+        """Construct and start monitoring.
+
+        See :meth:`SocketcanBus.subscribe_bcm` for the parameters.
+        """
+        self.bcm_socket = bcm_socket
+        self.arbitration_id = arbitration_id
+        self.can_id = arbitration_id | (CAN_EFF_FLAG if is_extended_id else 0)
+        self.timeout = timeout
+        self.throttle = throttle
+
+        self.flags = CAN_FD_FRAME if is_fd else 0
+        if timeout or throttle:
+            self.flags |= SETTIMER
+        if timeout:
+            # start watching right away and report the first frame after a timeout
+            self.flags |= STARTTIMER | RX_ANNOUNCE_RESUME
+
+        if only_changes:
+            if check_dlc:
+                self.flags |= RX_CHECK_DLC
+            if data_mask is None:
+                data_mask = b"\xff" * (64 if is_fd else 8)
+            self.mask_frame: Optional[bytes] = build_can_frame(
+                Message(
+                    arbitration_id=arbitration_id,
+                    is_extended_id=is_extended_id,
+                    data=data_mask,
+                    is_fd=is_fd,
+                )
+            )
+        else:
+            self.flags |= RX_FILTER_ID
+            self.mask_frame = None
+
+        self._rx_setup()
+
+    def _rx_setup(self) -> None:
+        nframes = 0 if self.mask_frame is None else 1
+        header = build_bcm_rx_setup_header(
+            self.can_id, self.flags, self.timeout, self.throttle, nframes
+        )
+        log.debug("Sending BCM RX_SETUP command")
+        send_bcm(self.bcm_socket, header + (self.mask_frame or b""))
+
+    def stop(self) -> None:
+        """Stop monitoring by sending RX_DELETE message to Linux kernel."""
+        log.debug("Stopping receive task")
+        send_bcm(self.bcm_socket, build_bcm_rx_delete_header(self.can_id, self.flags))
+
+
+class SocketcanPreparedMessage(PreparedMessage):
+    """A message that :meth:`SocketcanBus.prepare` already encoded as
+    ``struct can_frame`` or ``struct canfd_frame``.
+
+    :attr:`data` is a view into the payload of the encoded frame, so changing
+    it updates the frame without encoding it again.
+    """
+
+    def __init__(self, msg: Message, channel: Optional[str]):
+        super().__init__(msg)
+        #: The encoded frame
+        self.frame = bytearray(build_can_frame(msg))
+        #: The channel to address the frame to, if any
+        self.channel = channel
+        # the payload starts right after the 8 byte header
+        self._data = memoryview(self.frame)[8 : 8 + len(self.message.data)]
+
+    @property
+    def data(self) -> memoryview:
+        """The writable payload of the encoded frame."""
+        return self._data
+
+
 def create_socket() -> socket.socket:
     """Creates a raw CAN socket. The socket will
     be returned unbound to any interface.
@@ -502,8 +670,36 @@ def bind_socket(sock: socket.socket, channel: str = "can0") -> None:
     log.debug("Bound socket.")
 
 
+class SocketcanStatistics:
+    """Counters of a :class:`SocketcanBus`, see :meth:`SocketcanBus.get_stats`."""
+
+    def __init__(self) -> None:
+        #: Frames the kernel dropped because the receive queue of the socket
+        #: was full. Only counted if the bus was created with
+        #: ``count_dropped_frames=True``.
+        self.kernel_dropped = 0
+        #: The size of the receive buffer of the socket in bytes
+        self.receive_buffer_size = 0
+        #: The size of the send buffer of the socket in bytes
+        self.send_buffer_size = 0
+
+    def __str__(self) -> str:
+        return (
+            "kernel_dropped: {}, receive_buffer_size: {}, "
+            "send_buffer_size: {}".format(
+                self.kernel_dropped, self.receive_buffer_size, self.send_buffer_size
+            )
+        )
+
+
+# Room for the SO_RXQ_OVFL control message, a single __u32
+RXQ_OVFL_ANCILLARY_SIZE = socket.CMSG_SPACE(4) if hasattr(socket, "CMSG_SPACE") else 0
+
+
 def capture_message(
-    sock: socket.socket, get_channel: bool = False
+    sock: socket.socket,
+    get_channel: bool = False,
+    statistics: Optional[SocketcanStatistics] = None,
 ) -> Optional[Message]:
     """
     Captures a message from given socket.
@@ -512,29 +708,53 @@ def capture_message(
         The socket to read a message from.
     :param get_channel:
         Find out which channel the message comes from.
+    :param statistics:
+        If given, the drop counter reported by the kernel (see ``SO_RXQ_OVFL``)
+        is stored in it.
 
     :return: The received message, or None on failure.
     """
+    ancillary_size = 0 if statistics is None else RXQ_OVFL_ANCILLARY_SIZE
     # Fetching the Arb ID, DLC and Data
     try:
-        if get_channel:
-            cf, _, msg_flags, addr = sock.recvmsg(CANFD_MTU)
-            channel = addr[0] if isinstance(addr, tuple) else addr
-        else:
-            cf, _, msg_flags, _ = sock.recvmsg(CANFD_MTU)
-            channel = None
+        cf, ancillary_data, msg_flags, addr = sock.recvmsg(CANFD_MTU, ancillary_size)
     except socket.error as exc:
         raise can.CanError("Error receiving: %s" % exc)
 
-    can_id, can_dlc, flags, data = dissect_can_frame(cf)
-    # log.debug('Received: can_id=%x, can_dlc=%x, data=%s', can_id, can_dlc, data)
+    if get_channel:
+        channel = addr[0] if isinstance(addr, tuple) else addr
+    else:
+        channel = None
+
+    # The kernel only appends the cumulative drop counter once frames were dropped
+    for level, kind, data in ancillary_data:
+        if (
+            statistics is not None
+            and level == socket.SOL_SOCKET
+            and kind == SO_RXQ_OVFL
+        ):
+            statistics.kernel_dropped = struct.unpack("=I", data[:4])[0]
+
+    # Section 4.7.1: MSG_DONTROUTE: set when the received frame was created on the local host.
+    is_rx = not bool(msg_flags & socket.MSG_DONTROUTE)
 
-    # Fetching the timestamp
+    return _message_from_frame(cf, _get_timestamp(sock), channel, is_rx)
+
+
+def _get_timestamp(sock: socket.socket) -> float:
+    """Fetch the kernel timestamp of the last frame read from the given socket."""
     binary_structure = "@LL"
     res = fcntl.ioctl(sock.fileno(), SIOCGSTAMP, struct.pack(binary_structure, 0, 0))
 
     seconds, microseconds = struct.unpack(binary_structure, res)
-    timestamp = seconds + microseconds * 1e-6
+    return seconds + microseconds * 1e-6
+
+
+def _message_from_frame(
+    cf: bytes, timestamp: float, channel: Optional[str], is_rx: bool
+) -> Message:
+    """Convert a raw ``can_frame`` or ``canfd_frame`` to a :class:`~can.Message`."""
+    can_id, can_dlc, flags, data = dissect_can_frame(cf)
 
     # EXT, RTR, ERR flags -> boolean attributes
     #   /* special address description flags for the CAN_ID */
@@ -548,9 +768,6 @@ def capture_message(
     bitrate_switch = bool(flags & CANFD_BRS)
     error_state_indicator = bool(flags & CANFD_ESI)
 
-    # Section 4.7.1: MSG_DONTROUTE: set when the received frame was created on the local host.
-    is_rx = not bool(msg_flags & socket.MSG_DONTROUTE)
-
     if is_extended_frame_format:
         # log.debug("CAN: Extended")
         # TODO does this depend on SFF or EFF?
@@ -559,7 +776,7 @@ def capture_message(
         # log.debug("CAN: Standard")
         arbitration_id = can_id & 0x000007FF
 
-    msg = Message(
+    return Message(
         timestamp=timestamp,
         channel=channel,
         arbitration_id=arbitration_id,
@@ -574,10 +791,6 @@ def capture_message(
         data=data,
     )
 
-    # log_rx.debug('Received: %s', msg)
-
-    return msg
-
 
 class SocketcanBus(BusABC):
     """A SocketCAN interface to CAN.
@@ -592,6 +805,9 @@ class SocketcanBus(BusABC):
         receive_own_messages: bool = False,
         fd: bool = False,
         can_filters: Optional[CanFilters] = None,
+        receive_buffer_size: Optional[int] = None,
+        send_buffer_size: Optional[int] = None,
+        count_dropped_frames: bool = False,
         **kwargs,
     ) -> None:
         """Creates a new socketcan bus.
@@ -614,14 +830,29 @@ class SocketcanBus(BusABC):
             If CAN-FD frames should be supported.
         :param can_filters:
             See :meth:`can.BusABC.set_filters`.
+        :param receive_buffer_size:
+            The size of the receive buffer of the socket in bytes (``SO_RCVBUF``).
+            A bigger buffer lets the kernel hold more frames while the
+            application is busy. Defaults to the system setting, which also
+            limits the size (see ``net.core.rmem_max``).
+        :param send_buffer_size:
+            The size of the send buffer of the socket in bytes (``SO_SNDBUF``).
+            Defaults to the system setting.
+        :param count_dropped_frames:
+            If the number of frames dropped by the kernel because of a full
+            receive buffer should be counted (``SO_RXQ_OVFL``),
+            see :meth:`get_stats`.
         """
         self.socket = create_socket()
         self.channel = channel
         self.channel_info = "socketcan channel '%s'" % channel
         self._bcm_sockets: Dict[str, socket.socket] = {}
+        self._bcm_rx_socket: Optional[socket.socket] = None
         self._is_filtered = False
         self._task_id = 0
         self._task_id_guard = threading.Lock()
+        self._socketcan_statistics = SocketcanStatistics()
+        self._count_dropped_frames = False
 
         # set the receive_own_messages parameter
         try:
@@ -644,8 +875,41 @@ class SocketcanBus(BusABC):
         except socket.error as error:
             log.error("Could not enable error frames (%s)", error)
 
+        # set the socket buffer sizes
+        if receive_buffer_size is not None:
+            try:
+                self.socket.setsockopt(
+                    socket.SOL_SOCKET, socket.SO_RCVBUF, receive_buffer_size
+                )
+            except socket.error as error:
+                log.error("Could not set receive buffer size (%s)", error)
+        if send_buffer_size is not None:
+            try:
+                self.socket.setsockopt(
+                    socket.SOL_SOCKET, socket.SO_SNDBUF, send_buffer_size
+                )
+            except socket.error as error:
+                log.error("Could not set send buffer size (%s)", error)
+
+        # enable reporting of dropped frames
+        if count_dropped_frames:
+            try:
+                self.socket.setsockopt(socket.SOL_SOCKET, SO_RXQ_OVFL, 1)
+            except socket.error as error:
+                log.error("Could not enable counting of dropped frames (%s)", error)
+            else:
+                self._count_dropped_frames = True
+
         bind_socket(self.socket, channel)
-        kwargs.update({"receive_own_messages": receive_own_messages, "fd": fd})
+        kwargs.update(
+            {
+                "receive_own_messages": receive_own_messages,
+                "fd": fd,
+                "receive_buffer_size": receive_buffer_size,
+                "send_buffer_size": send_buffer_size,
+                "count_dropped_frames": count_dropped_frames,
+            }
+        )
         super().__init__(channel=channel, can_filters=can_filters, **kwargs)
 
     def shutdown(self) -> None:
@@ -654,6 +918,9 @@ class SocketcanBus(BusABC):
         for channel, bcm_socket in self._bcm_sockets.items():
             log.debug("Closing bcm socket for channel %s", channel)
             bcm_socket.close()
+        if self._bcm_rx_socket is not None:
+            log.debug("Closing bcm receive socket")
+            self._bcm_rx_socket.close()
         log.debug("Closing raw can socket")
         self.socket.close()
 
@@ -670,7 +937,10 @@ class SocketcanBus(BusABC):
 
         if ready_receive_sockets:  # not empty
             get_channel = self.channel == ""
-            msg = capture_message(self.socket, get_channel)
+            statistics = (
+                self._socketcan_statistics if self._count_dropped_frames else None
+            )
+            msg = capture_message(self.socket, get_channel, statistics)
             if msg and not msg.channel and self.channel:
                 # Default to our own channel
                 msg.channel = self.channel
@@ -690,16 +960,57 @@ class SocketcanBus(BusABC):
         :raises can.CanError:
             if the message could not be written.
         """
-        log.debug("We've been asked to write a message to the bus")
-        logger_tx = log.getChild("tx")
-        logger_tx.debug("sending: %s", msg)
+        channel = str(msg.channel) if msg.channel else None
+        self._send_frame(build_can_frame(msg), channel, timeout)
+
+    def prepare(self, msg: Message) -> SocketcanPreparedMessage:
+        """Encode a message once for repeated transmission with
+        :meth:`send_prepared`.
 
+        :param msg: The message to prepare.
+
+        :return:
+            A handle holding the encoded frame. Its payload can be changed
+            in place through :attr:`~SocketcanPreparedMessage.data`.
+        """
+        channel = str(msg.channel) if msg.channel else None
+        return SocketcanPreparedMessage(msg, channel)
+
+    def send_prepared(
+        self, prepared: PreparedMessage, timeout: Optional[float] = None
+    ) -> None:
+        """Transmit a message that was prepared with :meth:`prepare`.
+
+        :param prepared: The handle returned by :meth:`prepare`.
+        :param timeout: See :meth:`send`.
+
+        :raises can.CanError:
+            if the message could not be written.
+        """
+        if not isinstance(prepared, SocketcanPreparedMessage):
+            super().send_prepared(prepared, timeout)
+            return
+        try:
+            self._send_frame(prepared.frame, prepared.channel, timeout)
+        except Exception as exc:
+            self._on_send_error(exc)
+            raise
+        if self._trace_hooks.tx or GLOBAL_HOOKS.tx:
+            # the payload may have been changed in the frame since the last call
+            prepared.message.data[:] = prepared.data
+        self._on_sent(prepared.message)
+
+    def _send_frame(
+        self,
+        data: Union[bytes, bytearray],
+        channel: Optional[str],
+        timeout: Optional[float],
+    ) -> None:
         started = time.time()
         # If no timeout is given, poll for availability
         if timeout is None:
             timeout = 0
         time_left = timeout
-        data = build_can_frame(msg)
 
         while time_left >= 0:
             # Wait for write availability
@@ -707,7 +1018,6 @@ class SocketcanBus(BusABC):
             if not ready:
                 # Timeout
                 break
-            channel = str(msg.channel) if msg.channel else None
             sent = self._send_once(data, channel)
             if sent == len(data):
                 return
@@ -717,7 +1027,82 @@ class SocketcanBus(BusABC):
 
         raise can.CanError("Transmit buffer full")
 
-    def _send_once(self, data: bytes, channel: Optional[str] = None) -> int:
+    def send_batch(
+        self, msgs: Iterable[Message], timeout: Optional[float] = None
+    ) -> int:
+        """Transmit many messages with as little overhead as possible.
+
+        All frames are packed into a single buffer up front and then handed
+        to the kernel one after another without waiting for write
+        availability in between. If the transmit queue of the interface
+        overflows (``ENOBUFS``), sending is retried with an exponential
+        back-off until *timeout* expires.
+
+        :param msgs: The messages to transmit, in order.
+        :param timeout:
+            Wait up to this many seconds in total for the transmit queue to
+            accept all frames. If not given, retry until all frames were
+            sent, like :meth:`send` blocks without a timeout.
+
+        :return:
+            The number of messages that were sent. Stops early if a
+            *timeout* is given and the transmit queue did not drain within it.
+
+        :raises can.CanError:
+            if a frame could not be written for any other reason.
+        """
+        msgs = list(msgs)
+        buffer = bytearray()
+        offsets = [0]
+        addresses: List[Optional[Tuple[str]]] = []
+        for msg in msgs:
+            buffer += build_can_frame(msg)
+            offsets.append(len(buffer))
+            if self.channel == "" and msg.channel:
+                # Message must be addressed to a specific channel
+                addresses.append((str(msg.channel),))
+            else:
+                addresses.append(None)
+
+        view = memoryview(buffer)
+        started = time.time()
+        backoff = SEND_BATCH_MIN_BACKOFF
+        sent = 0
+        count = len(addresses)
+        try:
+            while sent < count:
+                frame = view[offsets[sent] : offsets[sent + 1]]
+                address = addresses[sent]
+                try:
+                    if address is None:
+                        self.socket.send(frame)
+                    else:
+                        self.socket.sendto(frame, address)
+                except OSError as exc:
+                    if exc.errno not in (errno.ENOBUFS, errno.EAGAIN):
+                        error = can.CanError("Failed to transmit: %s" % exc)
+                        self._on_send_error(error)
+                        raise error
+                    # The transmit queue is full, give the device time to drain it
+                    if timeout is None:
+                        time.sleep(backoff)
+                    else:
+                        time_left = timeout - (time.time() - started)
+                        if time_left <= 0:
+                            break
+                        time.sleep(min(backoff, time_left))
+                    backoff = min(backoff * 2, SEND_BATCH_MAX_BACKOFF)
+                else:
+                    sent += 1
+                    backoff = SEND_BATCH_MIN_BACKOFF
+        finally:
+            for msg in msgs[:sent]:
+                self._on_sent(msg)
+        return sent
+
+    def _send_once(
+        self, data: Union[bytes, bytearray], channel: Optional[str] = None
+    ) -> int:
         try:
             if self.channel == "" and channel:
                 # Message must be addressed to a specific channel
@@ -773,6 +1158,47 @@ class SocketcanBus(BusABC):
         task = CyclicSendTask(bcm_socket, task_id, msgs, period, duration)
         return task
 
+    def _send_periodic_group_internal(
+        self,
+        tasks: Sequence[Tuple[Sequence[Message], float]],
+        duration: Optional[float] = None,
+    ) -> CyclicSendTaskGroup:
+        """Set up many Broadcast Manager tasks in one pass.
+
+        All ``TX_SETUP`` commands are encoded up front and then written to
+        the BCM socket back to back. Unlike :meth:`_send_periodic_internal`
+        no ``TX_READ`` round trip is made per task: the task identifiers are
+        handed out by this bus and can not be in use already. If the kernel
+        rejects a command, the tasks set up so far are deleted again.
+
+        :raises can.CanError:
+            If the Broadcast Manager refused to set up a task.
+        """
+        cyclic_tasks = [
+            CyclicSendTask(
+                self._get_bcm_socket(
+                    str(msgs[0].channel) if msgs[0].channel else self.channel
+                ),
+                self._get_next_task_id(),
+                msgs,
+                period,
+                duration,
+                autostart=False,
+            )
+            for msgs, period in tasks
+        ]
+        commands = [task._build_tx_setup(task.messages) for task in cyclic_tasks]
+
+        log.debug("Sending %d BCM TX_SETUP commands", len(commands))
+        for index, (task, command) in enumerate(zip(cyclic_tasks, commands)):
+            try:
+                send_bcm(task.bcm_socket, command)
+            except Exception:
+                for started_task in cyclic_tasks[:index]:
+                    started_task.stop()
+                raise
+        return CyclicSendTaskGroup(cyclic_tasks)
+
     def _get_next_task_id(self) -> int:
         with self._task_id_guard:
             self._task_id = (self._task_id + 1) % (2 ** 32 - 1)
@@ -783,6 +1209,142 @@ class SocketcanBus(BusABC):
             self._bcm_sockets[channel] = create_bcm_socket(self.channel)
         return self._bcm_sockets[channel]
 
+    def get_stats(self) -> SocketcanStatistics:
+        """Retrieves the bus statistics.
+
+        Use like so:
+
+        >>> stats = bus.get_stats()
+        >>> print(stats)
+        kernel_dropped: 0, receive_buffer_size: 212992, send_buffer_size: 212992
+
+        :returns: a snapshot of the bus statistics.
+        """
+        stats = SocketcanStatistics()
+        stats.kernel_dropped = self._socketcan_statistics.kernel_dropped
+        try:
+            stats.receive_buffer_size = self.socket.getsockopt(
+                socket.SOL_SOCKET, socket.SO_RCVBUF
+            )
+            stats.send_buffer_size = self.socket.getsockopt(
+                socket.SOL_SOCKET, socket.SO_SNDBUF
+            )
+        except socket.error as error:
+            log.error("Could not read socket buffer sizes (%s)", error)
+        return stats
+
+    def _get_driver_statistics(self) -> Dict[str, Any]:
+        stats = self.get_stats()
+        return {
+            "kernel_dropped": stats.kernel_dropped,
+            "receive_buffer_size": stats.receive_buffer_size,
+            "send_buffer_size": stats.send_buffer_size,
+        }
+
+    def subscribe_bcm(
+        self,
+        arbitration_id: int,
+        is_extended_id: bool = False,
+        data_mask: Optional[can.typechecking.CanData] = None,
+        timeout: float = 0.0,
+        throttle: float = 0.0,
+        only_changes: bool = True,
+        check_dlc: bool = True,
+        is_fd: bool = False,
+    ) -> BcmReceiveTask:
+        """Let the kernel's Broadcast Manager monitor a CAN ID.
+
+        Instead of passing every single frame to user space, the kernel
+        compares the payload of each received frame with the last one and
+        only reports frames whose content changed. It can additionally watch
+        for the absence of cyclic frames. The resulting notifications are read
+        with :meth:`recv_bcm`, independently of :meth:`~can.BusABC.recv`.
+
+        :param arbitration_id:
+            The CAN ID to monitor.
+        :param is_extended_id:
+            If the CAN ID is an extended (29 bit) one.
+        :param data_mask:
+            Only changes in the bits set in this mask are reported.
+            Defaults to the whole payload.
+        :param timeout:
+            Report a timeout if no frame was received for this many seconds.
+            Zero disables timeout monitoring.
+        :param throttle:
+            Report changes at most once per this many seconds.
+            Zero disables throttling.
+        :param only_changes:
+            If False, every frame with the given ID is reported and
+            *data_mask* is ignored (``RX_FILTER_ID``).
+        :param check_dlc:
+            If a changed DLC should be reported as well.
+        :param is_fd:
+            If CAN-FD frames are monitored.
+
+        :raises can.CanError:
+            If the Broadcast Manager refused the setup.
+
+        :return:
+            A :class:`BcmReceiveTask`. Its :meth:`~BcmReceiveTask.stop`
+            method ends the monitoring.
+        """
+        return BcmReceiveTask(
+            self._get_bcm_rx_socket(),
+            arbitration_id,
+            is_extended_id=is_extended_id,
+            data_mask=data_mask,
+            timeout=timeout,
+            throttle=throttle,
+            only_changes=only_changes,
+            check_dlc=check_dlc,
+            is_fd=is_fd,
+        )
+
+    def recv_bcm(self, timeout: Optional[float] = None) -> Optional[BcmReceiveEvent]:
+        """Wait for a notification of any task set up with :meth:`subscribe_bcm`.
+
+        :param timeout:
+            Seconds to wait for a notification or None to wait indefinitely.
+
+        :return:
+            None on timeout or a :class:`BcmReceiveEvent`.
+
+        :raises can.CanError:
+            If reading from the Broadcast Manager failed.
+        """
+        bcm_socket = self._get_bcm_rx_socket()
+        try:
+            ready_receive_sockets, _, _ = select.select([bcm_socket], [], [], timeout)
+            if not ready_receive_sockets:
+                return None
+            data = bcm_socket.recv(ctypes.sizeof(BcmMsgHead) + CANFD_MTU)
+        except OSError as exc:
+            raise can.CanError(f"Failed to receive from BCM: {exc}")
+
+        header, frames = dissect_bcm_message(data)
+        if header.can_id & CAN_EFF_FLAG:
+            arbitration_id = header.can_id & MSK_ARBID
+        else:
+            arbitration_id = header.can_id & MAX_11_BIT_ID
+
+        if header.nframes:
+            timestamp = _get_timestamp(bcm_socket)
+            mtu = CANFD_MTU if header.flags & CAN_FD_FRAME else CAN_MTU
+            message: Optional[Message] = _message_from_frame(
+                frames[:mtu], timestamp, self.channel or None, True
+            )
+        else:
+            # notifications without a frame (like timeouts) carry no timestamp
+            timestamp = time.time()
+            message = None
+
+        return BcmReceiveEvent(header.opcode, arbitration_id, timestamp, message)
+
+    def _get_bcm_rx_socket(self) -> socket.socket:
+        if self._bcm_rx_socket is None:
+            self._bcm_rx_socket = create_bcm_socket(self.channel)
+        return self._bcm_rx_socket
+
     def _apply_filters(self, filters: Optional[can.typechecking.CanFilters]) -> None:
         try:
             self.socket.setsockopt(SOL_CAN_RAW, CAN_RAW_FILTER, pack_filters(filters))
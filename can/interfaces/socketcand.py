@@ -0,0 +1,281 @@
+"""
+This module implements a client for `socketcand <https://github.com/linux-can/socketcand>`__,
+which makes a CAN bus available over TCP with an ASCII protocol. It connects
+to socketcand on Linux hosts as well as to :mod:`can.server`.
+
+The functions which encode and decode the commands of the protocol are shared
+with :mod:`can.server`.
+"""
+
+import logging
+import select
+import socket
+import time
+from collections import deque
+from typing import Any, Deque, Iterable, List, Optional, Tuple
+
+from can import BusABC, CanError, Message
+
+log = logging.getLogger(__name__)
+
+#: The TCP port socketcand listens on by default
+DEFAULT_PORT = 29536
+
+# the byte values as two hexadecimal digits
+_HEX = [f"{value:02X}" for value in range(256)]
+
+
+def split_commands(buffer: bytearray) -> List[List[str]]:
+    """Remove the complete commands from the start of *buffer*.
+
+    Commands are written in angle brackets, like ``< send 123 1 11 >``.
+    Anything between them is ignored.
+
+    :param buffer: the received bytes, the incomplete last command is kept
+    :return: the commands, each split into its words
+    """
+    commands = []
+    end = 0
+    while True:
+        start = buffer.find(b"<", end)
+        if start < 0:
+            end = len(buffer)
+            break
+        stop = buffer.find(b">", start)
+        if stop < 0:
+            end = start
+            break
+        commands.append(buffer[start + 1 : stop].decode("ascii", "replace").split())
+        end = stop + 1
+    del buffer[:end]
+    return commands
+
+
+def format_frame(msg: Message, command: str = "frame") -> str:
+    """Format a received message like ``< frame 123 1.000000 11 22 >``.
+
+    The arbitration ID has eight digits if it is extended, else three.
+    """
+    if msg.is_extended_id:
+        arbitration_id = f"{msg.arbitration_id:08X}"
+    else:
+        arbitration_id = f"{msg.arbitration_id:03X}"
+    data = "".join([" " + _HEX[byte] for byte in msg.data])
+    return f"< {command} {arbitration_id} {msg.timestamp:.6f}{data} >"
+
+
+def format_send(msg: Message) -> str:
+    """Format a message to send like ``< send 123 2 11 22 >``."""
+    if msg.is_extended_id:
+        arbitration_id = f"{msg.arbitration_id:08X}"
+    else:
+        arbitration_id = f"{msg.arbitration_id:03X}"
+    data = "".join([" " + _HEX[byte] for byte in msg.data])
+    return f"< send {arbitration_id} {len(msg.data)}{data} >"
+
+
+def parse_id(word: str) -> Tuple[int, bool]:
+    """Parse an arbitration ID, which is extended if it has more than three digits.
+
+    :return: the arbitration ID and whether it is extended
+    :raises ValueError: if this is no valid ID
+    """
+    arbitration_id = int(word, 16)
+    is_extended_id = len(word) > 3
+    if arbitration_id >= (0x20000000 if is_extended_id else 0x800):
+        raise ValueError(f"Invalid arbitration ID {word}")
+    return arbitration_id, is_extended_id
+
+
+def parse_frame(words: List[str], channel: Any = None) -> Message:
+    """Parse the words of a ``frame`` or ``error`` command.
+
+    :raises ValueError: if the command is malformed
+    """
+    if len(words) < 3:
+        raise ValueError("Too few arguments")
+    arbitration_id, is_extended_id = parse_id(words[1])
+    return Message(
+        timestamp=float(words[2]),
+        arbitration_id=arbitration_id,
+        is_extended_id=is_extended_id,
+        is_error_frame=words[0] == "error",
+        data=bytes.fromhex("".join(words[3:])),
+        channel=channel,
+    )
+
+
+def parse_send(words: List[str]) -> Message:
+    """Parse the arguments ``<id> <dlc> <data>*`` of a ``send`` command.
+
+    :raises ValueError: if the arguments are malformed
+    """
+    if len(words) < 2:
+        raise ValueError("Too few arguments")
+    arbitration_id, is_extended_id = parse_id(words[0])
+    dlc = int(words[1])
+    data = bytes.fromhex("".join(words[2:]))
+    if dlc != len(data) or dlc > 8:
+        raise ValueError(f"Invalid data length {dlc}")
+    return Message(
+        arbitration_id=arbitration_id,
+        is_extended_id=is_extended_id,
+        data=data,
+        is_rx=False,
+    )
+
+
+class SocketcandBus(BusABC):
+    """A CAN bus of a socketcand server, used in raw mode.
+
+    All frames of the remote bus are received, filters are applied locally.
+    The protocol only transports classic data frames, received error frames
+    are passed on but remote frames and CAN FD frames can not be sent.
+    """
+
+    def __init__(
+        self,
+        channel: str = "can0",
+        host: str = "127.0.0.1",
+        port: int = DEFAULT_PORT,
+        connect_timeout: float = 5.0,
+        **kwargs: Any,
+    ) -> None:
+        """
+        :param channel:
+            The name of the bus on the server, like ``"can0"``.
+        :param host:
+            The host name or IP address of the server.
+        :param port:
+            The TCP port of the server.
+        :param connect_timeout:
+            Seconds to wait for the connection and the replies of the server
+            while it is opened.
+        :raises can.CanError: if the server could not be connected or refused
+                              to open the bus
+        """
+        super().__init__(channel=channel, **kwargs)
+        self.channel = channel
+        self.channel_info = f"socketcand {channel} on {host}:{port}"
+        self._rx_buffer = bytearray()
+        self._rx_queue: Deque[Message] = deque()
+
+        try:
+            self._socket = socket.create_connection(
+                (host, int(port)), timeout=connect_timeout
+            )
+        except OSError as exc:
+            raise CanError(f"Could not connect to {host}:{port}: {exc}") from exc
+        try:
+            self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self._expect("hi")
+            self._socket.sendall(f"< open {channel} >".encode("ascii"))
+            self._expect("ok")
+            self._socket.sendall(b"< rawmode >")
+            self._expect("ok")
+        except (OSError, CanError) as exc:
+            self._socket.close()
+            if isinstance(exc, CanError):
+                raise
+            raise CanError(f"Could not open {channel}: {exc}") from exc
+        self._socket.settimeout(None)
+
+    def _expect(self, reply: str) -> None:
+        """Wait for the reply of the server while opening the bus."""
+        commands: List[List[str]] = []
+        while not commands:
+            data = self._socket.recv(4096)
+            if not data:
+                raise CanError("The server closed the connection")
+            self._rx_buffer += data
+            commands = split_commands(self._rx_buffer)
+        if len(commands) > 1:
+            raise CanError(f"Unexpected reply {commands[1]}")
+        if commands[0] != [reply]:
+            raise CanError(f"The server replied {' '.join(commands[0])}")
+
+    def _recv_internal(
+        self, timeout: Optional[float]
+    ) -> Tuple[Optional[Message], bool]:
+        msgs, already_filtered = self._recv_batch_internal(1, timeout)
+        return (msgs[0] if msgs else None), already_filtered
+
+    def _recv_batch_internal(
+        self, max_messages: int, timeout: Optional[float]
+    ) -> Tuple[List[Message], bool]:
+        queue = self._rx_queue
+        end_time = None if timeout is None else time.perf_counter() + timeout
+        while not queue:
+            if end_time is None:
+                remaining = None
+            else:
+                remaining = max(end_time - time.perf_counter(), 0.0)
+            if not select.select([self._socket], [], [], remaining)[0]:
+                return [], False
+            self._read()
+            if remaining == 0.0:
+                break
+
+        count = min(max_messages, len(queue))
+        return [queue.popleft() for _ in range(count)], False
+
+    def _read(self) -> None:
+        """Read and parse everything the server has sent."""
+        buffer = self._rx_buffer
+        try:
+            data = self._socket.recv(65536)
+            while data:
+                buffer += data
+                if not select.select([self._socket], [], [], 0)[0]:
+                    break
+                data = self._socket.recv(65536)
+        except OSError as exc:
+            raise CanError(f"Failed to receive: {exc}") from exc
+        if not data:
+            raise CanError("The server closed the connection")
+
+        queue = self._rx_queue
+        for words in split_commands(buffer):
+            if words and words[0] in ("frame", "error"):
+                try:
+                    queue.append(parse_frame(words, self.channel))
+                except ValueError as exc:
+                    log.warning("Ignoring invalid frame %s: %s", words, exc)
+            else:
+                log.warning("The server sent %s", " ".join(words))
+
+    def send(self, msg: Message, timeout: Optional[float] = None) -> None:
+        """Send a message.
+
+        :param timeout: Ignored, the server does not report if it was sent.
+        :raises can.CanError: if the message could not be sent
+        """
+        self._send(format_send(msg))
+
+    def send_batch(
+        self, msgs: Iterable[Message], timeout: Optional[float] = None
+    ) -> int:
+        """Send the messages to the server at once.
+
+        :param timeout: Ignored, the server does not report if they were sent.
+        :return: The number of messages that were sent, which is all of them.
+        :raises can.CanError: if the messages could not be sent
+        """
+        msgs = list(msgs)
+        try:
+            self._send("".join([format_send(msg) for msg in msgs]))
+        except CanError as exc:
+            self._on_send_error(exc)
+            raise
+        for msg in msgs:
+            self._on_sent(msg)
+        return len(msgs)
+
+    def _send(self, commands: str) -> None:
+        try:
+            self._socket.sendall(commands.encode("ascii"))
+        except OSError as exc:
+            raise CanError(f"Failed to send: {exc}") from exc
+
+    def shutdown(self) -> None:
+        self._socket.close()
@@ -1,4 +1,5 @@
 import logging
+from collections import deque
 from threading import Event
 
 from can import BusABC, BusState, Message
@@ -23,11 +24,28 @@ class Ucan(UcanServer):
         self._msg_received_event.set()
 
     def read_can_msg(self, channel, count, timeout):
+        """
+        Reads the pending CAN messages, waiting for the first one if none is pending.
+
+        :param int channel: CAN channel to read from.
+        :param int count:
+            The maximum number of CAN messages to read, or None to read all pending messages.
+        :param float timeout: Seconds to wait for a message, or None to wait indefinitely.
+        :return:
+            Tuple with list of CAN message/s received and the CAN channel where the read CAN
+            messages came from, or (None, False) if the timeout expired.
+        """
         self._msg_received_event.clear()
-        if self.get_msg_pending(channel, PendingFlags.PENDING_FLAG_RX_DLL) == 0:
+        pending = self.get_msg_pending(channel, PendingFlags.PENDING_FLAG_RX_DLL)
+        if pending == 0:
             if not self._msg_received_event.wait(timeout):
                 return None, False
-        return super().read_can_msg(channel, 1)
+            pending = self.get_msg_pending(channel, PendingFlags.PENDING_FLAG_RX_DLL)
+        # the callback may fire before the message is counted as pending
+        pending = max(pending, 1)
+        if count is not None:
+            pending = min(pending, count)
+        return super().read_can_msg(channel, pending)
 
 
 class UcanBus(BusABC):
@@ -131,23 +149,40 @@ class UcanBus(BusABC):
             self._ucan.get_baudrate_message(self.BITRATES[bitrate]),
         )
         self._is_filtered = False
+        # messages that were read from the driver but not returned yet
+        self._rx_queue = deque()
 
         super().__init__(channel=channel, can_filters=can_filters, **kwargs)
 
     def _recv_internal(self, timeout):
-        message, _ = self._ucan.read_can_msg(self.channel, 1, timeout)
-        if not message:
-            return None, False
-
-        msg = Message(
-            timestamp=float(message[0].time) / 1000.0,
-            is_remote_frame=bool(message[0].frame_format & MsgFrameFormat.MSG_FF_RTR),
-            is_extended_id=bool(message[0].frame_format & MsgFrameFormat.MSG_FF_EXT),
-            arbitration_id=message[0].id,
-            dlc=len(message[0].data),
-            data=message[0].data,
+        msgs, filtered = self._recv_batch_internal(1, timeout)
+        return (msgs[0] if msgs else None), filtered
+
+    def _recv_batch_internal(self, max_messages, timeout):
+        rx_queue = self._rx_queue
+        if not rx_queue:
+            # read everything that is pending with a single call, so the
+            # following calls are served from the queue without waiting
+            # for the receive event again
+            messages, _ = self._ucan.read_can_msg(self.channel, None, timeout)
+            if not messages:
+                return [], self._is_filtered
+            rx_queue.extend(self._message_from_can_msg(message) for message in messages)
+
+        count = min(max_messages, len(rx_queue))
+        return [rx_queue.popleft() for _ in range(count)], self._is_filtered
+
+    @staticmethod
+    def _message_from_can_msg(message):
+        data = message.data
+        return Message(
+            timestamp=float(message.time) / 1000.0,
+            is_remote_frame=bool(message.frame_format & MsgFrameFormat.MSG_FF_RTR),
+            is_extended_id=bool(message.frame_format & MsgFrameFormat.MSG_FF_EXT),
+            arbitration_id=message.id,
+            dlc=len(data),
+            data=data,
         )
-        return msg, self._is_filtered
 
     def send(self, msg, timeout=None):
         """
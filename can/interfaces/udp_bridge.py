@@ -0,0 +1,448 @@
+"""
+This module implements an interface which bridges CAN buses over UDP, using
+the wire format of `cannelloni <https://github.com/mguentner/cannelloni>`__.
+
+Many frames are packed into each datagram, which makes it suitable for
+busy buses, and it can talk to cannelloni running on another host.
+"""
+
+import errno
+import logging
+import select
+import socket
+import struct
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple, Union
+
+from can import BusABC, CanError, Message
+
+log = logging.getLogger(__name__)
+
+#: The version of the cannelloni protocol which is implemented
+PROTOCOL_VERSION = 2
+#: The operation code of datagrams which carry frames
+OP_DATA = 0
+
+#: The header of a datagram: the version, the operation code, the sequence
+#: number and the number of frames, in network byte order
+DATAGRAM_HEADER = struct.Struct("!BBBH")
+# the CAN ID with the flags and the length of a frame
+_FRAME_HEADER = struct.Struct("!IB")
+
+#: The default size of the datagrams, which fits into an Ethernet frame
+DEFAULT_DATAGRAM_SIZE = 1472
+
+# the flags of the CAN ID and the CAN FD flags, as defined by SocketCAN
+CAN_EFF_FLAG = 0x80000000
+CAN_RTR_FLAG = 0x40000000
+CAN_ERR_FLAG = 0x20000000
+CANFD_BRS = 0x01
+CANFD_ESI = 0x02
+# marks a CAN FD frame in the length byte, followed by a byte with its flags
+CANFD_FRAME = 0x80
+
+Address = Union[str, Tuple[str, int]]
+
+
+def _parse_address(address: Address) -> Tuple[Any, ...]:
+    """Resolve a ``"host:port"`` string or a ``(host, port)`` tuple.
+
+    IPv6 addresses are written in brackets, like ``"[::1]:20000"``.
+
+    :return: the address family and the socket address
+    """
+    if isinstance(address, str):
+        host, sep, port = address.rpartition(":")
+        if not sep:
+            raise ValueError(f"Expected an address like 'host:port', got {address!r}")
+        host = host.strip("[]")
+    else:
+        host, port = address[0], str(address[1])
+    family, _, _, _, sockaddr = socket.getaddrinfo(
+        host or None, int(port), type=socket.SOCK_DGRAM, flags=socket.AI_PASSIVE
+    )[0]
+    return family, sockaddr
+
+
+def encode_frame(msg: Message) -> bytes:
+    """Encode a message as cannelloni frame.
+
+    :param msg: the message, only its CAN fields are encoded
+    :return: the frame, without the header of the datagram
+    """
+    can_id = msg.arbitration_id
+    if msg.is_extended_id:
+        can_id |= CAN_EFF_FLAG
+    if msg.is_remote_frame:
+        can_id |= CAN_RTR_FLAG
+    if msg.is_error_frame:
+        can_id |= CAN_ERR_FLAG
+
+    if msg.is_fd:
+        flags = (CANFD_BRS if msg.bitrate_switch else 0) | (
+            CANFD_ESI if msg.error_state_indicator else 0
+        )
+        header = _FRAME_HEADER.pack(can_id, msg.dlc | CANFD_FRAME) + bytes((flags,))
+    else:
+        header = _FRAME_HEADER.pack(can_id, msg.dlc)
+    if msg.is_remote_frame:
+        # remote frames have a length but no data
+        return header
+    return header + bytes(msg.data[: msg.dlc])
+
+
+def decode_frames(
+    datagram: bytes, timestamp: float = 0.0, channel: Any = None
+) -> Tuple[int, List[Message]]:
+    """Decode the frames of a cannelloni datagram.
+
+    :param datagram: the received datagram, including its header
+    :param timestamp: the timestamp of the messages
+    :param channel: the channel of the messages
+    :return: the sequence number of the datagram and its messages
+    :raises ValueError:
+        if this is not a data datagram of the supported protocol version,
+        or if it is truncated
+    """
+    if len(datagram) < DATAGRAM_HEADER.size:
+        raise ValueError("The datagram is too short")
+    version, op_code, sequence, count = DATAGRAM_HEADER.unpack_from(datagram)
+    if version != PROTOCOL_VERSION or op_code != OP_DATA:
+        raise ValueError(f"Unsupported datagram version {version}, type {op_code}")
+
+    unpack_from = _FRAME_HEADER.unpack_from
+    header_size = _FRAME_HEADER.size
+    end = len(datagram)
+    pos = DATAGRAM_HEADER.size
+    msgs = []
+    for _ in range(count):
+        if pos + header_size > end:
+            raise ValueError("The datagram is truncated")
+        can_id, length = unpack_from(datagram, pos)
+        pos += header_size
+
+        is_fd = bool(length & CANFD_FRAME)
+        flags = 0
+        if is_fd:
+            length &= ~CANFD_FRAME
+            if pos >= end:
+                raise ValueError("The datagram is truncated")
+            flags = datagram[pos]
+            pos += 1
+
+        is_extended_id = bool(can_id & CAN_EFF_FLAG)
+        is_remote_frame = bool(can_id & CAN_RTR_FLAG)
+        if is_remote_frame:
+            data = b""
+        else:
+            data = datagram[pos : pos + length]
+            if len(data) < length:
+                raise ValueError("The datagram is truncated")
+            pos += length
+
+        msgs.append(
+            Message(
+                timestamp=timestamp,
+                arbitration_id=can_id & (0x1FFFFFFF if is_extended_id else 0x7FF),
+                is_extended_id=is_extended_id,
+                is_remote_frame=is_remote_frame,
+                is_error_frame=bool(can_id & CAN_ERR_FLAG),
+                is_fd=is_fd,
+                bitrate_switch=bool(flags & CANFD_BRS),
+                error_state_indicator=bool(flags & CANFD_ESI),
+                dlc=length,
+                data=data,
+                channel=channel,
+                check=False,
+            )
+        )
+    return sequence, msgs
+
+
+class UdpBridgeBus(BusABC):
+    """A CAN bus bridged over UDP, compatible with cannelloni.
+
+    Frames sent with :meth:`send` are collected in a datagram for up to
+    *flush_timeout* seconds, or until it is full, and :meth:`send_batch`
+    sends its frames in as few datagrams as possible. Every datagram has a
+    sequence number, so the receiver can count lost datagrams, see
+    :attr:`~can.BusABC.statistics`.
+
+    The frames carry no timestamps, received messages are stamped with the
+    time their datagram was read.
+    """
+
+    def __init__(
+        self,
+        channel: Address,
+        remote: Optional[Address] = None,
+        flush_timeout: float = 0.0,
+        max_datagram_size: int = DEFAULT_DATAGRAM_SIZE,
+        **kwargs: Any,
+    ) -> None:
+        """
+        :param channel:
+            The local address to receive datagrams on, like ``"0.0.0.0:20000"``.
+            Use port 0 to let the operating system choose a free port.
+        :param remote:
+            The address to send datagrams to, like ``"192.168.0.2:20000"``.
+            If it is not given, datagrams are sent to where the last
+            datagram was received from.
+        :param flush_timeout:
+            The maximum time in seconds frames sent with :meth:`send` are
+            held back to be sent together with the following ones. With
+            the default of 0, every frame is sent immediately.
+        :param max_datagram_size:
+            The maximum size of the datagrams in bytes.
+        """
+        super().__init__(channel=channel, **kwargs)
+
+        if int(max_datagram_size) < DATAGRAM_HEADER.size + _FRAME_HEADER.size + 65:
+            raise ValueError("max_datagram_size is too small for a CAN FD frame")
+        self.flush_timeout = float(flush_timeout)
+        self.max_datagram_size = int(max_datagram_size)
+
+        family, local_address = _parse_address(channel)
+        self._remote = None if remote is None else _parse_address(remote)[1]
+        # where the last datagram was received from
+        self._peer: Any = None
+        self._socket = socket.socket(family, socket.SOCK_DGRAM)
+        try:
+            self._socket.bind(local_address)
+        except OSError as exc:
+            self._socket.close()
+            raise CanError(f"Could not bind to {channel}: {exc}") from exc
+        self._socket.setblocking(False)
+        self.address = self._socket.getsockname()
+        self.channel = channel
+        self.channel_info = f"UDP bridge on {self.address[0]}:{self.address[1]}"
+
+        self._rx_queue: Deque[Message] = deque()
+        # an empty datagram was sent to the socket and was not read yet
+        self._woken_up = False
+        # the next expected sequence number of every sender
+        self._rx_sequences: Dict[Any, int] = {}
+        self._counters = {
+            "datagrams_sent": 0,
+            "datagrams_received": 0,
+            "datagrams_lost": 0,
+            "datagrams_invalid": 0,
+        }
+
+        self._tx_sequence = 0
+        self._tx_frames: List[bytes] = []
+        self._tx_size = DATAGRAM_HEADER.size
+        self._tx_deadline = 0.0
+        self._tx_condition = threading.Condition()
+        self._open = True
+        self._flush_thread: Optional[threading.Thread] = None
+        if flush_timeout > 0:
+            self._flush_thread = threading.Thread(
+                target=self._flush_periodically,
+                name=f"can.udp_bridge flush {self.channel_info}",
+                daemon=True,
+            )
+            self._flush_thread.start()
+
+    def _recv_internal(
+        self, timeout: Optional[float]
+    ) -> Tuple[Optional[Message], bool]:
+        msgs, already_filtered = self._recv_batch_internal(1, timeout)
+        return (msgs[0] if msgs else None), already_filtered
+
+    def _recv_batch_internal(
+        self, max_messages: int, timeout: Optional[float]
+    ) -> Tuple[List[Message], bool]:
+        queue = self._rx_queue
+        if not queue:
+            if not select.select([self._socket], [], [], timeout)[0]:
+                return [], False
+            self._read_datagrams()
+
+        count = min(max_messages, len(queue))
+        msgs = [queue.popleft() for _ in range(count)]
+        if queue and not self._woken_up:
+            # select() on fileno() must not wait for the next datagram
+            # while frames of the last one are still queued, one empty
+            # datagram is enough until the socket is read again
+            self._wake_up()
+        return msgs, False
+
+    def _read_datagrams(self) -> None:
+        """Read and decode all datagrams which have been received."""
+        queue = self._rx_queue
+        counters = self._counters
+        timestamp = time.time()
+        # the socket is read until it is empty, including the wake up datagram
+        self._woken_up = False
+        while True:
+            try:
+                datagram, sender = self._socket.recvfrom(65535)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as exc:
+                if exc.errno == errno.ECONNRESET:
+                    # Windows reports an ICMP port unreachable of a previous send
+                    continue
+                raise CanError(f"Failed to receive a datagram: {exc}") from exc
+            if not datagram:
+                # sent by _wake_up()
+                continue
+
+            try:
+                sequence, msgs = decode_frames(datagram, timestamp, self.channel)
+            except ValueError as exc:
+                log.debug("Ignoring a datagram from %s: %s", sender, exc)
+                counters["datagrams_invalid"] += 1
+                continue
+
+            counters["datagrams_received"] += 1
+            expected = self._rx_sequences.get(sender)
+            if expected is not None and sequence != expected:
+                lost = (sequence - expected) & 0xFF
+                log.debug("Lost %d datagram(s) from %s", lost, sender)
+                counters["datagrams_lost"] += lost
+            self._rx_sequences[sender] = (sequence + 1) & 0xFF
+            self._peer = sender
+            queue.extend(msgs)
+
+    def _wake_up(self) -> None:
+        """Make the socket readable by sending an empty datagram to it."""
+        host, port = self.address[:2]
+        if host in ("0.0.0.0", "::"):
+            host = "127.0.0.1" if self._socket.family == socket.AF_INET else "::1"
+        try:
+            self._socket.sendto(b"", (host, port))
+        except OSError as exc:
+            log.debug("Could not wake up the socket: %s", exc)
+        else:
+            self._woken_up = True
+
+    def send(self, msg: Message, timeout: Optional[float] = None) -> None:
+        """Send a message, possibly together with the following ones.
+
+        :param timeout: Ignored, sending datagrams does not block.
+        :raises can.CanError: if a datagram could not be sent
+        """
+        frame = encode_frame(msg)
+        with self._tx_condition:
+            if self._tx_size + len(frame) > self.max_datagram_size:
+                self._flush_locked()
+            self._tx_frames.append(frame)
+            self._tx_size += len(frame)
+            if self.flush_timeout <= 0:
+                self._flush_locked()
+            elif len(self._tx_frames) == 1:
+                self._tx_deadline = time.perf_counter() + self.flush_timeout
+                self._tx_condition.notify()
+
+    def send_batch(
+        self, msgs: Iterable[Message], timeout: Optional[float] = None
+    ) -> int:
+        """Send the messages in as few datagrams as possible.
+
+        The frames which are held back by :meth:`send` are sent first.
+
+        :param timeout: Ignored, sending datagrams does not block.
+        :return: The number of messages that were sent, which is all of them.
+        :raises can.CanError: if a datagram could not be sent
+        """
+        sent = 0
+        # the messages of the datagram which is being filled
+        pending: List[Message] = []
+        with self._tx_condition:
+            try:
+                for msg in msgs:
+                    frame = encode_frame(msg)
+                    if self._tx_size + len(frame) > self.max_datagram_size:
+                        self._flush_locked()
+                        sent += self._sent(pending)
+                    self._tx_frames.append(frame)
+                    self._tx_size += len(frame)
+                    pending.append(msg)
+                self._flush_locked()
+            except CanError as exc:
+                self._on_send_error(exc)
+                raise
+            sent += self._sent(pending)
+        return sent
+
+    def _sent(self, msgs: List[Message]) -> int:
+        for msg in msgs:
+            self._on_sent(msg)
+        count = len(msgs)
+        del msgs[:]
+        return count
+
+    def flush(self) -> None:
+        """Send the frames which are held back now.
+
+        :raises can.CanError: if the datagram could not be sent
+        """
+        with self._tx_condition:
+            self._flush_locked()
+
+    def flush_tx_buffer(self) -> None:
+        """Discard the frames which are held back."""
+        with self._tx_condition:
+            self._tx_frames = []
+            self._tx_size = DATAGRAM_HEADER.size
+
+    def _flush_locked(self) -> None:
+        frames = self._tx_frames
+        if not frames:
+            return
+        self._tx_frames = []
+        self._tx_size = DATAGRAM_HEADER.size
+
+        remote = self._remote or self._peer
+        if remote is None:
+            raise CanError("The remote address is not known yet")
+        header = DATAGRAM_HEADER.pack(
+            PROTOCOL_VERSION, OP_DATA, self._tx_sequence, len(frames)
+        )
+        self._tx_sequence = (self._tx_sequence + 1) & 0xFF
+        try:
+            self._socket.sendto(header + b"".join(frames), remote)
+        except OSError as exc:
+            raise CanError(f"Failed to send a datagram: {exc}") from exc
+        self._counters["datagrams_sent"] += 1
+
+    def _flush_periodically(self) -> None:
+        condition = self._tx_condition
+        with condition:
+            while self._open:
+                if not self._tx_frames:
+                    condition.wait()
+                    continue
+                remaining = self._tx_deadline - time.perf_counter()
+                if remaining > 0:
+                    condition.wait(remaining)
+                    continue
+                try:
+                    self._flush_locked()
+                except CanError as exc:
+                    self._on_send_error(exc)
+                    log.warning("Dropped frames: %s", exc)
+
+    def _get_driver_statistics(self) -> Dict[str, Any]:
+        return dict(self._counters)
+
+    def fileno(self) -> int:
+        return self._socket.fileno()
+
+    def shutdown(self) -> None:
+        """Send the frames which are held back and close the socket."""
+        with self._tx_condition:
+            self._open = False
+            self._tx_condition.notify()
+            try:
+                self._flush_locked()
+            except CanError as exc:
+                self._on_send_error(exc)
+                log.warning("Dropped frames: %s", exc)
+        if self._flush_thread is not None:
+            self._flush_thread.join()
+        self._socket.close()
@@ -6,6 +6,7 @@ import logging
 from ctypes import byref
 
 from can import BusABC, Message, CanError
+from can.interfaces.poller import DriverPoller
 from .usb2canabstractionlayer import *
 from .serial_selector import find_serial_devices
 
@@ -96,7 +97,7 @@ class Usb2canBus(BusABC):
         self.can = Usb2CanAbstractionLayer(dll)
 
         # get the serial number of the device
-        device_id = kwargs.get("serial", d=channel)
+        device_id = kwargs.get("serial", channel)
 
         # search for a serial number if the device_id is None or empty
         if not device_id:
@@ -111,10 +112,19 @@ class Usb2canBus(BusABC):
         self.channel_info = "USB2CAN device {}".format(device_id)
 
         connector = "{}; {}".format(device_id, baudrate)
-        self.handle = self.can.open(connector, flags_t)
+        self.handle = self.can.open(connector, flags)
+
+        self._message_rx = CanalMsg()
 
         super().__init__(
-            channel=channel, dll=dll, flags_t=flags_t, bitrate=bitrate, *args, **kwargs
+            channel=channel, dll=dll, flags=flags, bitrate=bitrate, *args, **kwargs
+        )
+
+        self._poller = DriverPoller(
+            self._read_messages,
+            name="can.usb2can receiver {}".format(device_id),
+            blocking=True,
+            max_interval=0.1,
         )
 
     def send(self, msg, timeout=None):
@@ -128,26 +138,36 @@ class Usb2canBus(BusABC):
         if status != CANAL_ERROR_SUCCESS:
             raise CanError("could not send message: status == {}".format(status))
 
-    def _recv_internal(self, timeout):
+    def _read_messages(self, timeout):
+        # called by the poller thread, waits for the first message and then
+        # reads until the receive queue is empty
+        messagerx = self._message_rx
+        msgs = []
+        status = self.can.blocking_receive(
+            self.handle, byref(messagerx), int(timeout * 1000)
+        )
+        while status == CANAL_ERROR_SUCCESS:
+            msgs.append(message_convert_rx(messagerx))
+            status = self.can.receive(self.handle, byref(messagerx))
 
-        messagerx = CanalMsg()
+        if status not in (CANAL_ERROR_RCV_EMPTY, CANAL_ERROR_TIMEOUT):
+            log.error("Canal Error %s", status)
+        return msgs
 
-        if timeout == 0:
-            status = self.can.receive(self.handle, byref(messagerx))
+    def _recv_internal(self, timeout):
+        msgs = self._poller.get(1, timeout)
+        return (msgs[0] if msgs else None), False
 
-        else:
-            time = 0 if timeout is None else int(timeout * 1000)
-            status = self.can.blocking_receive(self.handle, byref(messagerx), time)
+    def _recv_batch_internal(self, max_messages, timeout):
+        return self._poller.get(max_messages, timeout), False
 
-        if status == CANAL_ERROR_SUCCESS:
-            rx = message_convert_rx(messagerx)
-        elif status in (CANAL_ERROR_RCV_EMPTY, CANAL_ERROR_TIMEOUT):
-            rx = None
-        else:
-            log.error("Canal Error %s", status)
-            rx = None
+    def fileno(self):
+        """A file descriptor which is readable while received messages are queued."""
+        return self._poller.fileno()
 
-        return rx, False
+    def _get_driver_statistics(self):
+        """Report the received messages dropped because nobody fetched them."""
+        return {"dropped": self._poller.dropped}
 
     def shutdown(self):
         """
@@ -155,6 +175,7 @@ class Usb2canBus(BusABC):
 
         :raise cam.CanError: is closing the connection did not work
         """
+        self._poller.stop()
         status = self.can.close(self.handle)
 
         if status != CANAL_ERROR_SUCCESS:
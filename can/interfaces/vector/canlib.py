@@ -50,6 +50,9 @@ try:
 except Exception as exc:
     LOG.warning("Could not import vxlapi: %s", exc)
 
+#: The maximum number of events read with a single call of ``xlReceive``
+RX_EVENT_COUNT = 100
+
 
 class VectorBus(BusABC):
     """The CAN Bus implemented for the Vector interface."""
@@ -303,6 +306,11 @@ class VectorBus(BusABC):
         except VectorError:
             self._time_offset = 0.0
 
+        # Receive buffers, reused for every read
+        self._rx_fd_event = xlclass.XLcanRxEvent()
+        self._rx_events = (xlclass.XLevent * RX_EVENT_COUNT)()
+        self._rx_event_count = ctypes.c_uint()
+
         self._is_filtered = False
         super().__init__(channel=channel, can_filters=can_filters, **kwargs)
 
@@ -357,25 +365,25 @@ class VectorBus(BusABC):
     def _recv_internal(
         self, timeout: Optional[float]
     ) -> Tuple[Optional[Message], bool]:
+        msgs, already_filtered = self._recv_batch_internal(1, timeout)
+        return (msgs[0] if msgs else None), already_filtered
+
+    def _recv_batch_internal(
+        self, max_messages: int, timeout: Optional[float]
+    ) -> Tuple[List[Message], bool]:
         end_time = time.time() + timeout if timeout is not None else None
 
         while True:
-            try:
-                if self.fd:
-                    msg = self._recv_canfd()
-                else:
-                    msg = self._recv_can()
-
-            except VectorError as exc:
-                if exc.error_code != xldefine.XL_Status.XL_ERR_QUEUE_IS_EMPTY:
-                    raise
+            if self.fd:
+                msgs = self._recv_canfd(max_messages)
             else:
-                if msg:
-                    return msg, self._is_filtered
+                msgs = self._recv_can(max_messages)
+            if msgs:
+                return msgs, self._is_filtered
 
             # if no message was received, wait or return on timeout
             if end_time is not None and time.time() > end_time:
-                return None, self._is_filtered
+                return [], self._is_filtered
 
             if HAS_EVENTS:
                 # Wait for receive event to occur
@@ -389,10 +397,29 @@ class VectorBus(BusABC):
                 # Wait a short time until we try again
                 time.sleep(self.poll_interval)
 
-    def _recv_canfd(self) -> Optional[Message]:
-        xl_can_rx_event = xlclass.XLcanRxEvent()
-        xldriver.xlCanReceive(self.port_handle, xl_can_rx_event)
+    def _recv_canfd(self, max_messages: int) -> List[Message]:
+        """Read up to *max_messages* events with ``xlCanReceive``.
 
+        The driver returns one event per call, which is read into the same
+        :class:`~can.interfaces.vector.xlclass.XLcanRxEvent` every time.
+        """
+        msgs = []
+        xl_can_rx_event = self._rx_fd_event
+        for _ in range(max_messages):
+            try:
+                xldriver.xlCanReceive(self.port_handle, xl_can_rx_event)
+            except VectorError as exc:
+                if exc.error_code != xldefine.XL_Status.XL_ERR_QUEUE_IS_EMPTY:
+                    raise
+                break
+            msg = self._message_from_canfd_event(xl_can_rx_event)
+            if msg is not None:
+                msgs.append(msg)
+        return msgs
+
+    def _message_from_canfd_event(
+        self, xl_can_rx_event: xlclass.XLcanRxEvent
+    ) -> Optional[Message]:
         if xl_can_rx_event.tag == xldefine.XL_CANFD_RX_EventTags.XL_CAN_EV_TAG_RX_OK:
             is_rx = True
             data_struct = xl_can_rx_event.tagData.canRxOkMsg
@@ -401,7 +428,7 @@ class VectorBus(BusABC):
             data_struct = xl_can_rx_event.tagData.canTxOkMsg
         else:
             self.handle_canfd_event(xl_can_rx_event)
-            return
+            return None
 
         msg_id = data_struct.canId
         dlc = dlc2len(data_struct.dlc)
@@ -435,14 +462,31 @@ class VectorBus(BusABC):
         )
         return msg
 
-    def _recv_can(self) -> Optional[Message]:
-        xl_event = xlclass.XLevent()
-        event_count = ctypes.c_uint(1)
-        xldriver.xlReceive(self.port_handle, event_count, xl_event)
+    def _recv_can(self, max_messages: int) -> List[Message]:
+        """Read up to *max_messages* events with a single ``xlReceive`` call.
 
+        The events are read into an array that is allocated once per bus.
+        """
+        event_count = self._rx_event_count
+        event_count.value = min(max_messages, len(self._rx_events))
+        try:
+            xldriver.xlReceive(self.port_handle, event_count, self._rx_events)
+        except VectorError as exc:
+            if exc.error_code != xldefine.XL_Status.XL_ERR_QUEUE_IS_EMPTY:
+                raise
+            return []
+
+        msgs = []
+        for xl_event in self._rx_events[: event_count.value]:
+            msg = self._message_from_can_event(xl_event)
+            if msg is not None:
+                msgs.append(msg)
+        return msgs
+
+    def _message_from_can_event(self, xl_event: xlclass.XLevent) -> Optional[Message]:
         if xl_event.tag != xldefine.XL_EventTags.XL_RECEIVE_MSG:
             self.handle_can_event(xl_event)
-            return
+            return None
 
         msg_id = xl_event.tagData.msg.id
         dlc = xl_event.tagData.msg.dlc
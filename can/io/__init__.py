@@ -3,14 +3,50 @@ Read and write CAN bus messages using a range of Readers
 and Writers based off the file extension.
 """
 
-# Generic
-from .logger import Logger, BaseRotatingLogger, SizedRotatingLogger
-from .player import LogReader, MessageSync
-
-# Format specific
-from .asc import ASCWriter, ASCReader
-from .blf import BLFReader, BLFWriter
-from .canutils import CanutilsLogReader, CanutilsLogWriter
-from .csv import CSVWriter, CSVReader
-from .sqlite import SqliteReader, SqliteWriter
-from .printer import Printer
+import importlib
+import sys
+from typing import Any, List
+
+# The readers and writers are only imported when they are accessed for the
+# first time, since some of them depend on modules which are slow to import.
+# name => module
+_LAZY_IMPORTS = {
+    # Generic
+    "Logger": ".logger",
+    "BaseRotatingLogger": ".logger",
+    "SizedRotatingLogger": ".logger",
+    "LogReader": ".player",
+    "MessageSync": ".player",
+    # Format specific
+    "ASCWriter": ".asc",
+    "ASCReader": ".asc",
+    "BLFReader": ".blf",
+    "BLFWriter": ".blf",
+    "BinaryReader": ".binary",
+    "BinaryWriter": ".binary",
+    "CanutilsLogReader": ".canutils",
+    "CanutilsLogWriter": ".canutils",
+    "CSVWriter": ".csv",
+    "CSVReader": ".csv",
+    "SqliteReader": ".sqlite",
+    "SqliteWriter": ".sqlite",
+    "Printer": ".printer",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+if sys.version_info < (3, 7):
+    # module level __getattr__ is not supported (PEP 562)
+    for _name in _LAZY_IMPORTS:
+        __getattr__(_name)
@@ -0,0 +1,127 @@
+"""
+This module works with the compact binary records of
+:meth:`can.Message.to_bytes` (*.canbin). The records are written one after
+the other without any framing, so the format can be streamed through pipes,
+for example from ``python -m can.logger -f -`` to another program.
+"""
+
+import logging
+import sys
+from typing import BinaryIO, Generator, List, Optional
+
+from can.message import Message, _unpack_messages
+from can.typechecking import AcceptedIOType
+from .generic import FileIOMessageWriter, MessageReader
+
+log = logging.getLogger("can.io.binary")
+
+#: The first bytes of a binary log, the last byte is the version of the format
+MAGIC = b"CANBIN\x00\x01"
+
+# read at most this many bytes at once
+READ_SIZE = 64 * 1024
+
+
+class BinaryWriter(FileIOMessageWriter):
+    """Writes messages as binary records to a file or a pipe."""
+
+    file: BinaryIO
+
+    def __init__(
+        self, file: AcceptedIOType = None, append: bool = False, flush: bool = False
+    ) -> None:
+        """
+        :param file: a path-like object or a file-like object to write to,
+                     or None to write to the standard output (stdout).
+                     If this is a file-like object, is has to be opened in
+                     binary write mode.
+        :param append: if set to `True` messages are appended to the file,
+                       else the file is truncated
+        :param flush: if set to `True` the file is flushed after every
+                      message or batch of messages, so a program reading
+                      from a pipe gets them without delay. This is always
+                      done when writing to stdout.
+        """
+        self._close_file = file is not None
+        self._flush = flush or file is None
+        if file is None:
+            file = sys.stdout.buffer
+        super().__init__(file, mode="ab" if append else "wb")
+
+        try:
+            empty = not append or self.file.tell() == 0
+        except OSError:
+            # pipes can not tell their position, they are never appended to
+            empty = True
+        if empty:
+            self.file.write(MAGIC)
+
+    def on_message_received(self, msg: Message) -> None:
+        self.file.write(msg.to_bytes())
+        if self._flush:
+            self.file.flush()
+
+    def on_messages_received(self, msgs: List[Message]) -> None:
+        self.file.write(b"".join([msg.to_bytes() for msg in msgs]))
+        if self._flush:
+            self.file.flush()
+
+    def stop(self) -> None:
+        """Flushes the file and closes it, unless it is stdout."""
+        if self._close_file:
+            super().stop()
+        else:
+            self.file.flush()
+
+
+class BinaryReader(MessageReader):
+    """Iterates over the messages of a binary log, from a file or a pipe.
+
+    Reading from a pipe returns the messages as soon as they were received,
+    it ends when the writing end of the pipe is closed.
+    """
+
+    file: BinaryIO
+
+    def __init__(self, file: AcceptedIOType = None) -> None:
+        """
+        :param file: a path-like object or a file-like object to read from,
+                     or None to read from the standard input (stdin).
+                     If this is a file-like object, is has to be opened in
+                     binary read mode.
+        """
+        self._close_file = file is not None
+        if file is None:
+            file = sys.stdin.buffer
+        super().__init__(file, mode="rb")
+
+    def __iter__(self) -> Generator[Message, None, None]:
+        # read1() returns what is available instead of waiting for all bytes
+        read = getattr(self.file, "read1", self.file.read)
+        buffer = bytearray()
+        while len(buffer) < len(MAGIC):
+            data = read(len(MAGIC) - len(buffer))
+            if not data:
+                break
+            buffer += data
+        if buffer and buffer != MAGIC:
+            raise ValueError("The file is not a binary CAN log")
+        del buffer[:]
+
+        while True:
+            data = read(READ_SIZE)
+            if not data:
+                break
+            buffer += data
+            msgs, consumed = _unpack_messages(buffer)
+            del buffer[:consumed]
+            yield from msgs
+
+        if buffer:
+            log.warning("Ignoring the incomplete last record")
+        self.stop()
+
+    def stop(self) -> None:
+        """Closes the file, unless it is stdin."""
+        if self._close_file:
+            super().stop()
@@ -7,13 +7,14 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Optional, Callable
 
-from pkg_resources import iter_entry_points
 from can.typechecking import StringPathLike
+from can.util import _get_entry_points
 
 from ..message import Message
 from ..listener import Listener
 from .generic import BaseIOHandler, FileIOMessageWriter
 from .asc import ASCWriter
+from .binary import BinaryWriter
 from .blf import BLFWriter
 from .canutils import CanutilsLogWriter
 from .csv import CSVWriter
@@ -28,6 +29,7 @@ class Logger(BaseIOHandler, Listener):  # pylint: disable=abstract-method
     The format is determined from the file format which can be one of:
       * .asc: :class:`can.ASCWriter`
       * .blf :class:`can.BLFWriter`
+      * .canbin :class:`can.BinaryWriter`
       * .csv: :class:`can.CSVWriter`
       * .db: :class:`can.SqliteWriter`
       * .log :class:`can.CanutilsLogWriter`
@@ -46,6 +48,7 @@ class Logger(BaseIOHandler, Listener):  # pylint: disable=abstract-method
     message_writers = {
         ".asc": ASCWriter,
         ".blf": BLFWriter,
+        ".canbin": BinaryWriter,
         ".csv": CSVWriter,
         ".db": SqliteWriter,
         ".log": CanutilsLogWriter,
@@ -67,7 +70,7 @@ class Logger(BaseIOHandler, Listener):  # pylint: disable=abstract-method
             Logger.message_writers.update(
                 {
                     writer.name: writer.load()
-                    for writer in iter_entry_points("can.io.message_writer")
+                    for writer in _get_entry_points("can.io.message_writer")
                 }
             )
             Logger.fetched_plugins = True
@@ -112,6 +115,7 @@ class BaseRotatingLogger(Listener, ABC):
     supported_writers = {
         ".asc": ASCWriter,
         ".blf": BLFWriter,
+        ".canbin": BinaryWriter,
         ".csv": CSVWriter,
         ".log": CanutilsLogWriter,
         ".txt": Printer,
@@ -8,13 +8,14 @@ import pathlib
 from time import time, sleep
 import typing
 
-from pkg_resources import iter_entry_points
-
 if typing.TYPE_CHECKING:
     import can
 
+from can.util import _get_entry_points
+
 from .generic import BaseIOHandler
 from .asc import ASCReader
+from .binary import BinaryReader
 from .blf import BLFReader
 from .canutils import CanutilsLogReader
 from .csv import CSVReader
@@ -28,6 +29,7 @@ class LogReader(BaseIOHandler):
     The format is determined from the file format which can be one of:
       * .asc
       * .blf
+      * .canbin
       * .csv
       * .db
       * .log
@@ -50,6 +52,7 @@ class LogReader(BaseIOHandler):
     message_readers = {
         ".asc": ASCReader,
         ".blf": BLFReader,
+        ".canbin": BinaryReader,
         ".csv": CSVReader,
         ".db": SqliteReader,
         ".log": CanutilsLogReader,
@@ -65,7 +68,7 @@ class LogReader(BaseIOHandler):
             LogReader.message_readers.update(
                 {
                     reader.name: reader.load()
-                    for reader in iter_entry_points("can.io.message_reader")
+                    for reader in _get_entry_points("can.io.message_reader")
                 }
             )
             LogReader.fetched_plugins = True
@@ -2,7 +2,7 @@
 This module contains the implementation of `can.Listener` and some readers.
 """
 
-from typing import AsyncIterator, Awaitable, Optional
+from typing import AsyncIterator, Awaitable, List, Optional
 
 from can.message import Message
 from can.bus import BusABC
@@ -46,6 +46,19 @@ class Listener(metaclass=ABCMeta):
     def __call__(self, msg: Message):
         self.on_message_received(msg)
 
+    def on_messages_received(self, msgs: List[Message]):
+        """This method is called by a :class:`~can.Notifier` to handle
+        several messages at once, if the listener overrides it.
+
+        The default implementation calls :meth:`on_message_received` for
+        each message. Listeners which can handle a batch of messages faster
+        than one message after the other override this method.
+
+        :param msgs: the delivered messages, in order
+        """
+        for msg in msgs:
+            self.on_message_received(msg)
+
     def on_error(self, exc: Exception):
         """This method is called to handle any exception in the receive thread.
 
@@ -104,6 +117,18 @@ class BufferedReader(Listener):
         else:
             self.buffer.put(msg)
 
+    def on_messages_received(self, msgs: List[Message]):
+        """Append several messages to the buffer.
+
+        :raises: BufferError
+            if the reader has already been stopped
+        """
+        if self.is_stopped:
+            raise RuntimeError("reader has already been stopped")
+        put = self.buffer.put
+        for msg in msgs:
+            put(msg)
+
     def get_message(self, timeout: float = 0.5) -> Optional[Message]:
         """
         Attempts to retrieve the latest message received by the instance. If no message is
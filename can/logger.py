@@ -33,7 +33,9 @@ def main():
         "-f",
         "--file_name",
         dest="log_file",
-        help="""Path and base log filename, for supported types see can.Logger.""",
+        help="""Path and base log filename, for supported types see can.Logger.
+        Use "-" to write binary records (see can.BinaryWriter) to stdout,
+        e.g. to pipe them into another program.""",
         default=None,
     )
 
@@ -120,9 +122,13 @@ def main():
     ]
     can.set_logging_level(logging_level_name)
 
+    # keep stdout free for the messages when they are piped
+    to_stdout = results.log_file == "-"
+    info_file = sys.stderr if to_stdout else sys.stdout
+
     can_filters = []
     if results.filter:
-        print(f"Adding filter(s): {results.filter}")
+        print(f"Adding filter(s): {results.filter}", file=info_file)
         for filt in results.filter:
             if ":" in filt:
                 _ = filt.split(":")
@@ -149,10 +155,12 @@ def main():
     elif results.passive:
         bus.state = BusState.PASSIVE
 
-    print(f"Connected to {bus.__class__.__name__}: {bus.channel_info}")
-    print(f"Can Logger (Started on {datetime.now()})")
+    print(f"Connected to {bus.__class__.__name__}: {bus.channel_info}", file=info_file)
+    print(f"Can Logger (Started on {datetime.now()})", file=info_file)
 
-    if results.file_size:
+    if to_stdout:
+        logger = can.BinaryWriter()
+    elif results.file_size:
         logger = SizedRotatingLogger(
             base_filename=results.log_file, max_bytes=results.file_size
         )
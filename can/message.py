@@ -6,13 +6,29 @@ This module contains the implementation of :class:`can.Message`.
     starting with Python 3.7.
 """
 
-from typing import Optional, Union
+import struct
+from typing import Iterable, List, Optional, Tuple, Type, Union
 
 from . import typechecking
 
 from copy import deepcopy
 from math import isinf, isnan
 
+#: The header of the binary record of a message, see :meth:`Message.to_bytes`.
+#: The fields are the timestamp, the arbitration ID, the flags, the DLC, the
+#: length of the data and the length of the channel, all little-endian.
+RECORD_HEADER = struct.Struct("<dIBBBB")
+
+_FLAG_EXTENDED_ID = 0x01
+_FLAG_REMOTE_FRAME = 0x02
+_FLAG_ERROR_FRAME = 0x04
+_FLAG_FD = 0x08
+_FLAG_RX = 0x10
+_FLAG_BITRATE_SWITCH = 0x20
+_FLAG_ERROR_STATE_INDICATOR = 0x40
+# the channel is an integer, stored as decimal string
+_FLAG_CHANNEL_INT = 0x80
+
 
 class Message:
     """
@@ -194,6 +210,94 @@ class Message:
     def __bytes__(self) -> bytes:
         return bytes(self.data)
 
+    def __reduce_ex__(self, protocol):
+        if type(self) is not Message:
+            # subclasses may have further attributes, pickle them as usual
+            return super().__reduce_ex__(protocol)
+        try:
+            return Message.from_bytes, (self.to_bytes(),)
+        except (TypeError, ValueError):
+            # the channel or some field can not be stored in a record
+            return (
+                Message,
+                (
+                    self.timestamp,
+                    self.arbitration_id,
+                    self.is_extended_id,
+                    self.is_remote_frame,
+                    self.is_error_frame,
+                    self.channel,
+                    self.dlc,
+                    self.data,
+                    self.is_fd,
+                    self.is_rx,
+                    self.bitrate_switch,
+                    self.error_state_indicator,
+                ),
+            )
+
+    def to_bytes(self) -> bytes:
+        """Serialize the message to a compact binary record.
+
+        The record consists of the :data:`~can.message.RECORD_HEADER`, the
+        data and the channel, encoded as UTF-8. It is read with
+        :meth:`from_bytes`.
+
+        :raises TypeError: if the channel is neither None, an int nor a str
+        :raises ValueError:
+            if a field does not fit into the record, e.g. a negative
+            arbitration ID or a channel name longer than 255 bytes
+        """
+        flags = (
+            (_FLAG_EXTENDED_ID if self.is_extended_id else 0)
+            | (_FLAG_REMOTE_FRAME if self.is_remote_frame else 0)
+            | (_FLAG_ERROR_FRAME if self.is_error_frame else 0)
+            | (_FLAG_FD if self.is_fd else 0)
+            | (_FLAG_RX if self.is_rx else 0)
+            | (_FLAG_BITRATE_SWITCH if self.bitrate_switch else 0)
+            | (_FLAG_ERROR_STATE_INDICATOR if self.error_state_indicator else 0)
+        )
+        channel = self.channel
+        if channel is None:
+            channel_bytes = b""
+        elif isinstance(channel, int):
+            flags |= _FLAG_CHANNEL_INT
+            channel_bytes = str(int(channel)).encode("ascii")
+        elif isinstance(channel, str):
+            channel_bytes = channel.encode("utf-8")
+        else:
+            raise TypeError(
+                "Channels of type {} can not be serialized".format(type(channel))
+            )
+        data = bytes(self.data)
+        try:
+            header = RECORD_HEADER.pack(
+                self.timestamp,
+                self.arbitration_id,
+                flags,
+                self.dlc,
+                len(data),
+                len(channel_bytes),
+            )
+        except struct.error as error:
+            raise ValueError("Can not serialize {!r}: {}".format(self, error)) from None
+        return header + data + channel_bytes
+
+    @classmethod
+    def from_bytes(cls, record: bytes) -> "Message":
+        """Create a message from a record written by :meth:`to_bytes`.
+
+        An empty channel name is read as None.
+
+        :raises ValueError: if *record* is not exactly one record
+        """
+        msg, end = _unpack_record(record, 0, cls)
+        if end != len(record):
+            raise ValueError(
+                "Expected a record of {} bytes, got {} bytes".format(end, len(record))
+            )
+        return msg
+
     def __copy__(self) -> "Message":
         new = Message(
             timestamp=self.timestamp,
@@ -331,3 +435,89 @@ class Message:
                 and self.error_state_indicator == other.error_state_indicator
             )
         )
+
+
+def _message_from_record(
+    header: tuple,
+    buffer: Union[bytes, bytearray],
+    data_start: int,
+    cls: Type[Message] = Message,
+) -> Message:
+    timestamp, arbitration_id, flags, dlc, data_length, channel_length = header
+    channel_start = data_start + data_length
+    end = channel_start + channel_length
+
+    channel: Optional[typechecking.Channel] = None
+    if flags & _FLAG_CHANNEL_INT:
+        channel = int(buffer[channel_start:end])
+    elif channel_length:
+        channel = bytes(buffer[channel_start:end]).decode("utf-8")
+    return cls(
+        timestamp=timestamp,
+        arbitration_id=arbitration_id,
+        is_extended_id=bool(flags & _FLAG_EXTENDED_ID),
+        is_remote_frame=bool(flags & _FLAG_REMOTE_FRAME),
+        is_error_frame=bool(flags & _FLAG_ERROR_FRAME),
+        channel=channel,
+        dlc=dlc,
+        data=buffer[data_start:channel_start],
+        is_fd=bool(flags & _FLAG_FD),
+        is_rx=bool(flags & _FLAG_RX),
+        bitrate_switch=bool(flags & _FLAG_BITRATE_SWITCH),
+        error_state_indicator=bool(flags & _FLAG_ERROR_STATE_INDICATOR),
+    )
+
+
+def _unpack_record(
+    buffer: bytes, offset: int, cls: Type[Message] = Message
+) -> Tuple[Message, int]:
+    """Unpack the record at *offset*, return the message and the end of the record."""
+    try:
+        header = RECORD_HEADER.unpack_from(buffer, offset)
+    except struct.error:
+        raise ValueError("Incomplete message record") from None
+    data_start = offset + RECORD_HEADER.size
+    end = data_start + header[4] + header[5]
+    if len(buffer) < end:
+        raise ValueError("Incomplete message record")
+    return _message_from_record(header, buffer, data_start, cls), end
+
+
+def _unpack_messages(buffer: Union[bytes, bytearray]) -> Tuple[List[Message], int]:
+    """Unpack the complete records in *buffer*.
+
+    :return: the messages and the number of bytes they used
+    """
+    msgs = []
+    offset = 0
+    unpack_from = RECORD_HEADER.unpack_from
+    header_size = RECORD_HEADER.size
+    size = len(buffer)
+    while size - offset >= header_size:
+        header = unpack_from(buffer, offset)
+        data_start = offset + header_size
+        end = data_start + header[4] + header[5]
+        if end > size:
+            break
+        msgs.append(_message_from_record(header, buffer, data_start))
+        offset = end
+    return msgs, offset
+
+
+def pack_messages(msgs: Iterable[Message]) -> bytes:
+    """Serialize several messages, see :meth:`Message.to_bytes`.
+
+    :return: the records of all messages, one after the other
+    """
+    return b"".join([msg.to_bytes() for msg in msgs])
+
+
+def unpack_messages(buffer: bytes) -> List[Message]:
+    """Create the messages from records written by :func:`pack_messages`.
+
+    :raises ValueError: if the last record is incomplete
+    """
+    msgs, end = _unpack_messages(buffer)
+    if end != len(buffer):
+        raise ValueError("Incomplete message record")
+    return msgs
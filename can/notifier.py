@@ -2,7 +2,8 @@
 This module contains the implementation of :class:`~can.Notifier`.
 """
 
-from typing import Iterable, List, Optional, Union
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 from can.bus import BusABC
 from can.listener import Listener
@@ -15,6 +16,134 @@ import asyncio
 
 logger = logging.getLogger("can.Notifier")
 
+#: The upper bounds in seconds of the buckets of
+#: :attr:`ListenerStatistics.histogram`
+LATENCY_BUCKETS = (1e-5, 1e-4, 1e-3, 1e-2, 1e-1)
+
+
+class ListenerStatistics:
+    """Timing of the calls of a :class:`Notifier` to one of its listeners."""
+
+    def __init__(self, listener: Any):
+        #: The listener that was called
+        self.listener = listener
+        #: The number of calls, a batch of messages passed to
+        #: :meth:`~can.Listener.on_messages_received` counts as one call
+        self.calls = 0
+        #: The number of messages passed to the listener
+        self.messages = 0
+        #: The total time spent in the listener in seconds
+        self.total_time = 0.0
+        #: The longest call in seconds
+        self.max_time = 0.0
+        #: The number of calls per duration. The bucket at index ``i`` counts
+        #: the calls that took at most ``LATENCY_BUCKETS[i]`` seconds (and more
+        #: than the previous bound), the last bucket all longer calls.
+        self.histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    @property
+    def name(self) -> str:
+        """A name for the listener to use in reports."""
+        listener = self.listener
+        return getattr(listener, "__qualname__", type(listener).__name__)
+
+    @property
+    def mean_time(self) -> float:
+        """The mean duration of a call in seconds."""
+        return self.total_time / self.calls if self.calls else 0.0
+
+    def add(self, duration: float, messages: int = 1) -> None:
+        """Record a call that took *duration* seconds to handle *messages*."""
+        self.calls += 1
+        self.messages += messages
+        self.total_time += duration
+        if duration > self.max_time:
+            self.max_time = duration
+        self.histogram[bisect_left(LATENCY_BUCKETS, duration)] += 1
+
+    def __str__(self) -> str:
+        return "{}: {} calls, {} messages, mean {:.1f} us, max {:.1f} us".format(
+            self.name,
+            self.calls,
+            self.messages,
+            1e6 * self.mean_time,
+            1e6 * self.max_time,
+        )
+
+
+class ReaderStatistics:
+    """How a receive thread of a :class:`Notifier` spent its time."""
+
+    def __init__(self, bus: BusABC):
+        #: The bus the thread reads from
+        self.bus = bus
+        #: The number of messages received
+        self.messages = 0
+        #: Seconds spent waiting in :meth:`~can.BusABC.recv`
+        self.idle_time = 0.0
+        #: Seconds spent passing the messages to the listeners
+        self.busy_time = 0.0
+        self._last_recv_end: Optional[float] = None
+
+    @property
+    def utilization(self) -> float:
+        """The fraction of the time the thread was busy, from 0 to 1. If it
+        approaches 1, the listeners cannot keep up with the bus."""
+        total = self.idle_time + self.busy_time
+        return self.busy_time / total if total else 0.0
+
+    def __str__(self) -> str:
+        return "{}: {} messages, {:.1%} busy".format(
+            self.bus.channel_info, self.messages, self.utilization
+        )
+
+
+class NotifierStatistics:
+    """The timing collected by an instrumented :class:`Notifier`, see
+    :attr:`Notifier.statistics`."""
+
+    def __init__(self) -> None:
+        # id(listener) => statistics, since listeners do not need to be hashable
+        self._listeners: Dict[int, ListenerStatistics] = {}
+        #: The statistics of every receive thread
+        self.readers: List[ReaderStatistics] = []
+
+    @property
+    def listeners(self) -> List[ListenerStatistics]:
+        """The statistics of every listener that was called."""
+        return list(self._listeners.values())
+
+    def get(self, listener: Any) -> Optional[ListenerStatistics]:
+        """Return the statistics of *listener*, or None if it was not called yet."""
+        statistics = self._listeners.get(id(listener))
+        if statistics is not None and statistics.listener is listener:
+            return statistics
+        return None
+
+    def _for_listener(self, listener: Any) -> ListenerStatistics:
+        statistics = self._listeners.get(id(listener))
+        if statistics is None or statistics.listener is not listener:
+            statistics = self._listeners[id(listener)] = ListenerStatistics(listener)
+        return statistics
+
+    def reset(self) -> None:
+        """Discard the collected timing."""
+        self._listeners.clear()
+        for reader in self.readers:
+            reader.__init__(reader.bus)  # type: ignore
+
+    def __str__(self) -> str:
+        return "; ".join(str(item) for item in self.readers + self.listeners)
+
+
+def _handles_batches(callback: Any) -> bool:
+    """Tell whether *callback* is a listener which implements its own
+    :meth:`~can.Listener.on_messages_received`."""
+    return (
+        isinstance(callback, Listener)
+        and type(callback).on_messages_received is not Listener.on_messages_received
+    )
+
 
 class Notifier:
     def __init__(
@@ -23,6 +152,9 @@ class Notifier:
         listeners: Iterable[Listener],
         timeout: float = 1.0,
         loop: Optional[asyncio.AbstractEventLoop] = None,
+        instrument: bool = False,
+        log_interval: Optional[float] = None,
+        max_batch_size: int = 100,
     ):
         """Manages the distribution of :class:`can.Message` instances to listeners.
 
@@ -38,15 +170,34 @@ class Notifier:
         :param listeners: An iterable of :class:`~can.Listener`
         :param timeout: An optional maximum number of seconds to wait for any message.
         :param loop: An :mod:`asyncio` event loop to schedule listeners in.
+        :param instrument:
+            Measure how long every listener takes and how busy the receive
+            threads are, see :attr:`statistics`.
+        :param log_interval:
+            If given, log a summary of the :attr:`statistics` at level INFO
+            every this many seconds. Implies *instrument*.
+        :param max_batch_size:
+            The maximum number of messages read with one call to
+            :meth:`~can.BusABC.recv_batch` and passed on together to
+            listeners which implement :meth:`~can.Listener.on_messages_received`.
         """
         self.listeners = list(listeners)
         self.bus = bus
         self.timeout = timeout
+        self.max_batch_size = max_batch_size
         self._loop = loop
 
         #: Exception raised in thread
         self.exception: Optional[Exception] = None
 
+        #: The timing of the listeners and receive threads if the notifier
+        #: was created with ``instrument=True``, else None
+        self.statistics: Optional[NotifierStatistics] = None
+        if instrument or log_interval is not None:
+            self.statistics = NotifierStatistics()
+        self._log_interval = log_interval
+        self._next_log_time = time.perf_counter() + (log_interval or 0)
+
         self._running = True
         self._lock = threading.Lock()
 
@@ -105,18 +256,27 @@ class Notifier:
                 listener.stop()
 
     def _rx_thread(self, bus: BusABC):
-        msg = None
+        msgs: List[Message]
+        reader = None
+        if self.statistics is not None:
+            reader = ReaderStatistics(bus)
+            self.statistics.readers.append(reader)
         try:
             while self._running:
-                if msg is not None:
+                if reader is None:
+                    msgs = bus.recv_batch(self.max_batch_size, self.timeout)
+                else:
+                    msgs = self._timed_recv(bus, reader)
+                # messages which were already read are dispatched even if the
+                # notifier is being stopped, before the listeners are stopped
+                if msgs:
                     with self._lock:
                         if self._loop is not None:
                             self._loop.call_soon_threadsafe(
-                                self._on_message_received, msg
+                                self._on_messages_received, msgs
                             )
                         else:
-                            self._on_message_received(msg)
-                msg = bus.recv(self.timeout)
+                            self._on_messages_received(msgs)
         except Exception as exc:
             self.exception = exc
             if self._loop is not None:
@@ -126,16 +286,59 @@ class Notifier:
                 raise
 
     def _on_message_available(self, bus: BusABC):
-        msg = bus.recv(0)
-        if msg is not None:
-            self._on_message_received(msg)
+        msgs = bus.recv_batch(self.max_batch_size, 0)
+        if msgs:
+            self._on_messages_received(msgs)
+
+    def _timed_recv(self, bus: BusABC, reader: ReaderStatistics) -> List[Message]:
+        # everything since the end of the last call was spent dispatching
+        started = time.perf_counter()
+        if reader._last_recv_end is not None:
+            reader.busy_time += started - reader._last_recv_end
+        msgs = bus.recv_batch(self.max_batch_size, self.timeout)
+        reader._last_recv_end = end = time.perf_counter()
+        reader.idle_time += end - started
+        reader.messages += len(msgs)
+        if self._log_interval is not None and end >= self._next_log_time:
+            self._next_log_time = end + self._log_interval
+            logger.info("Notifier statistics: %s", self.statistics)
+        return msgs
 
     def _on_message_received(self, msg: Message):
+        self._on_messages_received([msg])
+
+    def _on_messages_received(self, msgs: List[Message]):
+        if self.statistics is not None:
+            self._on_messages_received_timed(msgs, self.statistics)
+            return
         for callback in self.listeners:
-            res = callback(msg)
-            if self._loop is not None and asyncio.iscoroutine(res):
-                # Schedule coroutine
-                self._loop.create_task(res)
+            if _handles_batches(callback):
+                self._schedule(callback.on_messages_received(msgs))
+            else:
+                for msg in msgs:
+                    self._schedule(callback(msg))
+
+    def _on_messages_received_timed(
+        self, msgs: List[Message], statistics: NotifierStatistics
+    ):
+        for callback in self.listeners:
+            listener_statistics = statistics._for_listener(callback)
+            if _handles_batches(callback):
+                started = time.perf_counter()
+                res = callback.on_messages_received(msgs)
+                listener_statistics.add(time.perf_counter() - started, len(msgs))
+                self._schedule(res)
+            else:
+                for msg in msgs:
+                    started = time.perf_counter()
+                    res = callback(msg)
+                    listener_statistics.add(time.perf_counter() - started)
+                    self._schedule(res)
+
+    def _schedule(self, res: Any):
+        if self._loop is not None and asyncio.iscoroutine(res):
+            # Schedule coroutine
+            self._loop.create_task(res)
 
     def _on_error(self, exc: Exception) -> bool:
         listeners_with_on_error = [
@@ -96,7 +96,8 @@ def main():
         "infile",
         metavar="input-file",
         type=str,
-        help="The file to replay. For supported types see can.LogReader.",
+        help="""The file to replay. For supported types see can.LogReader.
+        Use "-" to read binary records (see can.BinaryReader) from stdin.""",
     )
 
     # print help message when no arguments were given
@@ -128,7 +129,10 @@ def main():
         config["data_bitrate"] = results.data_bitrate
     bus = Bus(results.channel, **config)
 
-    reader = LogReader(results.infile)
+    if results.infile == "-":
+        reader = can.BinaryReader()
+    else:
+        reader = LogReader(results.infile)
 
     in_sync = MessageSync(
         reader, timestamps=results.timestamps, gap=results.gap, skip=results.skip
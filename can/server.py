@@ -0,0 +1,449 @@
+"""
+Serves a CAN bus to remote clients over TCP with the ASCII protocol of
+`socketcand <https://github.com/linux-can/socketcand>`__, e.g. to the
+:class:`~can.interfaces.socketcand.SocketcandBus` interface::
+
+    python -m can.server -i socketcan -c can0 --host 0.0.0.0
+
+All clients are served from one :mod:`asyncio` event loop. The received
+messages are passed to the loop in batches, formatted once, and collected
+for every client until the loop is idle, so many frames are sent with one
+write.
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from typing import Any, Dict, List, Optional, Set, Tuple, cast
+
+import can
+from can.broadcastmanager import CyclicSendTaskABC
+from can.bus import BusABC
+from can.interfaces.socketcand import (
+    DEFAULT_PORT,
+    format_frame,
+    parse_id,
+    parse_send,
+    split_commands,
+)
+from can.listener import Listener
+from can.message import Message
+from can.notifier import Notifier
+
+log = logging.getLogger("can.server")
+
+# the modes of a client, as in socketcand
+_NO_BUS = "no bus"
+_BCM = "bcm"
+_RAW = "raw"
+
+
+def _interval(secs: str, usecs: str) -> float:
+    return int(secs) + int(usecs) / 1000000
+
+
+def _format(msg: Message) -> Optional[str]:
+    """Format a received message for the clients, or return None if the
+    protocol can not carry it, as for remote frames and frames with more
+    than eight data bytes.
+    """
+    if msg.is_remote_frame or len(msg.data) > 8:
+        return None
+    return format_frame(msg, "error" if msg.is_error_frame else "frame")
+
+
+class _Subscription:
+    """Frames of one arbitration ID a client subscribed to in BCM mode."""
+
+    __slots__ = ("interval", "mask", "last_data", "last_sent", "pending", "timer")
+
+    def __init__(self, interval: float, mask: Optional[bytes] = None) -> None:
+        #: The minimum time in seconds between two frames sent to the client
+        self.interval = interval
+        #: Only send frames when these bits of the data changed
+        self.mask = mask
+        self.last_data: Optional[bytes] = None
+        self.last_sent = float("-inf")
+        #: The newest frame held back by the interval
+        self.pending: Optional[Message] = None
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+    def cancel(self) -> None:
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+
+
+class _ClientProtocol(asyncio.Protocol):
+    """Serves a single client connection."""
+
+    def __init__(self, server: "SocketcandServer") -> None:
+        self.server = server
+        self.mode = _NO_BUS
+        # set by connection_made(), which is called right after creation
+        self.transport: asyncio.Transport
+        self._rx_buffer = bytearray()
+
+        # the output, written when the event loop is idle
+        self._output: List[str] = []
+        self._output_size = 0
+        self._write_scheduled = False
+        self._paused = False
+        #: The number of frames which were dropped because the client was too slow
+        self.dropped = 0
+
+        self._tasks: Dict[Tuple[int, bool], CyclicSendTaskABC] = {}
+        self._subscriptions: Dict[Tuple[int, bool], _Subscription] = {}
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = cast(asyncio.Transport, transport)
+        log.info("Client %s connected", transport.get_extra_info("peername"))
+        self.server._clients.add(self)
+        self.write("< hi >")
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        log.info("Client %s disconnected", self.transport.get_extra_info("peername"))
+        self.server._clients.discard(self)
+        for task in self._tasks.values():
+            task.stop()
+        self._tasks.clear()
+        for subscription in self._subscriptions.values():
+            subscription.cancel()
+        self._subscriptions.clear()
+
+    def pause_writing(self) -> None:
+        self._paused = True
+
+    def resume_writing(self) -> None:
+        self._paused = False
+        if self._output and not self._write_scheduled:
+            self._write()
+
+    def write(self, text: str, frames: int = 0) -> None:
+        """Queue *text* to be sent when the event loop is idle.
+
+        :param frames:
+            The number of frames in *text*. Frames are dropped instead of
+            being queued once the output of a slow client reached
+            :attr:`SocketcandServer.max_buffer_size`.
+        """
+        if frames and self._output_size >= self.server.max_buffer_size:
+            self.dropped += frames
+            return
+        self._output.append(text)
+        self._output_size += len(text)
+        if not self._write_scheduled and not self._paused:
+            self._write_scheduled = True
+            self.server._loop.call_soon(self._write)
+
+    def _write(self) -> None:
+        self._write_scheduled = False
+        if self._paused or self.transport.is_closing():
+            return
+        output = "".join(self._output)
+        self._output.clear()
+        self._output_size = 0
+        self.transport.write(output.encode("ascii"))
+
+    def data_received(self, data: bytes) -> None:
+        self._rx_buffer += data
+        for words in split_commands(self._rx_buffer):
+            if not words:
+                continue
+            try:
+                self._handle(words[0], words[1:])
+            except (ValueError, IndexError) as exc:
+                self.write(f"< error {words[0]}: {exc} >")
+            except can.CanError as exc:
+                self.write(f"< error {exc} >")
+
+    def _handle(self, command: str, args: List[str]) -> None:
+        if command == "echo":
+            self.write("< echo >")
+        elif command == "open":
+            if self.mode != _NO_BUS:
+                raise ValueError("A bus is already open")
+            channel = self.server.channel
+            if channel is not None and args != [channel]:
+                raise ValueError(f"Only {channel} can be opened")
+            self.mode = _BCM
+            self.write("< ok >")
+        elif self.mode == _NO_BUS:
+            raise ValueError("Open a bus first")
+        elif command == "rawmode":
+            self.mode = _RAW
+            self.write("< ok >")
+        elif command == "bcmmode":
+            self.mode = _BCM
+            self.write("< ok >")
+        elif command == "send":
+            self.server.bus.send(parse_send(args))
+        elif self.mode == _BCM:
+            self._handle_bcm(command, args)
+        else:
+            raise ValueError("Unknown command")
+
+    def _handle_bcm(self, command: str, args: List[str]) -> None:
+        if command == "add":
+            msg = parse_send(args[2:])
+            key = msg.arbitration_id, msg.is_extended_id
+            if key in self._tasks:
+                self._tasks.pop(key).stop()
+            self._tasks[key] = self.server.bus.send_periodic(
+                msg, _interval(args[0], args[1]), store_task=False
+            )
+        elif command == "update":
+            msg = parse_send(args)
+            task = self._tasks.get((msg.arbitration_id, msg.is_extended_id))
+            if task is None:
+                raise ValueError("No such job")
+            task.modify_data(msg)  # type: ignore
+        elif command == "delete":
+            task = self._tasks.pop(parse_id(args[0]), None)
+            if task is None:
+                raise ValueError("No such job")
+            task.stop()
+        elif command == "subscribe":
+            key = parse_id(args[2])
+            self._unsubscribe(key)
+            self._subscriptions[key] = _Subscription(_interval(args[0], args[1]))
+        elif command == "filter":
+            msg = parse_send(args[2:])
+            key = msg.arbitration_id, msg.is_extended_id
+            self._unsubscribe(key)
+            self._subscriptions[key] = _Subscription(
+                _interval(args[0], args[1]), bytes(msg.data)
+            )
+        elif command == "unsubscribe":
+            if not self._unsubscribe(parse_id(args[0])):
+                raise ValueError("No such subscription")
+        else:
+            raise ValueError("Unknown command")
+
+    def _unsubscribe(self, key: Tuple[int, bool]) -> bool:
+        subscription = self._subscriptions.pop(key, None)
+        if subscription is None:
+            return False
+        subscription.cancel()
+        return True
+
+    def send_subscribed(self, msgs: List[Message]) -> None:
+        """Send the messages which match a subscription of BCM mode."""
+        subscriptions = self._subscriptions
+        if not subscriptions:
+            return
+        now = self.server._loop.time()
+        frames = []
+        for msg in msgs:
+            subscription = subscriptions.get((msg.arbitration_id, msg.is_extended_id))
+            if subscription is None:
+                continue
+            frame = _format(msg)
+            if frame is None:
+                continue
+            if subscription.mask is not None:
+                data = bytes(a & b for a, b in zip(msg.data, subscription.mask))
+                if data == subscription.last_data:
+                    continue
+                subscription.last_data = data
+            if now - subscription.last_sent < subscription.interval:
+                subscription.pending = msg
+                if subscription.timer is None:
+                    subscription.timer = self.server._loop.call_at(
+                        subscription.last_sent + subscription.interval,
+                        self._send_pending,
+                        subscription,
+                    )
+                continue
+            subscription.last_sent = now
+            subscription.pending = None
+            subscription.cancel()
+            frames.append(frame)
+        if frames:
+            self.write("".join(frames), len(frames))
+
+    def _send_pending(self, subscription: _Subscription) -> None:
+        subscription.timer = None
+        if subscription.pending is not None:
+            subscription.last_sent = self.server._loop.time()
+            # only frames the protocol can carry are held back
+            self.write(cast(str, _format(subscription.pending)), 1)
+            subscription.pending = None
+
+
+class _Dispatcher(Listener):
+    """Passes the received messages to the clients of a server."""
+
+    def __init__(self, server: "SocketcandServer") -> None:
+        self.server = server
+
+    def on_message_received(self, msg: Message) -> None:
+        self.on_messages_received([msg])
+
+    def on_messages_received(self, msgs: List[Message]) -> None:
+        # format the frames only once for all clients in raw mode
+        raw_frames = None
+        raw_output = ""
+        for client in self.server._clients:
+            if client.mode == _RAW:
+                if raw_frames is None:
+                    raw_frames = [
+                        frame for frame in map(_format, msgs) if frame is not None
+                    ]
+                    raw_output = "".join(raw_frames)
+                if raw_frames:
+                    client.write(raw_output, len(raw_frames))
+            elif client.mode == _BCM:
+                client.send_subscribed(msgs)
+
+
+class SocketcandServer:
+    """Serves a bus with the socketcand protocol.
+
+    Clients open the bus by its *channel* name and then use it in raw mode,
+    receiving all frames, or in BCM mode, subscribing to single arbitration
+    IDs and sending frames cyclically. Error frames are sent to clients as
+    ``< error ... >``. The protocol has no notion of remote frames or frames
+    with more than eight data bytes, so these are not sent to the clients.
+
+    .. code-block:: python
+
+        bus = can.Bus(interface="virtual")
+        server = SocketcandServer(bus, "can0")
+        await server.start()
+        await server.serve_forever()
+    """
+
+    def __init__(
+        self,
+        bus: BusABC,
+        channel: Optional[str] = "can0",
+        host: Optional[str] = "127.0.0.1",
+        port: int = DEFAULT_PORT,
+        max_buffer_size: int = 1024 * 1024,
+    ) -> None:
+        """
+        :param bus: The bus to serve, it is not shut down by the server.
+        :param channel:
+            The name clients open the bus with, or None to accept any name.
+        :param host:
+            The address to listen on, or None to listen on all interfaces.
+        :param port:
+            The TCP port to listen on, 0 to let the operating system choose.
+        :param max_buffer_size:
+            The number of characters queued for a client which does not read
+            fast enough, before frames for it are dropped.
+        """
+        self.bus = bus
+        self.channel = channel
+        self.host = host
+        self.port = port
+        self.max_buffer_size = max_buffer_size
+        self._clients: Set[_ClientProtocol] = set()
+        self._loop: Any = None
+        self._server: Optional[asyncio.base_events.Server] = None
+        self._notifier: Optional[Notifier] = None
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """The address the server listens on, once it was started."""
+        if self._server is None:
+            raise RuntimeError("The server was not started")
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def start(self) -> None:
+        """Start listening for clients and receiving from the bus."""
+        self._loop = asyncio.get_event_loop()
+        self._server = await self._loop.create_server(
+            lambda: _ClientProtocol(self), self.host, self.port
+        )
+        self._notifier = Notifier(self.bus, [_Dispatcher(self)], loop=self._loop)
+        log.info("Serving %s on %s:%d", self.bus.channel_info, *self.address)
+
+    async def serve_forever(self) -> None:
+        """Serve the clients until the task is cancelled."""
+        if self._server is None:
+            await self.start()
+        try:
+            while True:
+                await asyncio.sleep(3600)
+        finally:
+            await self.stop()
+
+    async def stop(self) -> None:
+        """Disconnect all clients and stop the server."""
+        if self._notifier is not None:
+            self._notifier.stop()
+            self._notifier = None
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        for client in list(self._clients):
+            client.transport.close()
+        # let the connections be closed
+        await asyncio.sleep(0)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        "python -m can.server",
+        description="Serve a CAN bus over TCP with the socketcand protocol.",
+    )
+    parser.add_argument(
+        "-c",
+        "--channel",
+        help='''Most backend interfaces require some sort of channel.
+    For example with the serial interface the channel might be a rfcomm device: "/dev/rfcomm0"
+    With the socketcan interfaces valid channel examples include: "can0", "vcan0"''',
+    )
+    parser.add_argument(
+        "-i",
+        "--interface",
+        dest="interface",
+        help="""Specify the backend CAN interface to use. If left blank,
+                        fall back to reading from configuration files.""",
+        choices=can.VALID_INTERFACES,
+    )
+    parser.add_argument(
+        "-b", "--bitrate", type=int, help="""Bitrate to use for the CAN bus."""
+    )
+    parser.add_argument(
+        "--name", help="The name clients open the bus with, defaults to the channel."
+    )
+    parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="The address to listen on, default is 127.0.0.1.",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=DEFAULT_PORT,
+        help=f"The TCP port to listen on, default is {DEFAULT_PORT}.",
+    )
+    results = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, stream=sys.stderr)
+    config: Dict[str, Any] = {"single_handle": True}
+    if results.interface:
+        config["interface"] = results.interface
+    if results.bitrate:
+        config["bitrate"] = results.bitrate
+    bus = can.Bus(results.channel, **config)  # type: ignore
+
+    server = SocketcandServer(
+        bus, results.name or results.channel or "can0", results.host, results.port
+    )
+    loop = asyncio.get_event_loop()
+    try:
+        loop.run_until_complete(server.serve_forever())
+    except KeyboardInterrupt:
+        loop.run_until_complete(server.stop())
+    finally:
+        bus.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+Hooks to trace the messages a bus receives and sends, and the errors that
+occur while doing so.
+
+Hooks are registered for one of the events :data:`RX`, :data:`TX` or
+:data:`ERROR`, either on a single bus with :meth:`can.BusABC.add_trace_hook`
+or for all buses with :func:`add_hook`. They are called with the bus, the
+event and the :class:`~can.Message` (or, for :data:`ERROR`, the exception)::
+
+    def on_frame(bus, event, msg):
+        print(bus.channel_info, event, msg)
+
+    can.trace.add_hook(can.trace.RX, on_frame)
+
+As long as no hook is registered for an event, tracing costs a single check
+per message.
+"""
+
+import logging
+from typing import Any, Callable, Optional, Tuple, Union
+
+import can
+from can.message import Message
+
+log = logging.getLogger(__name__)
+
+#: A message was received and passed the filters
+RX = "rx"
+#: A message was sent
+TX = "tx"
+#: Receiving or sending raised an exception
+ERROR = "error"
+
+EVENTS = (RX, TX, ERROR)
+
+#: A function called as ``hook(bus, event, msg_or_exception)``
+TraceHook = Callable[[Any, str, Union[Message, Exception]], None]
+
+
+class TraceHooks:
+    """The hooks registered for each event.
+
+    The hooks of an event are kept in a tuple that is replaced on every
+    change, so it can be iterated without locking while hooks are added or
+    removed from another thread.
+    """
+
+    __slots__ = EVENTS
+
+    def __init__(self) -> None:
+        self.rx: Tuple[TraceHook, ...] = ()
+        self.tx: Tuple[TraceHook, ...] = ()
+        self.error: Tuple[TraceHook, ...] = ()
+
+    def add(self, event: str, hook: TraceHook) -> None:
+        """Call *hook* for every *event*.
+
+        :raises ValueError: if *event* is not one of :data:`EVENTS`
+        """
+        _check_event(event)
+        setattr(self, event, getattr(self, event) + (hook,))
+
+    def remove(self, event: str, hook: TraceHook) -> None:
+        """Stop calling *hook* for *event*.
+
+        :raises ValueError:
+            if *event* is not one of :data:`EVENTS` or *hook* is not
+            registered for it
+        """
+        _check_event(event)
+        hooks = list(getattr(self, event))
+        hooks.remove(hook)
+        setattr(self, event, tuple(hooks))
+
+    def clear(self) -> None:
+        """Remove all hooks."""
+        self.__init__()  # type: ignore
+
+
+def _check_event(event: str) -> None:
+    if event not in EVENTS:
+        raise ValueError(
+            "Unknown trace event {!r}, expected one of {}".format(event, EVENTS)
+        )
+
+
+#: The hooks called for all buses
+GLOBAL_HOOKS = TraceHooks()
+
+
+def add_hook(event: str, hook: TraceHook) -> None:
+    """Call *hook* for every *event* on any bus.
+
+    :param event: One of :data:`RX`, :data:`TX` or :data:`ERROR`.
+    :param hook: Called as ``hook(bus, event, msg_or_exception)``.
+    """
+    GLOBAL_HOOKS.add(event, hook)
+
+
+def remove_hook(event: str, hook: TraceHook) -> None:
+    """Remove a hook added with :func:`add_hook`."""
+    GLOBAL_HOOKS.remove(event, hook)
+
+
+def call_hooks(
+    bus: Any, hooks: TraceHooks, event: str, data: Union[Message, Exception]
+) -> None:
+    """Call the hooks of *bus* and the global hooks registered for *event*.
+
+    Exceptions raised by a hook are logged and do not affect the bus.
+    """
+    for hook in getattr(hooks, event) + getattr(GLOBAL_HOOKS, event):
+        try:
+            hook(bus, event, data)
+        except Exception:  # pylint: disable=broad-except
+            log.exception("Trace hook %r failed", hook)
+
+
+class FrameLogger:
+    """A trace hook that logs every message and error, e.g. for debugging::
+
+        frame_logger = can.trace.log_frames()
+        ...
+        for event in can.trace.EVENTS:
+            can.trace.remove_hook(event, frame_logger)
+    """
+
+    def __init__(self, logger: logging.Logger = log, level: int = logging.DEBUG):
+        """
+        :param logger: The logger to write to.
+        :param level: The level to log with.
+        """
+        self.logger = logger
+        self.level = level
+
+    def __call__(self, bus: Any, event: str, data: Union[Message, Exception]):
+        self.logger.log(self.level, "%s %s: %s", bus.channel_info, event, data)
+
+
+def log_frames(
+    bus: Any = None, logger: logging.Logger = log, level: Optional[int] = None
+) -> FrameLogger:
+    """Log all messages and errors, of the given bus or of all buses.
+
+    :param bus: The bus to trace, or None to trace all buses.
+    :param logger: The logger to write to.
+    :param level:
+        The level to log with, by default the deprecated
+        :attr:`~can.BusABC.RECV_LOGGING_LEVEL` of the bus, which is 9 and
+        thus below ``logging.DEBUG``.
+
+    :return: The hook, which is registered for all :data:`EVENTS`.
+    """
+    if level is None:
+        level = (can.BusABC if bus is None else bus).RECV_LOGGING_LEVEL
+    hook = FrameLogger(logger, level)
+    hooks = GLOBAL_HOOKS if bus is None else bus._trace_hooks
+    for event in EVENTS:
+        hooks.add(event, hook)
+    return hook
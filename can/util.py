@@ -2,8 +2,9 @@
 Utilities and configuration file parsing.
 """
 import functools
+import importlib
 import warnings
-from typing import Dict, Optional, Union
+from typing import Any, Dict, NamedTuple, Optional, Tuple, Union
 
 from can import typechecking
 
@@ -16,7 +17,7 @@ import logging
 from configparser import ConfigParser
 
 import can
-from can.interfaces import VALID_INTERFACES
+from can.interfaces import BACKENDS, _load_entry_points
 
 log = logging.getLogger("can.util")
 
@@ -34,6 +35,53 @@ elif platform.system() == "Windows" or platform.python_implementation() == "Iron
     CONFIG_FILES.extend(["can.ini", os.path.join(os.getenv("APPDATA", ""), "can.ini")])
 
 
+class _EntryPoint(NamedTuple):
+    """An entry point advertised by an installed package."""
+
+    name: str
+    module_name: str
+    attribute: str
+
+    def load(self) -> Any:
+        """Import the module and return the object the entry point refers to."""
+        obj = importlib.import_module(self.module_name)
+        for part in self.attribute.split("."):
+            obj = getattr(obj, part)
+        return obj
+
+
+@functools.lru_cache(maxsize=None)
+def _get_entry_points(group: str) -> Tuple[_EntryPoint, ...]:
+    """Find all entry points of the given group, e.g. ``"can.interface"``.
+
+    Searching the installed packages is slow, so callers should only do this
+    when needed. The result is cached.
+    """
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:
+        # Python < 3.8
+        from pkg_resources import iter_entry_points
+
+        return tuple(
+            _EntryPoint(entry.name, entry.module_name, ".".join(entry.attrs))
+            for entry in iter_entry_points(group)
+        )
+
+    all_entries = entry_points()
+    if hasattr(all_entries, "select"):
+        # Python >= 3.10
+        entries = all_entries.select(group=group)
+    else:
+        entries = all_entries.get(group, [])  # type: ignore
+
+    result = []
+    for entry in entries:
+        module_name, _, attribute = entry.value.partition(":")
+        result.append(_EntryPoint(entry.name, module_name.strip(), attribute.strip()))
+    return tuple(result)
+
+
 def load_file_config(
     path: Optional[typechecking.AcceptedIOType] = None, section: str = "default"
 ) -> Dict[str, str]:
@@ -187,7 +235,10 @@ def load_config(
         if key not in config:
             config[key] = None
 
-    if config["interface"] not in VALID_INTERFACES:
+    if config["interface"] not in BACKENDS:
+        # it might be provided by another package
+        _load_entry_points()
+    if config["interface"] not in BACKENDS:
         raise NotImplementedError(
             "Invalid CAN Bus Type - {}".format(config["interface"])
         )
@@ -0,0 +1,11 @@
+#!/usr/bin/env python
+
+"""
+See :mod:`can.server`.
+"""
+
+from can.server import main
+
+
+if __name__ == "__main__":
+    main()
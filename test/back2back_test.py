@@ -121,6 +121,47 @@ class Back2BackTestCase(unittest.TestCase):
         )
         self._send_and_receive(msg)
 
+    def test_send_batch(self):
+        msgs = [
+            can.Message(is_extended_id=False, arbitration_id=0x400 + i, data=[i])
+            for i in range(10)
+        ]
+        self.assertEqual(self.bus1.send_batch(msgs), len(msgs))
+        for msg in msgs:
+            self._check_received_message(self.bus2.recv(self.TIMEOUT), msg)
+
+    def test_recv_batch(self):
+        msgs = [
+            can.Message(is_extended_id=False, arbitration_id=0x600 + i, data=[i])
+            for i in range(5)
+        ]
+        for msg in msgs:
+            self.bus1.send(msg)
+        received = []
+        while len(received) < len(msgs):
+            batch = self.bus2.recv_batch(max_messages=3, timeout=self.TIMEOUT)
+            self.assertTrue(batch, "No message was received on %s" % self.INTERFACE_2)
+            self.assertLessEqual(len(batch), 3)
+            received.extend(batch)
+        for recv_msg, sent_msg in zip(received, msgs):
+            self._check_received_message(recv_msg, sent_msg)
+        self.assertEqual(self.bus2.recv_batch(timeout=0), [])
+
+    def test_send_prepared(self):
+        msg = can.Message(is_extended_id=False, arbitration_id=0x500, data=[0, 1, 2])
+        prepared = self.bus1.prepare(msg)
+        for counter in range(3):
+            prepared.update(bytes([counter]), offset=2)
+            self.bus1.send_prepared(prepared)
+            recv_msg = self.bus2.recv(self.TIMEOUT)
+            self.assertIsNotNone(recv_msg)
+            self.assertEqual(recv_msg.arbitration_id, 0x500)
+            self.assertSequenceEqual(recv_msg.data, [0, 1, counter])
+        # the original message is not changed
+        self.assertSequenceEqual(msg.data, [0, 1, 2])
+        with self.assertRaises(ValueError):
+            prepared.update(b"\x00\x00", offset=2)
+
     def test_dlc_less_than_eight(self):
         msg = can.Message(is_extended_id=False, arbitration_id=0x300, data=[4, 5, 6])
         self._send_and_receive(msg)
@@ -624,6 +624,47 @@ class TestBlfFileFormat(ReaderWriterTest):
         self.assertEqual(actual[0].channel, expected.channel)
 
 
+class TestBinaryFileFormat(ReaderWriterTest):
+    """Tests can.BinaryWriter and can.BinaryReader"""
+
+    def _setup_instance(self):
+        super()._setup_instance_helper(
+            can.BinaryWriter,
+            can.BinaryReader,
+            binary_file=True,
+            test_append=True,
+            check_comments=False,
+            preserves_channel=True,
+        )
+
+    def test_pipe(self):
+        read_fd, write_fd = os.pipe()
+        with open(read_fd, "rb") as read_file, open(write_fd, "wb") as write_file:
+            writer = can.BinaryWriter(write_file, flush=True)
+            reader = iter(can.BinaryReader(read_file))
+            # every message can be read as soon as it was written
+            for msg in self.original_messages:
+                writer(msg)
+                self.assertMessageEqual(msg, next(reader))
+            writer.stop()
+            self.assertEqual(list(reader), [])
+
+    def test_incomplete_record(self):
+        with open(self.test_file_name, "wb") as file:
+            file.write(can.io.binary.MAGIC)
+            file.write(self.original_messages[0].to_bytes())
+            file.write(self.original_messages[1].to_bytes()[:-1])
+        with self.assertLogs("can.io.binary", level="WARNING"):
+            read_messages = list(can.BinaryReader(self.test_file_name))
+        self.assertMessagesEqual(self.original_messages[:1], read_messages)
+
+    def test_not_a_binary_log(self):
+        with open(self.test_file_name, "wb") as file:
+            file.write(b"(0.0) vcan0 001#8d00100100820100\n")
+        with self.assertRaises(ValueError):
+            list(can.BinaryReader(self.test_file_name))
+
+
 class TestCanutilsFileFormat(ReaderWriterTest):
     """Tests can.CanutilsLogWriter and can.CanutilsLogReader"""
 
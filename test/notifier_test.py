@@ -38,6 +38,126 @@ class NotifierTest(unittest.TestCase):
         bus1.shutdown()
         bus2.shutdown()
 
+    def test_statistics_disabled_by_default(self):
+        with can.Bus("test", bustype="virtual", receive_own_messages=True) as bus:
+            notifier = can.Notifier(bus, [can.BufferedReader()], 0.1)
+            self.assertIsNone(notifier.statistics)
+            notifier.stop()
+
+    def test_instrumented(self):
+        bus = can.Bus("test", bustype="virtual", receive_own_messages=True)
+        reader = can.BufferedReader()
+
+        def slow_listener(msg):
+            time.sleep(0.002)
+
+        notifier = can.Notifier(bus, [reader, slow_listener], 0.1, instrument=True)
+        for _ in range(3):
+            bus.send(can.Message())
+        for _ in range(3):
+            self.assertIsNotNone(reader.get_message(1))
+        time.sleep(0.1)
+        notifier.stop()
+        bus.shutdown()
+
+        statistics = notifier.statistics
+        fast = statistics.get(reader)
+        slow = statistics.get(slow_listener)
+        # the reader handles batches, which may contain several messages
+        self.assertEqual(fast.messages, 3)
+        self.assertLessEqual(fast.calls, 3)
+        self.assertEqual(slow.calls, 3)
+        self.assertEqual(slow.messages, 3)
+        self.assertEqual(sum(slow.histogram), 3)
+        # all calls of the slow listener took longer than 1 ms
+        self.assertEqual(sum(slow.histogram[3:]), 3)
+        self.assertGreaterEqual(slow.max_time, slow.mean_time)
+        self.assertGreater(slow.total_time, fast.total_time)
+        self.assertEqual(
+            slow.name, "NotifierTest.test_instrumented.<locals>.slow_listener"
+        )
+        self.assertIsNone(statistics.get(can.BufferedReader()))
+
+        (reader_statistics,) = statistics.readers
+        self.assertIs(reader_statistics.bus, bus)
+        self.assertEqual(reader_statistics.messages, 3)
+        self.assertGreater(reader_statistics.busy_time, 0.005)
+        self.assertGreater(reader_statistics.idle_time, 0)
+        self.assertLess(reader_statistics.utilization, 1)
+        self.assertIn("slow_listener: 3 calls", str(statistics))
+
+        statistics.reset()
+        self.assertEqual(statistics.listeners, [])
+        self.assertEqual(reader_statistics.messages, 0)
+
+    def test_log_interval(self):
+        bus = can.Bus("test", bustype="virtual", receive_own_messages=True)
+        with self.assertLogs("can.Notifier", level="INFO") as logs:
+            notifier = can.Notifier(bus, [can.BufferedReader()], 0.01, log_interval=0)
+            bus.send(can.Message())
+            time.sleep(0.1)
+            notifier.stop()
+        bus.shutdown()
+        self.assertIsNotNone(notifier.statistics)
+        self.assertIn("BufferedReader: 1 calls", logs.output[-1])
+
+    def test_batch_dispatch(self):
+        bus = can.Bus("test", bustype="virtual", receive_own_messages=True)
+        batches = []
+
+        class BatchListener(can.Listener):
+            def on_message_received(self, msg):
+                batches.append([msg])
+
+            def on_messages_received(self, msgs):
+                batches.append(msgs)
+
+        single = []
+        # send all messages before the notifier starts, so they are
+        # read in a single batch
+        for arbitration_id in range(5):
+            bus.send(can.Message(arbitration_id=arbitration_id))
+        notifier = can.Notifier(bus, [BatchListener(), single.append], 0.1)
+        time.sleep(0.2)
+        notifier.stop()
+        bus.shutdown()
+
+        self.assertEqual(len(batches), 1)
+        self.assertEqual([msg.arbitration_id for msg in batches[0]], list(range(5)))
+        self.assertEqual([msg.arbitration_id for msg in single], list(range(5)))
+
+    def test_stop_dispatches_received_batch(self):
+        bus = can.Bus("test", bustype="virtual", receive_own_messages=True)
+        for arbitration_id in range(5):
+            bus.send(can.Message(arbitration_id=arbitration_id))
+        received = []
+        stopped_after = []
+
+        class StoppingListener(can.Listener):
+            def on_message_received(self, msg):
+                received.append(msg)
+
+            def stop(self):
+                stopped_after.append(len(received))
+
+        # the batch is read while stop() is waiting for the thread
+        notifiers = []
+        recv_batch = bus.recv_batch
+
+        def recv_batch_while_stopping(max_messages, timeout):
+            while not notifiers or notifiers[0]._running:
+                time.sleep(0.01)
+            return recv_batch(max_messages, 0)
+
+        bus.recv_batch = recv_batch_while_stopping
+        notifier = can.Notifier(bus, [StoppingListener()], 0.1)
+        notifiers.append(notifier)
+        notifier.stop()
+        bus.shutdown()
+
+        self.assertEqual([msg.arbitration_id for msg in received], list(range(5)))
+        self.assertEqual(stopped_after, [5])
+
 
 class AsyncNotifierTest(unittest.TestCase):
     def test_asyncio_notifier(self):
@@ -35,6 +35,10 @@ class SerialDummy:
     def write(self, msg):
         self.msg = bytearray(msg)
 
+    @property
+    def in_waiting(self):
+        return len(self.msg)
+
     def reset(self):
         self.msg = None
 
@@ -144,6 +148,9 @@ class SimpleSerialTest(unittest.TestCase, SimpleSerialTestBase):
         self.serial_dummy = SerialDummy()
         self.mock_serial.return_value.write = self.serial_dummy.write
         self.mock_serial.return_value.read = self.serial_dummy.read
+        type(self.mock_serial.return_value).in_waiting = property(
+            lambda _: self.serial_dummy.in_waiting
+        )
         self.addCleanup(self.patcher.stop)
         self.bus = SerialBus("bus")
 
@@ -163,5 +170,34 @@ class SimpleSerialLoopTest(unittest.TestCase, SimpleSerialTestBase):
         self.bus.shutdown()
 
 
+class SerialFramingTest(unittest.TestCase):
+    def setUp(self):
+        self.bus = SerialBus("loop://")
+
+    def tearDown(self):
+        self.bus.shutdown()
+
+    def test_recv_batch(self):
+        msgs = [can.Message(arbitration_id=i, data=[i] * i) for i in range(5)]
+        for msg in msgs:
+            self.bus.send(msg)
+        received = self.bus.recv_batch(max_messages=3)
+        self.assertEqual([msg.arbitration_id for msg in received], [0, 1, 2])
+        received = self.bus.recv_batch()
+        self.assertEqual([msg.arbitration_id for msg in received], [3, 4])
+        self.assertEqual(bytes(received[1].data), b"\x04" * 4)
+
+    def test_garbage_and_partial_frames(self):
+        self.bus.send(can.Message(arbitration_id=0x123, data=[0xAA, 0xBB]))
+        frame = self.bus.ser.read(self.bus.ser.in_waiting)
+        # garbage, a start byte without a valid frame, then a split frame
+        self.bus.ser.write(b"\x01\x02\xaa\x00\x00\x00\x00\x00" + frame[:7])
+        self.assertIsNone(self.bus.recv(0))
+        self.bus.ser.write(frame[7:] + frame)
+        received = self.bus.recv_batch()
+        self.assertEqual([msg.arbitration_id for msg in received], [0x123, 0x123])
+        self.assertEqual(bytes(received[0].data), b"\xaa\xbb")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -152,6 +152,74 @@ class SimpleCyclicSendTaskTest(unittest.TestCase, ComparingMessagesTestCase):
 
         bus.shutdown()
 
+    def test_periodic_task_group(self):
+        bus = can.interface.Bus(bustype="virtual", receive_own_messages=True)
+        group = bus.send_periodic_group(
+            [
+                (
+                    can.Message(is_extended_id=False, arbitration_id=task_i),
+                    0.01 * (task_i + 1),
+                )
+                for task_i in range(3)
+            ]
+        )
+        self.assertIsInstance(group, can.broadcastmanager.CyclicSendTaskGroup)
+        self.assertEqual(len(group.tasks), 3)
+        assert len(bus._periodic_tasks) == 1
+
+        received_ids = set()
+        for _ in range(50):
+            received_msg = bus.recv(timeout=5.0)
+            assert received_msg is not None
+            received_ids.add(received_msg.arbitration_id)
+        self.assertEqual(received_ids, {0, 1, 2})
+
+        group.modify_data(
+            [
+                can.Message(is_extended_id=False, arbitration_id=task_i, data=[0xFF])
+                for task_i in range(3)
+            ]
+        )
+        for task in group.tasks:
+            self.assertEqual(task.messages[0].data, bytearray([0xFF]))
+
+        with self.assertRaises(ValueError):
+            group.modify_data([can.Message(arbitration_id=0)])
+
+        group.stop()
+        assert len(bus._periodic_tasks) == 0
+        for task in group.tasks:
+            assert task.thread.join(5.0) is None, "Task didn't stop before timeout"
+
+        with self.assertRaises(ValueError):
+            bus.send_periodic_group([])
+
+        bus.shutdown()
+
+    def test_periodic_task_group_stops_started_tasks_on_error(self):
+        bus = can.interface.Bus(bustype="virtual")
+        started_tasks = []
+        send_periodic_internal = bus._send_periodic_internal
+
+        def fail_third_task(msgs, period, duration=None):
+            if len(started_tasks) == 2:
+                raise can.CanError("no more tasks")
+            task = send_periodic_internal(msgs, period, duration)
+            started_tasks.append(task)
+            return task
+
+        bus._send_periodic_internal = fail_third_task
+        with self.assertRaises(can.CanError):
+            bus.send_periodic_group(
+                [(can.Message(arbitration_id=task_i), 0.01) for task_i in range(3)]
+            )
+        self.assertEqual(len(bus._periodic_tasks), 0)
+        for task in started_tasks:
+            self.assertTrue(task.stopped)
+            assert task.thread.join(5.0) is None, "Task didn't stop before timeout"
+
+        bus.shutdown()
+
     @unittest.skipIf(IS_CI, "fails randomly when run on CI server")
     def test_thread_based_cyclic_send_task(self):
         bus = can.ThreadSafeBus(bustype="virtual")
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+This module tests the benchmark runner in :mod:`can.bench`.
+"""
+
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+
+from can import bench
+
+
+class BenchmarkTest(unittest.TestCase):
+    def test_generate_messages_is_reproducible(self):
+        first = bench.generate_messages(50, seed=1)
+        second = bench.generate_messages(50, seed=1)
+        self.assertEqual(len(first), 50)
+        for a, b in zip(first, second):
+            self.assertTrue(a.equals(b))
+
+    def test_run(self):
+        names = ["message.construct", "virtual.send_recv", "io.csv.read"]
+        results = bench.run(names, count=20, repeat=2)
+        self.assertEqual(results["count"], 20)
+        self.assertEqual(list(results["benchmarks"]), names)
+        for result in results["benchmarks"].values():
+            self.assertLessEqual(result["best"], result["mean"])
+            self.assertGreater(result["us_per_message"], 0)
+        # the results must be serializable
+        json.dumps(results)
+
+    def test_all_benchmarks_run(self):
+        results = bench.run(list(bench.BENCHMARKS), count=5, repeat=1)
+        self.assertEqual(set(results["benchmarks"]), set(bench.BENCHMARKS))
+
+    def test_compare(self):
+        before = {
+            "benchmarks": {
+                "a": {"us_per_message": 1.0},
+                "b": {"us_per_message": 2.0},
+                "c": {"skipped": "not available"},
+                "d": {"us_per_message": 1.0},
+                "e": {"us_per_message": 0.0},
+            }
+        }
+        after = {
+            "benchmarks": {
+                "a": {"us_per_message": 1.5},
+                "b": {"us_per_message": 2.1},
+                "c": {"us_per_message": 1.0},
+                "e": {"us_per_message": 1.0},
+            }
+        }
+        rows = bench.compare(before, after, threshold=0.1)
+        self.assertEqual([row["name"] for row in rows], ["a", "b"])
+        self.assertTrue(rows[0]["regressed"])
+        self.assertAlmostEqual(rows[0]["ratio"], 1.5)
+        self.assertFalse(rows[1]["regressed"])
+
+    def test_invalid_count(self):
+        for args in (["-n", "0"], ["-r", "0"]):
+            with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+                bench.main(args)
+
+    def test_main(self):
+        with tempfile.TemporaryDirectory() as directory:
+            before = os.path.join(directory, "before.json")
+            after = os.path.join(directory, "after.json")
+            with redirect_stdout(io.StringIO()):
+                for path in (before, after):
+                    status = bench.main(
+                        ["-n", "10", "-r", "1", "-k", "message.", "-o", path]
+                    )
+                    self.assertEqual(status, 0)
+                bench.main(["--compare", before, after, "--threshold", "1000"])
+
+            with open(before) as file:
+                results = json.load(file)
+            self.assertEqual(
+                set(results["benchmarks"]), {"message.construct", "message.filter"}
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
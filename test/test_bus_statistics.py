@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+This module tests :attr:`can.BusABC.statistics`.
+"""
+
+import unittest
+from unittest.mock import patch
+
+import can
+from can import Bus, BusStatistics, Message
+
+
+class BusStatisticsTest(unittest.TestCase):
+    def setUp(self):
+        self.sender = Bus(bustype="virtual", channel="statistics_test")
+        self.receiver = Bus(bustype="virtual", channel="statistics_test")
+
+    def tearDown(self):
+        self.sender.shutdown()
+        self.receiver.shutdown()
+
+    def test_send_and_receive(self):
+        self.sender.send(Message(arbitration_id=0x1, data=[1, 2, 3]))
+        self.sender.send_batch([Message(arbitration_id=0x2, data=[1])] * 2)
+        self.sender.send(Message(arbitration_id=0x3, is_error_frame=True))
+        for _ in range(4):
+            self.assertIsNotNone(self.receiver.recv(0.1))
+        self.assertIsNone(self.receiver.recv(0))
+
+        sent = self.sender.statistics
+        self.assertEqual(sent.tx_frames, 4)
+        self.assertEqual(sent.tx_bytes, 5)
+        self.assertEqual(sent.rx_frames, 0)
+
+        received = self.receiver.statistics
+        self.assertEqual(received.rx_frames, 4)
+        self.assertEqual(received.rx_bytes, 5)
+        self.assertEqual(received.error_frames, 1)
+        self.assertEqual(received.recv_calls, 5)
+        self.assertEqual(received.tx_frames, 0)
+        self.assertGreaterEqual(received.recv_time_max, received.recv_time_mean)
+        self.assertGreater(received.recv_time, 0)
+
+    def test_filtered(self):
+        self.receiver.set_filters([{"can_id": 0x2, "can_mask": 0x7FF}])
+        for arbitration_id in (0x1, 0x2, 0x3):
+            self.sender.send(Message(arbitration_id=arbitration_id))
+        self.assertEqual(self.receiver.recv(0.1).arbitration_id, 0x2)
+        self.assertIsNone(self.receiver.recv(0))
+        self.assertEqual(self.receiver.statistics.filtered, 2)
+        self.assertEqual(self.receiver.statistics.rx_frames, 1)
+
+    def test_send_errors(self):
+        bus = Bus(bustype="virtual", channel="statistics_test")
+        bus.shutdown()
+        with self.assertRaises(can.CanError):
+            bus.send(Message())
+        self.assertEqual(bus.statistics.send_errors, 1)
+        self.assertEqual(bus.statistics.tx_frames, 0)
+
+    def test_reset(self):
+        self.sender.send(Message(data=[1]))
+        self.receiver.recv(0.1)
+        statistics = self.receiver.statistics
+        statistics.reset()
+        self.assertEqual(statistics.rx_frames, 0)
+        self.assertEqual(statistics.recv_time, 0.0)
+        self.assertEqual(statistics.recv_time_mean, 0.0)
+
+    def test_driver_statistics(self):
+        with patch.object(
+            self.receiver,
+            "_get_driver_statistics",
+            return_value={"dropped": 3, "bus_load": 12.5},
+        ):
+            statistics = self.receiver.statistics
+        self.assertEqual(statistics.driver, {"dropped": 3, "bus_load": 12.5})
+        values = statistics.as_dict()
+        self.assertEqual(values["driver_dropped"], 3)
+        self.assertEqual(values["rx_frames"], 0)
+        self.assertIn("driver_bus_load: 12.5", str(statistics))
+
+    def test_thread_safe_bus(self):
+        with can.ThreadSafeBus(bustype="virtual", channel="statistics_test") as bus:
+            bus.send(Message())
+            self.assertIsInstance(bus.statistics, BusStatistics)
+            self.assertEqual(bus.statistics.tx_frames, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
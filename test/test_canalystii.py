@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+This module tests :class:`can.interfaces.canalystii.CANalystIIBus`
+with a mocked controlcan library.
+"""
+
+import unittest
+from unittest.mock import Mock, patch
+
+import can
+from can.interfaces import canalystii
+
+
+class CANalystIIBusTest(unittest.TestCase):
+    def setUp(self):
+        self.library = Mock()
+        self.library.VCI_OpenDevice.return_value = canalystii.STATUS_OK
+        self.library.VCI_InitCAN.return_value = canalystii.STATUS_OK
+        self.library.VCI_StartCAN.return_value = canalystii.STATUS_OK
+        self.library.VCI_Receive.return_value = 0
+        self.library.VCI_Transmit.side_effect = lambda *args: args[4]
+
+        patcher = patch.object(canalystii, "CANalystII", self.library)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.bus = can.Bus(bustype="canalystii", channel="0, 1", bitrate=500000)
+        self.addCleanup(self.bus.shutdown)
+
+    def _receive(self, *arbitration_ids):
+        def receive(device_type, device, channel, objects, size, timeout):
+            self.assertEqual(size, canalystii.RECEIVE_BUFFER_SIZE)
+            if self.library.VCI_Receive.call_count > 1:
+                return 0
+            for raw_message, arbitration_id in zip(objects, arbitration_ids):
+                raw_message.ID = arbitration_id
+                raw_message.DataLen = 1
+                raw_message.Data[0] = arbitration_id
+            return len(arbitration_ids)
+
+        self.library.VCI_Receive.side_effect = receive
+
+    def test_recv_batch(self):
+        self._receive(1, 2, 3)
+        msgs = self.bus.recv_batch(timeout=0)
+        self.assertEqual([msg.arbitration_id for msg in msgs], [1, 2, 3])
+        self.assertEqual(msgs[2].data[0], 3)
+        self.assertEqual(self.library.VCI_Receive.call_count, 1)
+
+    def test_recv_is_buffered(self):
+        self._receive(1, 2)
+        self.assertEqual(self.bus.recv(0).arbitration_id, 1)
+        self.assertEqual(self.bus.recv(0).arbitration_id, 2)
+        self.assertEqual(self.library.VCI_Receive.call_count, 1)
+        self.assertIsNone(self.bus.recv(0))
+
+    def test_recv_timeout(self):
+        self.assertIsNone(self.bus.recv(0.5))
+        self.assertIn(self.library.VCI_Receive.call_args_list[0][0][5], (499, 500))
+
+    def test_send_batch(self):
+        msgs = [
+            can.Message(arbitration_id=1, channel=0),
+            can.Message(arbitration_id=2, channel=0, data=[1, 2]),
+            can.Message(arbitration_id=3, channel=1, is_extended_id=False),
+        ]
+        self.assertEqual(self.bus.send_batch(msgs), 3)
+        self.assertEqual(self.library.VCI_Transmit.call_count, 2)
+
+        _, _, channel, objects, count = self.library.VCI_Transmit.call_args_list[0][0]
+        self.assertEqual((channel, count), (0, 2))
+        self.assertEqual([obj.ID for obj in objects], [1, 2])
+        self.assertEqual(objects[1].DataLen, 2)
+        self.assertEqual(objects[0].ExternFlag, 1)
+
+        _, _, channel, objects, count = self.library.VCI_Transmit.call_args_list[1][0]
+        self.assertEqual((channel, count), (1, 1))
+        self.assertEqual(objects[0].ExternFlag, 0)
+        self.assertEqual(self.bus.statistics.tx_frames, 3)
+
+    def test_send_batch_stops_when_queue_full(self):
+        self.library.VCI_Transmit.side_effect = [1, 1]
+        msgs = [can.Message(arbitration_id=i, channel=i // 2) for i in range(4)]
+        self.assertEqual(self.bus.send_batch(msgs), 1)
+        self.assertEqual(self.library.VCI_Transmit.call_count, 1)
+
+    def test_send_batch_requires_channel(self):
+        with self.assertRaises(ValueError):
+            self.bus.send_batch([can.Message()])
+
+
+if __name__ == "__main__":
+    unittest.main()
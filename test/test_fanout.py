@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+This module tests :mod:`can.fanout`.
+"""
+
+import multiprocessing
+import socket
+import threading
+import time
+import unittest
+
+import can
+from can.fanout import SLOT_SIZE
+
+from .message_helper import ComparingMessagesTestCase
+
+
+def _read_ring(ring, count, results):
+    """Read *count* messages in a worker process."""
+    bus = can.RingBufferBus(ring, from_start=True)
+    msgs = []
+    while len(msgs) < count:
+        batch = bus.recv_batch(count, 5.0)
+        if not batch:
+            break
+        msgs.extend(batch)
+    results.put(([msg.arbitration_id for msg in msgs], bus.dropped))
+
+
+class SharedRingBufferTest(unittest.TestCase, ComparingMessagesTestCase):
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        ComparingMessagesTestCase.__init__(self)
+
+    def setUp(self):
+        self.ring = can.SharedRingBuffer(slots=8)
+
+    def _messages(self, start, stop):
+        return [
+            can.Message(timestamp=i, arbitration_id=i, data=[i % 256], channel="can0")
+            for i in range(start, stop)
+        ]
+
+    def test_read(self):
+        bus = can.RingBufferBus(self.ring)
+        self.assertEqual(bus.recv_batch(10, 0), [])
+        msgs = self._messages(0, 5)
+        self.ring.write(msgs)
+        self.assertEqual(bus.lag, 5)
+        self.assertMessagesEqual(msgs[:3], bus.recv_batch(3, 0))
+        self.assertMessagesEqual(msgs[3:], bus.recv_batch(10, 0))
+        self.assertEqual(bus.lag, 0)
+        self.assertEqual(bus.statistics.driver, {"lag": 0, "dropped": 0})
+
+    def test_wrap_around(self):
+        bus = can.RingBufferBus(self.ring)
+        for start in range(0, 30, 6):
+            msgs = self._messages(start, start + 6)
+            self.ring.write(msgs)
+            self.assertMessagesEqual(msgs, bus.recv_batch(10, 0))
+
+    def test_lagging_reader(self):
+        bus = can.RingBufferBus(self.ring)
+        msgs = self._messages(0, 20)
+        self.ring.write(msgs)
+        self.assertEqual(bus.lag, 8)
+        # the slot which is written next can not be read
+        self.assertMessagesEqual(msgs[13:], bus.recv_batch(10, 0))
+        self.assertEqual(bus.dropped, 13)
+
+    def test_from_start(self):
+        self.ring.write(self._messages(0, 3))
+        self.assertEqual(len(can.RingBufferBus(self.ring).recv_batch(10, 0)), 0)
+        self.assertEqual(
+            len(can.RingBufferBus(self.ring, from_start=True).recv_batch(10, 0)), 3
+        )
+
+    def test_wait(self):
+        bus = can.RingBufferBus(self.ring)
+        msgs = self._messages(0, 2)
+        timer = threading.Timer(0.1, self.ring.write, (msgs,))
+        timer.start()
+        self.assertMessagesEqual(msgs, bus.recv_batch(10, 2.0))
+        timer.join()
+        start = time.perf_counter()
+        self.assertEqual(bus.recv_batch(10, 0.1), [])
+        self.assertGreaterEqual(time.perf_counter() - start, 0.09)
+
+    def test_close(self):
+        bus = can.RingBufferBus(self.ring)
+        self.ring.write(self._messages(0, 1))
+        self.ring.close()
+        self.assertEqual(len(bus.recv_batch(10, 0)), 1)
+        with self.assertRaises(can.CanError):
+            bus.recv(1.0)
+
+    def test_invalid_messages(self):
+        with self.assertRaises(can.CanError):
+            can.RingBufferBus(self.ring).send(can.Message())
+        with self.assertRaises(ValueError):
+            self.ring.write([can.Message(channel="x" * SLOT_SIZE)])
+        with self.assertRaises(ValueError):
+            can.SharedRingBuffer(slots=1)
+
+    def test_worker_processes(self):
+        ring = can.SharedRingBuffer(slots=1000)
+        results = multiprocessing.Queue()
+        workers = [
+            multiprocessing.Process(target=_read_ring, args=(ring, 500, results))
+            for _ in range(2)
+        ]
+        for worker in workers:
+            worker.start()
+        ring.write(self._messages(0, 500))
+        for worker in workers:
+            arbitration_ids, dropped = results.get(timeout=10.0)
+            self.assertEqual(arbitration_ids, list(range(500)))
+            self.assertEqual(dropped, 0)
+        for worker in workers:
+            worker.join(5.0)
+
+
+class CaptureProcessTest(unittest.TestCase):
+    def test_capture(self):
+        # the capture process receives from a UDP bridge on a free port
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.bind(("127.0.0.1", 0))
+            address = "127.0.0.1:%d" % sock.getsockname()[1]
+
+        ring = can.SharedRingBuffer(slots=1000)
+        capture = can.CaptureProcess(ring, interface="udp_bridge", channel=address)
+        capture.start()
+        self.addCleanup(capture.stop)
+        bus = can.RingBufferBus(ring)
+
+        sender = can.Bus(interface="udp_bridge", channel="127.0.0.1:0", remote=address)
+        self.addCleanup(sender.shutdown)
+        msgs = [can.Message(arbitration_id=i) for i in range(100)]
+        received = []
+        # the bus may not be opened yet, so repeat until the first frame arrives
+        for _ in range(50):
+            sender.send(msgs[0])
+            received = bus.recv_batch(100, 0.1)
+            if received:
+                break
+        sender.send_batch(msgs[1:])
+        while received[-1].arbitration_id != 99:
+            batch = bus.recv_batch(100, 2.0)
+            self.assertTrue(batch)
+            received.extend(batch)
+        ids = [msg.arbitration_id for msg in received]
+        self.assertEqual(ids[-99:], list(range(1, 100)))
+        self.assertEqual(received[0].channel, address)
+
+        capture.stop()
+        self.assertFalse(capture.is_alive())
+        with self.assertRaises(can.CanError):
+            bus.recv(1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
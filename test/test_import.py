@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+This module tests that importing :mod:`can` stays cheap, and that the lazily
+imported names still resolve.
+"""
+
+import subprocess
+import sys
+import unittest
+from unittest.mock import patch
+
+import can
+import can.interfaces
+from can.util import _EntryPoint
+
+from .config import IS_CI
+
+# Modules which are slow to import and not needed to use a bus
+EXPENSIVE_MODULES = (
+    "asyncio",
+    "csv",
+    "importlib.metadata",
+    "pkg_resources",
+    "sqlite3",
+    "wrapt",
+    "can.io",
+    "can.listener",
+    "can.notifier",
+)
+
+# Upper bound for the import time of can in seconds. When this was written it took
+# around 50 ms, compared to 190 ms before the lazy imports.
+MAX_IMPORT_TIME = 0.15
+
+
+def _run_python(code):
+    return subprocess.check_output(
+        [sys.executable, "-c", code], universal_newlines=True
+    )
+
+
+class ImportTest(unittest.TestCase):
+    def test_import_does_not_load_expensive_modules(self):
+        loaded = _run_python(
+            "import sys, can\n"
+            "print(' '.join(m for m in {!r} if m in sys.modules))".format(
+                EXPENSIVE_MODULES
+            )
+        ).split()
+        self.assertEqual(loaded, [])
+
+    @unittest.skipIf(
+        IS_CI,
+        "the timing sensitive behaviour cannot be reproduced reliably on a CI server",
+    )
+    def test_import_time(self):
+        # take the best of a few runs, to not measure a busy machine
+        durations = []
+        for _ in range(3):
+            output = subprocess.run(
+                [sys.executable, "-X", "importtime", "-c", "import can"],
+                stderr=subprocess.PIPE,
+                universal_newlines=True,
+                check=True,
+            ).stderr
+            # the line of the top level package holds the cumulative time in us
+            line = [line for line in output.splitlines() if line.endswith("| can")][0]
+            durations.append(int(line.split("|")[1]) * 1e-6)
+        self.assertLess(min(durations), MAX_IMPORT_TIME)
+
+    def test_lazy_names(self):
+        self.assertIs(can.Logger, can.io.logger.Logger)
+        self.assertIs(can.SqliteReader, can.io.sqlite.SqliteReader)
+        self.assertIs(can.Notifier, can.notifier.Notifier)
+        self.assertIs(can.BufferedReader, can.listener.BufferedReader)
+        self.assertIn("virtual", can.VALID_INTERFACES)
+        self.assertIn("Logger", dir(can))
+        self.assertIn("ASCReader", dir(can.io))
+        with self.assertRaises(AttributeError):
+            can.DoesNotExist
+
+    def test_entry_points_are_only_searched_for_unknown_interfaces(self):
+        entry_points = [_EntryPoint("plugin", "can.interfaces.virtual", "VirtualBus")]
+        with patch.object(can.interfaces, "_entry_points_loaded", False), patch.dict(
+            can.interfaces.BACKENDS
+        ), patch(
+            "can.util._get_entry_points", return_value=entry_points
+        ) as get_entry_points:
+            with can.Bus(interface="virtual", channel="import_test") as bus:
+                self.assertIsInstance(bus, can.interfaces.virtual.VirtualBus)
+            get_entry_points.assert_not_called()
+
+            with can.Bus(interface="plugin", channel="import_test") as bus:
+                self.assertIsInstance(bus, can.interfaces.virtual.VirtualBus)
+            get_entry_points.assert_called_once_with("can.interface")
+
+            with can.Bus(interface="plugin", channel="import_test"):
+                pass
+            get_entry_points.assert_called_once_with("can.interface")
+
+
+if __name__ == "__main__":
+    unittest.main()
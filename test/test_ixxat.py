@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+This module tests the receive path of :class:`can.interfaces.ixxat.IXXATBus`
+with a mocked VCI library.
+"""
+
+import unittest
+from unittest.mock import Mock, patch
+
+import can
+from can import trace
+
+try:
+    from can.interfaces.ixxat import canlib, constants
+except ImportError:
+    # the ctypes definitions of the VCI library are only available on Windows
+    canlib = None
+
+
+def _set_message(message, msg_type, arbitration_id=0, data=b""):
+    message.uMsgInfo.Bits.type = msg_type
+    message.uMsgInfo.Bits.dlc = len(data)
+    message.dwMsgId = arbitration_id
+    message.dwTime = 1000
+    for i, byte in enumerate(data):
+        message.abData[i] = byte
+
+
+def _get_caps(handle, caps):
+    caps._obj.dwClockFreq = 1000
+    caps._obj.dwTscDivisor = 1
+
+
+@unittest.skipIf(canlib is None, "IXXAT interface cannot be imported on this platform")
+class IXXATBusTest(unittest.TestCase):
+    def setUp(self):
+        self.vcinpl = Mock()
+        self.vcinpl.canControlGetCaps.side_effect = _get_caps
+        # the receive queue is empty unless a test fills it
+        self.vcinpl.canChannelReadMessage.side_effect = canlib.VCIRxQueueEmptyError
+        self.queue = []
+        self.vcinpl.canChannelReadMultipleMessages.side_effect = self._read_multiple
+
+        for patcher in (
+            patch.object(canlib, "_canlib", self.vcinpl),
+            patch.object(canlib, "HAS_READ_MULTIPLE", True),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.bus = can.Bus(bustype="ixxat", channel=0)
+        self.addCleanup(self.bus.shutdown)
+
+    def _read_multiple(self, handle, timeout_ms, count, messages):
+        if not self.queue:
+            raise canlib.VCITimeout("timeout")
+        read = self.queue[: count._obj.value]
+        del self.queue[: len(read)]
+        for message, args in zip(messages, read):
+            _set_message(message, *args)
+        count._obj.value = len(read)
+
+    def test_recv_batch(self):
+        self.queue = [
+            (constants.CAN_MSGTYPE_DATA, 0x1, b"\x01"),
+            (constants.CAN_MSGTYPE_INFO, 0, bytes([constants.CAN_INFO_START])),
+            (constants.CAN_MSGTYPE_DATA, 0x2, b"\x02\x02"),
+            (constants.CAN_MSGTYPE_DATA, 0x3, b""),
+        ]
+        msgs = self.bus.recv_batch(timeout=0)
+        self.assertEqual([msg.arbitration_id for msg in msgs], [1, 2, 3])
+        self.assertEqual(bytes(msgs[1].data), b"\x02\x02")
+        self.assertEqual(msgs[0].timestamp, 1.0)
+        self.vcinpl.canChannelReadMultipleMessages.assert_called_once()
+        self.assertEqual(self.bus.statistics.driver["info_messages"], 1)
+        self.assertEqual(self.bus.recv_batch(timeout=0), [])
+
+    def test_recv_batch_max_messages(self):
+        self.queue = [(constants.CAN_MSGTYPE_DATA, i, b"") for i in range(5)]
+        msgs = self.bus.recv_batch(max_messages=3, timeout=0)
+        self.assertEqual([msg.arbitration_id for msg in msgs], [0, 1, 2])
+        msgs = self.bus.recv_batch(max_messages=3, timeout=0)
+        self.assertEqual([msg.arbitration_id for msg in msgs], [3, 4])
+
+    def test_error_messages(self):
+        hook = Mock()
+        self.bus.add_trace_hook(trace.ERROR, hook)
+        self.queue = [
+            (constants.CAN_MSGTYPE_ERROR, 0, bytes([constants.CAN_ERROR_CRC])),
+            (constants.CAN_MSGTYPE_ERROR, 0, bytes([constants.CAN_ERROR_ACK])),
+        ]
+        self.assertEqual(self.bus.recv_batch(timeout=0), [])
+
+        driver_statistics = self.bus.statistics.driver
+        self.assertEqual(driver_statistics["error_messages"], 2)
+        self.assertEqual(driver_statistics["crc_errors"], 1)
+        self.assertEqual(driver_statistics["ack_errors"], 1)
+        self.assertEqual(hook.call_count, 2)
+        bus, event, error = hook.call_args[0]
+        self.assertIs(bus, self.bus)
+        self.assertEqual(event, trace.ERROR)
+        self.assertIsInstance(error, canlib.VCIError)
+        self.assertIn("acknowledgment", str(error))
+
+    def test_recv_batch_without_read_multiple(self):
+        def peek_message(handle, message):
+            if self.vcinpl.canChannelPeekMessage.call_count > 1:
+                raise canlib.VCIRxQueueEmptyError()
+            _set_message(message._obj, constants.CAN_MSGTYPE_DATA, 0x7, b"\x07")
+
+        self.vcinpl.canChannelPeekMessage.side_effect = peek_message
+        with patch.object(canlib, "HAS_READ_MULTIPLE", False):
+            msgs = self.bus.recv_batch(timeout=0)
+        self.assertEqual([msg.arbitration_id for msg in msgs], [7])
+        self.vcinpl.canChannelReadMultipleMessages.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -34,11 +34,13 @@ class KvaserTest(unittest.TestCase):
         canlib.canWriteSync = Mock()
         canlib.canWrite = self.canWrite
         canlib.canReadWait = self.canReadWait
+        canlib.canRead = self.canRead
         canlib.canGetBusStatistics = Mock()
         canlib.canRequestBusStatistics = Mock()
 
         self.msg = {}
         self.msg_in_cue = None
+        self.rx_queue = []
         self.bus = can.Bus(channel=0, bustype="kvaser")
 
     def tearDown(self):
@@ -186,6 +188,45 @@ class KvaserTest(unittest.TestCase):
         self.assertTrue(canlib.canGetBusStatistics.called)
         self.assertIsInstance(stats, canlib.structures.BusStatistics)
 
+    def test_recv_batch(self):
+        self.rx_queue = [
+            can.Message(arbitration_id=i, data=[i] * (i + 1), is_extended_id=False)
+            for i in range(5)
+        ]
+        msgs = self.bus.recv_batch(max_messages=3, timeout=0)
+        self.assertEqual([msg.arbitration_id for msg in msgs], [0, 1, 2])
+        # the messages do not share the reused receive buffer
+        self.assertEqual([bytes(msg.data) for msg in msgs], [b"\0", b"\1\1", b"\2" * 3])
+
+        msgs = self.bus.recv_batch(timeout=0)
+        self.assertEqual([msg.arbitration_id for msg in msgs], [3, 4])
+        self.assertEqual(self.bus.recv_batch(timeout=0), [])
+        self.assertEqual(self.bus.statistics.rx_frames, 5)
+
+    def test_recv_batch_with_software_filters(self):
+        self.bus.set_filters(
+            [
+                {"can_id": 0x1, "can_mask": 0x7FF, "extended": False},
+                {"can_id": 0x3, "can_mask": 0x7FF, "extended": False},
+            ]
+        )
+        self.rx_queue = [
+            can.Message(arbitration_id=i, is_extended_id=False) for i in range(5)
+        ]
+        msgs = self.bus.recv_batch(timeout=0)
+        self.assertEqual([msg.arbitration_id for msg in msgs], [1, 3])
+        self.assertEqual(self.bus.statistics.filtered, 3)
+
+    def test_bus_statistics(self):
+        self.bus.send(can.Message(arbitration_id=0x1, data=[1, 2]))
+        statistics = self.bus.statistics
+        self.assertTrue(canlib.canGetBusStatistics.called)
+        self.assertEqual(statistics.tx_frames, 1)
+        self.assertEqual(statistics.tx_bytes, 2)
+        self.assertEqual(
+            set(statistics.driver), {"bus_load", "overruns", "error_frames"}
+        )
+
     @staticmethod
     def canGetNumberOfChannels(count):
         count._obj.value = 2
@@ -197,26 +238,37 @@ class KvaserTest(unittest.TestCase):
         self.msg["data"] = bytearray(buf._obj)
 
     def canReadWait(self, handle, arb_id, data, dlc, flags, timestamp, timeout):
+        if self.rx_queue:
+            return self.canRead(handle, arb_id, data, dlc, flags, timestamp)
         if not self.msg_in_cue:
             return constants.canERR_NOMSG
+        self._read_message(self.msg_in_cue, arb_id, data, dlc, flags, timestamp)
+        return constants.canOK
+
+    def canRead(self, handle, arb_id, data, dlc, flags, timestamp):
+        if not self.rx_queue:
+            return constants.canERR_NOMSG
+        msg = self.rx_queue.pop(0)
+        self._read_message(msg, arb_id, data, dlc, flags, timestamp)
+        return constants.canOK
 
-        arb_id._obj.value = self.msg_in_cue.arbitration_id
-        dlc._obj.value = self.msg_in_cue.dlc
-        data._obj.raw = self.msg_in_cue.data
+    @staticmethod
+    def _read_message(msg, arb_id, data, dlc, flags, timestamp):
+        arb_id._obj.value = msg.arbitration_id
+        dlc._obj.value = msg.dlc
+        data._obj.raw = msg.data
         flags_temp = 0
-        if self.msg_in_cue.is_extended_id:
+        if msg.is_extended_id:
             flags_temp |= constants.canMSG_EXT
         else:
             flags_temp |= constants.canMSG_STD
-        if self.msg_in_cue.is_remote_frame:
+        if msg.is_remote_frame:
             flags_temp |= constants.canMSG_RTR
-        if self.msg_in_cue.is_error_frame:
+        if msg.is_error_frame:
             flags_temp |= constants.canMSG_ERROR_FRAME
         flags._obj.value = flags_temp
         timestamp._obj.value = 0
 
-        return constants.canOK
-
 
 if __name__ == "__main__":
     unittest.main()
@@ -10,11 +10,15 @@ import pickle
 from hypothesis import given, settings, reproduce_failure
 import hypothesis.strategies as st
 
-from can import Message
+from can import Message, pack_messages, unpack_messages
 
 from .message_helper import ComparingMessagesTestCase
 
 
+class _SubMessage(Message):
+    __slots__ = ("note",)
+
+
 class TestMessageClass(unittest.TestCase):
     """
     This test tries many inputs to the message class constructor and then sanity checks
@@ -113,6 +117,59 @@ class MessageSerialization(unittest.TestCase, ComparingMessagesTestCase):
 
         self.assertMessageEqual(message, deserialized)
 
+    def test_pickle_unsupported_channel(self):
+        message = Message(channel=("can0", 1), data=[1, 2])
+        deserialized = pickle.loads(pickle.dumps(message))
+        self.assertMessageEqual(message, deserialized)
+        with self.assertRaises(TypeError):
+            message.to_bytes()
+
+    def test_pickle_subclass(self):
+        message = _SubMessage(arbitration_id=0x123, data=[1, 2], channel="can0")
+        message.note = "sub"
+        deserialized = pickle.loads(pickle.dumps(message))
+        self.assertIsInstance(deserialized, _SubMessage)
+        self.assertEqual(deserialized.note, "sub")
+        self.assertMessageEqual(message, deserialized)
+
+    def test_from_bytes_subclass(self):
+        message = Message(arbitration_id=0x123, data=[1, 2], channel="can0")
+        deserialized = _SubMessage.from_bytes(message.to_bytes())
+        self.assertIsInstance(deserialized, _SubMessage)
+        self.assertMessageEqual(message, deserialized)
+
+    def test_to_bytes(self):
+        messages = [
+            Message(timestamp=1.5, arbitration_id=0x123, is_extended_id=False),
+            Message(arbitration_id=0x1FFFFFFF, channel=2, data=[1, 2, 3], is_rx=False),
+            Message(is_remote_frame=True, dlc=4, channel="vcan0"),
+            Message(is_error_frame=True, channel="kanäl"),
+            Message(
+                is_fd=True,
+                bitrate_switch=True,
+                error_state_indicator=True,
+                data=range(64),
+            ),
+        ]
+        for message in messages:
+            record = message.to_bytes()
+            self.assertMessageEqual(message, Message.from_bytes(record))
+        self.assertEqual(len(messages[0].to_bytes()), 16)
+        self.assertEqual(Message.from_bytes(messages[1].to_bytes()).channel, 2)
+
+        packed = pack_messages(messages)
+        self.assertMessagesEqual(messages, unpack_messages(packed))
+        with self.assertRaises(ValueError):
+            unpack_messages(packed[:-1])
+        with self.assertRaises(ValueError):
+            Message.from_bytes(packed)
+
+    def test_to_bytes_invalid(self):
+        with self.assertRaises(ValueError):
+            Message(arbitration_id=-1).to_bytes()
+        with self.assertRaises(ValueError):
+            Message(channel="x" * 256).to_bytes()
+
 
 if __name__ == "__main__":
     unittest.main()
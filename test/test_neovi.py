@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+This module tests :class:`can.interfaces.ics_neovi.NeoViBus` with a mocked
+python-ics module.
+"""
+
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+import can
+from can.interfaces.ics_neovi import neovi_bus
+
+NETID_HSCAN = 1
+NETID_MSCAN = 2
+SPY_STATUS_TX_MSG = 0x2
+SPY_STATUS_GLOBAL_ERR = 0x1
+SPY_STATUS_XTD_FRAME = 0x4
+
+
+def _ics_msg(arbitration_id, network_id=NETID_HSCAN, status=0, description_id=0):
+    return Mock(
+        ArbIDOrHeader=arbitration_id,
+        NetworkID=network_id,
+        StatusBitField=status,
+        StatusBitField3=0,
+        DescriptionID=description_id,
+        Protocol=0,
+        Data=(arbitration_id, 0, 0),
+        NumberBytesData=1,
+        TimeSystem=1.0,
+    )
+
+
+class NeoViBusTest(unittest.TestCase):
+    def setUp(self):
+        self.ics = Mock(
+            RuntimeError=RuntimeError,
+            NETID_HSCAN=NETID_HSCAN,
+            NETID_MSCAN=NETID_MSCAN,
+            SPY_STATUS_TX_MSG=SPY_STATUS_TX_MSG,
+            SPY_STATUS_GLOBAL_ERR=SPY_STATUS_GLOBAL_ERR,
+            SPY_STATUS_XTD_FRAME=SPY_STATUS_XTD_FRAME,
+            SPY_STATUS_REMOTE_FRAME=0x8,
+            SPY_PROTOCOL_CANFD=3,
+        )
+        self.ics.get_messages.return_value = ([], 0)
+        device = Mock(Name="neoVI FIRE 2", SerialNumber=12345)
+        self.ics.find_devices.return_value = [device]
+
+        patcher = patch.object(neovi_bus, "ics", self.ics)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.bus = can.Bus(
+            bustype="neovi",
+            channel="HSCAN",
+            use_system_timestamp=True,
+            receive_own_messages=False,
+        )
+        self.addCleanup(self.bus.shutdown)
+
+    def test_recv_batch(self):
+        self.ics.get_messages.side_effect = [
+            (
+                [
+                    _ics_msg(0x1),
+                    _ics_msg(0x2, network_id=NETID_MSCAN),
+                    _ics_msg(0x3, status=SPY_STATUS_TX_MSG),
+                    _ics_msg(0x4, status=SPY_STATUS_XTD_FRAME),
+                ],
+                0,
+            ),
+            ([], 0),
+        ]
+        msgs = self.bus.recv_batch(timeout=0)
+        self.assertEqual([msg.arbitration_id for msg in msgs], [0x1, 0x4])
+        self.assertFalse(msgs[0].is_extended_id)
+        self.assertTrue(msgs[1].is_extended_id)
+        self.assertEqual(bytes(msgs[1].data), b"\x04")
+        self.assertEqual(msgs[0].channel, NETID_HSCAN)
+        self.assertEqual(self.ics.get_messages.call_count, 1)
+
+    def test_recv_is_buffered(self):
+        self.ics.get_messages.side_effect = [([_ics_msg(0x1), _ics_msg(0x2)], 0)]
+        self.assertEqual(self.bus.recv(0).arbitration_id, 0x1)
+        self.assertEqual(self.bus.recv(0).arbitration_id, 0x2)
+        self.assertEqual(self.ics.get_messages.call_count, 1)
+
+    def test_send_waits_for_receipt(self):
+        def transmit_messages(dev, message):
+            receipt = _ics_msg(
+                message.ArbIDOrHeader,
+                status=SPY_STATUS_TX_MSG,
+                description_id=message.DescriptionID,
+            )
+            self.ics.get_messages.side_effect = [([receipt], 0)]
+            # the receipt is received by another thread, e.g. a notifier
+            threading.Thread(target=self.bus.recv, args=(0,)).start()
+
+        self.ics.transmit_messages.side_effect = transmit_messages
+        self.bus.send(can.Message(arbitration_id=0x123), timeout=1.0)
+        self.assertEqual(self.bus._pending_receipts, set())
+        self.assertEqual(self.bus._received_receipts, set())
+
+    def test_send_timeout(self):
+        with self.assertRaises(can.CanError):
+            self.bus.send(can.Message(arbitration_id=0x123), timeout=0.01)
+        self.assertEqual(self.bus._pending_receipts, set())
+
+    def test_untracked_receipts_are_ignored(self):
+        self.bus.send(can.Message(arbitration_id=0x123))
+        message = self.ics.transmit_messages.call_args[0][1]
+        receipt = _ics_msg(
+            0x123, status=SPY_STATUS_TX_MSG, description_id=message.DescriptionID
+        )
+        self.ics.get_messages.return_value = ([receipt], 0)
+        self.assertIsNone(self.bus.recv(0))
+        self.assertEqual(self.bus._received_receipts, set())
+
+    def test_late_receipts_are_dropped(self):
+        receipt_key = (0x123, 7)
+        self.bus._pending_receipts.add(receipt_key)
+        bus = self.bus
+        condition = bus._receipt_condition
+
+        class TimingOutCondition:
+            """The waiter times out while the receipt is being processed."""
+
+            def __enter__(self):
+                condition.__enter__()
+                bus._pending_receipts.discard(receipt_key)
+                return self
+
+            def __exit__(self, *args):
+                return condition.__exit__(*args)
+
+            def notify_all(self):
+                condition.notify_all()
+
+        bus._receipt_condition = TimingOutCondition()
+        receipt = _ics_msg(0x123, status=SPY_STATUS_TX_MSG, description_id=7)
+        self.ics.get_messages.return_value = ([receipt], 0)
+        self.assertIsNone(bus.recv(0))
+        self.assertEqual(bus._received_receipts, set())
+
+
+if __name__ == "__main__":
+    unittest.main()
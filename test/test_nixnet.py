@@ -140,6 +140,49 @@ class TestNIXnetBus(unittest.TestCase):
         assert not frame.is_error_frame
 
 
+    def test_parse_frames(self) -> None:
+        frames = (
+            _frames.nxFrameFixed_t.pack(1, 0x2, 0, 0, 0, 2, b'\x01\x02' + 6 * b'\x00')
+            # a frame with payload unit
+            + _frames.nxFrameFixed_t.pack(2, 0x3, 0, 0, 0, 9, bytes(range(8)))
+            + b'\x08' + 7 * b'\x00'
+            + _frames.nxFrameFixed_t.pack(3, 0x4, 1, 0, 0, 0, 8 * b'\x00')
+        )
+        msgs = _frames.parse_frames(frames)
+
+        assert [msg.arbitration_id for msg in msgs] == [0x2, 0x3, 0x4]
+        assert [msg.timestamp for msg in msgs] == [1, 2, 3]
+        assert msgs[0].data == b'\x01\x02'
+        assert msgs[1].data == bytes(range(9))
+        assert msgs[2].is_remote_frame
+        assert _frames.parse_frames(b'') == []
+
+    @unittest.mock.patch('can.interfaces.nixnet._errors.check_for_error', raise_code)
+    def test_parse_frames_truncated_frame(self) -> None:
+        frame = _frames.nxFrameFixed_t.pack(1, 0x2, 0, 0, 0, 0, 8 * b'\x00')
+        with pytest.raises(errors.XnetError):
+            _frames.parse_frames(frame + frame[:10])
+
+    @mock.patch('can.interfaces.nixnet.nixnet.base.SessionBase')
+    @mock.patch('can.interfaces.nixnet.nixnet._funcs')
+    def test_recv_batch_reads_pending_frames(self, funcs, session) -> None:
+        frame = _frames.nxFrameFixed_t.pack(1, 0x2, 0, 0, 0, 1, 8 * b'\x07')
+        session.return_value.num_pend = 3
+        funcs.nx_read_frame.return_value = (3 * frame + 24 * b'\x00', 3 * len(frame))
+        self.bus = can.Bus(bustype='nixnet', channel='CAN1', bitrate=500000)
+
+        msgs = self.bus.recv_batch(max_messages=2, timeout=0)
+        assert [msg.data for msg in msgs] == [b'\x07', b'\x07']
+        assert msgs[0].channel == 'CAN1'
+        funcs.nx_read_frame.assert_called_once_with(
+            session.return_value.handle, 3 * _frames.nxFrameFixed_t.size, 0
+        )
+        # the third frame was buffered
+        session.return_value.num_pend = 0
+        assert self.bus.recv(timeout=0).arbitration_id == 0x2
+        assert funcs.nx_read_frame.call_count == 1
+        assert self.bus.recv(timeout=0) is None
+
     @unittest.mock.patch('can.interfaces.nixnet._errors.check_for_error', raise_code)
     def test_parse_single_frame_corrupted_frame(self) -> None:
         empty_bytes = b'\x01\x00\x00\x00\x00\x00\x00'
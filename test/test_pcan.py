@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+This module tests the receive path of :class:`can.interfaces.pcan.PcanBus`
+with a mocked PCAN-Basic library.
+"""
+
+import os
+import unittest
+from unittest.mock import Mock, patch
+
+import can
+from can.interfaces.pcan import pcan
+from can.interfaces.pcan.basic import (
+    PCAN_ERROR_BUSLIGHT,
+    PCAN_ERROR_OK,
+    PCAN_ERROR_QRCVEMPTY,
+    PCAN_MESSAGE_EXTENDED,
+    PCAN_MESSAGE_STANDARD,
+    PCAN_RECEIVE_EVENT,
+    TPCANMsg,
+    TPCANTimestamp,
+)
+
+EMPTY = (PCAN_ERROR_QRCVEMPTY, None, None)
+
+
+def _read_result(arbitration_id, data, is_extended_id=False):
+    msg = TPCANMsg()
+    msg.ID = arbitration_id
+    msg.LEN = len(data)
+    msg.MSGTYPE = (
+        PCAN_MESSAGE_EXTENDED.value if is_extended_id else PCAN_MESSAGE_STANDARD.value
+    )
+    for i, byte in enumerate(data):
+        msg.DATA[i] = byte
+    timestamp = TPCANTimestamp()
+    timestamp.millis = 1000
+    return PCAN_ERROR_OK, msg, timestamp
+
+
+class PcanLinuxReceiveTest(unittest.TestCase):
+    def setUp(self):
+        self.read_fd, self.write_fd = os.pipe()
+        self.addCleanup(os.close, self.read_fd)
+        self.addCleanup(os.close, self.write_fd)
+
+        self.basic = Mock()
+        self.basic.Initialize.return_value = PCAN_ERROR_OK
+        self.basic.SetValue.return_value = PCAN_ERROR_OK
+        self.basic.GetValue.return_value = (PCAN_ERROR_OK, self.read_fd)
+        self.basic.Read.return_value = EMPTY
+
+        for patcher in (
+            patch.object(pcan, "PCANBasic", return_value=self.basic),
+            patch.object(pcan, "HAS_EVENTS", False),
+            patch.object(pcan.platform, "system", return_value="Linux"),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.bus = can.Bus(bustype="pcan", channel="PCAN_USBBUS1")
+        self.addCleanup(self.bus.shutdown)
+
+    def test_receive_event_fd(self):
+        self.basic.GetValue.assert_called_once_with(
+            self.bus.m_PcanHandle, PCAN_RECEIVE_EVENT
+        )
+        self.assertEqual(self.bus.fileno(), self.read_fd)
+
+    @patch("can.interfaces.pcan.pcan.time.sleep")
+    def test_recv_waits_on_fd(self, sleep):
+        self.basic.Read.side_effect = [EMPTY, _read_result(0x123, [1, 2, 3])]
+        # the driver signals a received message
+        os.write(self.write_fd, b"\x00")
+
+        msg = self.bus.recv(1.0)
+
+        self.assertEqual(msg.arbitration_id, 0x123)
+        self.assertEqual(bytes(msg.data), b"\x01\x02\x03")
+        self.assertAlmostEqual(msg.timestamp, 1.0 + pcan.boottimeEpoch)
+        sleep.assert_not_called()
+
+    @patch("can.interfaces.pcan.pcan.time.sleep")
+    def test_recv_timeout(self, sleep):
+        self.assertIsNone(self.bus.recv(0.01))
+        sleep.assert_not_called()
+
+    def test_recv_batch_drains_queue(self):
+        self.basic.Read.side_effect = [
+            _read_result(0x1, [1]),
+            _read_result(0x2, [2], is_extended_id=True),
+            _read_result(0x3, [3]),
+            EMPTY,
+        ]
+        msgs = self.bus.recv_batch(timeout=0)
+        self.assertEqual([msg.arbitration_id for msg in msgs], [1, 2, 3])
+        self.assertTrue(msgs[1].is_extended_id)
+        self.assertEqual(self.basic.Read.call_count, 4)
+
+    def test_recv_batch_stops_at_errors(self):
+        self.basic.Read.side_effect = [
+            _read_result(0x1, [1]),
+            (PCAN_ERROR_BUSLIGHT, None, None),
+        ]
+        msgs = self.bus.recv_batch(timeout=0)
+        self.assertEqual([msg.arbitration_id for msg in msgs], [1])
+
+    def test_polling_without_fd(self):
+        self.basic.GetValue.return_value = (PCAN_ERROR_QRCVEMPTY, 0)
+        self.basic.GetErrorText.return_value = (PCAN_ERROR_OK, b"error")
+        with can.Bus(bustype="pcan", channel="PCAN_USBBUS1") as bus:
+            with self.assertRaises(NotImplementedError):
+                bus.fileno()
+            self.assertIsNone(bus.recv(0.01))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+This module tests :class:`can.interfaces.poller.DriverPoller` and the
+interfaces which receive with it, using mocked drivers.
+"""
+
+import select
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+import can
+from can.interfaces import iscan, nican
+from can.interfaces.poller import DriverPoller
+
+
+class FakeDriver:
+    """A driver queue which is filled by the tests."""
+
+    def __init__(self):
+        self.queue = []
+        self.lock = threading.Lock()
+        self.reads = 0
+
+    def put(self, *arbitration_ids):
+        with self.lock:
+            self.queue.extend(arbitration_ids)
+
+    def read(self, timeout):
+        with self.lock:
+            self.reads += 1
+            msgs = [can.Message(arbitration_id=i) for i in self.queue]
+            del self.queue[:]
+        return msgs
+
+
+class DriverPollerTest(unittest.TestCase):
+    def setUp(self):
+        self.driver = FakeDriver()
+        self.poller = DriverPoller(self.driver.read, "test poller")
+        self.addCleanup(self.poller.stop)
+
+    def _readable(self, timeout=0.0):
+        return bool(select.select([self.poller.fileno()], [], [], timeout)[0])
+
+    def test_get(self):
+        self.assertEqual(self.poller.get(10, 0), [])
+        self.driver.put(1, 2, 3)
+        msgs = self.poller.get(2, 1.0)
+        self.assertEqual([msg.arbitration_id for msg in msgs], [1, 2])
+        msgs = self.poller.get(2, 1.0)
+        self.assertEqual([msg.arbitration_id for msg in msgs], [3])
+
+    def test_get_timeout(self):
+        start = time.perf_counter()
+        self.assertEqual(self.poller.get(1, 0.05), [])
+        self.assertGreaterEqual(time.perf_counter() - start, 0.04)
+
+    def test_fileno(self):
+        self.assertFalse(self._readable())
+        self.driver.put(1)
+        self.assertTrue(self._readable(1.0))
+        self.assertEqual(len(self.poller.get(10, 0)), 1)
+        self.assertFalse(self._readable())
+
+    def test_back_off(self):
+        time.sleep(0.1)
+        # the thread sleeps up to max_interval between reads while idle
+        self.assertLess(self.driver.reads, 0.1 / self.poller.max_interval + 15)
+
+    def test_queue_limit(self):
+        driver = FakeDriver()
+        poller = DriverPoller(driver.read, "limited poller", max_queue_size=3)
+        self.addCleanup(poller.stop)
+        driver.put(1, 2, 3, 4, 5)
+        end_time = time.perf_counter() + 1.0
+        while driver.queue and time.perf_counter() < end_time:
+            time.sleep(0.001)
+        msgs = poller.get(10, 1.0)
+        self.assertEqual([msg.arbitration_id for msg in msgs], [3, 4, 5])
+        self.assertEqual(poller.dropped, 2)
+
+    def test_read_error(self):
+        error = can.CanError("driver failed")
+        poller = DriverPoller(Mock(side_effect=error), "failing poller")
+        self.addCleanup(poller.stop)
+        with self.assertRaises(can.CanError):
+            poller.get(1, 1.0)
+        self.assertIs(poller.exception, error)
+
+
+class IscanBusTest(unittest.TestCase):
+    def setUp(self):
+        self.driver = Mock()
+        self.received = []
+
+        def receive(channel, raw_msg):
+            if not self.received:
+                raise iscan.IscanError(Mock(__name__="receive"), 8, ())
+            raw_msg._obj.message_id = self.received.pop(0)
+            raw_msg._obj.data_len = 1
+
+        self.driver.isCAN_ReceiveMessageEx.side_effect = receive
+        patcher = patch.object(iscan, "iscan", self.driver)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.bus = can.Bus(bustype="iscan", channel=0, poll_interval=0.001)
+        self.addCleanup(self.bus.shutdown)
+
+    def test_recv_batch(self):
+        self.received = [0x1, 0x2, 0x3]
+        self.assertTrue(select.select([self.bus.fileno()], [], [], 1.0)[0])
+        time.sleep(0.01)
+        msgs = self.bus.recv_batch(timeout=0)
+        self.assertEqual([msg.arbitration_id for msg in msgs], [1, 2, 3])
+        self.assertIsNone(self.bus.recv(0))
+
+    def test_driver_statistics(self):
+        self.assertEqual(self.bus.statistics.driver, {"dropped": 0})
+
+    def test_no_poller_if_init_fails(self):
+        with patch.object(can.BusABC, "__init__", side_effect=ValueError):
+            with self.assertRaises(ValueError):
+                can.Bus(bustype="iscan", channel=1)
+        names = [thread.name for thread in threading.enumerate()]
+        self.assertNotIn("can.iscan receiver 1", names)
+
+    def test_driver_error(self):
+        self.driver.isCAN_ReceiveMessageEx.side_effect = iscan.IscanError(
+            Mock(__name__="receive"), 16, ()
+        )
+        with self.assertRaises(iscan.IscanError):
+            self.bus.recv(1.0)
+
+
+class NicanBusTest(unittest.TestCase):
+    def setUp(self):
+        self.driver = Mock()
+        self.received = []
+        self.lock = threading.Lock()
+
+        def wait_for_state(handle, state, timeout, state_p):
+            with self.lock:
+                if self.received:
+                    return
+            time.sleep(timeout / 1000)
+            raise nican.NicanError(Mock(), nican.TIMEOUT_ERROR_CODE, ())
+
+        def read(handle, size, raw_msg):
+            with self.lock:
+                raw_msg._obj.arb_id = self.received.pop(0)
+            raw_msg._obj.dlc = 0
+
+        self.driver.ncWaitForState.side_effect = wait_for_state
+        self.driver.ncRead.side_effect = read
+        patcher = patch.object(nican, "nican", self.driver)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.bus = can.Bus(bustype="nican", channel="CAN0", bitrate=500000)
+        self.addCleanup(self.bus.shutdown)
+
+    def test_recv(self):
+        with self.lock:
+            self.received = [0x10, 0x11]
+        msg = self.bus.recv(1.0)
+        self.assertEqual(msg.arbitration_id, 0x10)
+        self.assertEqual(msg.channel, "CAN0")
+        self.assertEqual(self.bus.recv(1.0).arbitration_id, 0x11)
+        self.assertIsNone(self.bus.recv(0.01))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -941,6 +941,14 @@ class robotellTestCase(unittest.TestCase):
             ),
         )
 
+    def test_escaped_checksum(self):
+        # the checksum of this message is 0x55, which is escaped right before
+        # the two TAIL bytes
+        self.bus.send(can.Message(arbitration_id=0x55, is_extended_id=False))
+        self.bus.send(can.Message(arbitration_id=0x56, is_extended_id=False))
+        self.assertEqual(self.bus.recv(1).arbitration_id, 0x55)
+        self.assertEqual(self.bus.recv(1).arbitration_id, 0x56)
+
 
 if __name__ == "__main__":
     unittest.main()
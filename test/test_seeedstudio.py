@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+This module tests the framing of the seeedstudio interface over a loopback
+serial port.
+"""
+
+import unittest
+from unittest.mock import patch
+
+import serial
+
+import can
+from can.interfaces.seeedstudio import SeeedBus
+
+
+class SeeedBusTest(unittest.TestCase):
+    def setUp(self):
+        patcher = patch(
+            "serial.Serial",
+            side_effect=lambda *args, **kwargs: serial.serial_for_url(
+                "loop://", timeout=kwargs["timeout"]
+            ),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.bus = SeeedBus("/dev/ttyUSB0")
+        self.addCleanup(self.bus.shutdown)
+
+    def test_init_frame_is_skipped(self):
+        # the init frame looks like a status response and is not a message
+        self.assertIsNone(self.bus.recv(0))
+        self.assertEqual(self.bus.ser.in_waiting, 0)
+
+    def test_send_recv(self):
+        msgs = [
+            can.Message(arbitration_id=0x123, is_extended_id=False, data=[1, 2]),
+            can.Message(arbitration_id=0x1234567, data=[0x55, 0xAA, 0x55]),
+            can.Message(arbitration_id=0x7FF, is_extended_id=False, data=[]),
+            can.Message(arbitration_id=0x10, is_remote_frame=True, dlc=0),
+        ]
+        for msg in msgs:
+            self.bus.send(msg)
+        received = self.bus.recv_batch()
+        self.assertEqual(len(received), len(msgs))
+        for msg, rx_msg in zip(msgs, received):
+            self.assertEqual(msg.arbitration_id, rx_msg.arbitration_id)
+            self.assertEqual(msg.is_extended_id, rx_msg.is_extended_id)
+            self.assertEqual(msg.is_remote_frame, rx_msg.is_remote_frame)
+            self.assertEqual(msg.data, rx_msg.data)
+
+    def test_partial_frame(self):
+        self.bus.send(can.Message(arbitration_id=0x1, data=[1, 2, 3, 4]))
+        frame = self.bus.ser.read(self.bus.ser.in_waiting)
+        self.bus.ser.write(b"\x00\x01" + frame[:5])
+        self.assertIsNone(self.bus.recv(0))
+        self.bus.ser.write(frame[5:])
+        msg = self.bus.recv(0)
+        self.assertEqual(msg.arbitration_id, 0x1)
+        self.assertEqual(bytes(msg.data), b"\x01\x02\x03\x04")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,10 @@
 #!/usr/bin/env python
 # coding: utf-8
 
+import time
 import unittest
+from unittest.mock import patch
+
 import can
 
 
@@ -123,6 +126,56 @@ class slcanTestCase(unittest.TestCase):
         sn = self.bus.get_serial_number(0)
         self.assertIsNone(sn)
 
+    def test_recv_batch(self):
+        self.serial.write(b"t1001AA\rz\r\at2002BBCC\rT000000030\rt4")
+        msgs = self.bus.recv_batch(timeout=0)
+        self.assertEqual([msg.arbitration_id for msg in msgs], [0x100, 0x200, 0x3])
+        self.assertEqual([bytes(msg.data) for msg in msgs], [b"\xaa", b"\xbb\xcc", b""])
+        self.assertEqual(self.bus.recv_batch(timeout=0), [])
+
+    def test_recv_device_timestamps(self):
+        with patch("time.time", return_value=1000.0):
+            self.serial.write(b"t1001AAEA5F\r")
+            first = self.bus.recv(0)
+        self.assertEqual(first.timestamp, 1000.0)
+        self.assertSequenceEqual(first.data, [0xAA])
+
+        # 100 ms later, after the device counter wrapped around
+        with patch("time.time", return_value=1000.15):
+            self.serial.write(b"r12300063\r")
+            second = self.bus.recv(0)
+        self.assertTrue(second.is_remote_frame)
+        self.assertAlmostEqual(second.timestamp - first.timestamp, 0.1)
+
+        # the next frame is received more than a minute later
+        with patch("time.time", return_value=1070.2):
+            self.serial.write(b"t1000000A\r")
+            third = self.bus.recv(0)
+        self.assertAlmostEqual(third.timestamp - first.timestamp, 60.011)
+
+    def test_device_timestamps_enabled(self):
+        bus = can.Bus(
+            "loop://", bustype="slcan", sleep_after_open=0, device_timestamps=True
+        )
+        data = bus.serialPortOrig.read(bus.serialPortOrig.in_waiting)
+        self.assertEqual(data, b"Z1\rO\r")
+        bus.shutdown()
+
+    def test_send_batch(self):
+        msgs = [
+            can.Message(arbitration_id=0x100, is_extended_id=False, data=[0xAB]),
+            can.Message(arbitration_id=0x12ABCDEF, data=[0x01, 0x02]),
+            can.Message(
+                arbitration_id=0x200, is_extended_id=False, is_remote_frame=True
+            ),
+        ]
+        with patch.object(self.serial, "write", wraps=self.serial.write) as write:
+            self.assertEqual(self.bus.send_batch(msgs), 3)
+        write.assert_called_once()
+        data = self.serial.read(self.serial.in_waiting)
+        self.assertEqual(data, b"t1001AB\rT12ABCDEF20102\rr2000\r")
+        self.assertEqual(self.bus.statistics.tx_frames, 3)
+
 
 if __name__ == "__main__":
     unittest.main()
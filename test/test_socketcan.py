@@ -8,9 +8,16 @@ from unittest.mock import patch
 from unittest.mock import call
 
 import ctypes
+import errno
+import socket
+import struct
 
+import can
 from can.interfaces.socketcan.socketcan import (
+    SocketcanBus,
+    capture_message,
     bcm_header_factory,
+    build_can_frame,
     build_bcm_header,
     build_bcm_tx_delete_header,
     build_bcm_transmit_header,
@@ -18,9 +25,18 @@ from can.interfaces.socketcan.socketcan import (
     BcmMsgHead,
 )
 from can.interfaces.socketcan.constants import (
+    CAN_BCM_RX_CHANGED,
+    CAN_BCM_RX_DELETE,
+    CAN_BCM_RX_SETUP,
+    CAN_BCM_RX_TIMEOUT,
     CAN_BCM_TX_DELETE,
     CAN_BCM_TX_SETUP,
+    CAN_EFF_FLAG,
+    RX_ANNOUNCE_RESUME,
+    RX_CHECK_DLC,
+    RX_FILTER_ID,
     SETTIMER,
+    SO_RXQ_OVFL,
     STARTTIMER,
     TX_COUNTEVT,
 )
@@ -379,5 +395,294 @@ class SocketCANTest(unittest.TestCase):
         self.assertEqual(1, result.nframes)
 
 
+class SocketcanBusTest(unittest.TestCase):
+    """Tests :class:`SocketcanBus` on top of a mocked raw socket."""
+
+    def setUp(self):
+        self.socket = Mock()
+        patcher = patch(
+            "can.interfaces.socketcan.socketcan.create_socket", return_value=self.socket
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.bus = SocketcanBus(channel="vcan0")
+        self.addCleanup(self.bus.shutdown)
+
+    def test_send_batch(self):
+        msgs = [
+            can.Message(arbitration_id=0x100, data=[1, 2, 3]),
+            can.Message(arbitration_id=0x200, data=[4, 5], is_extended_id=False),
+            can.Message(arbitration_id=0x300, data=range(12), is_fd=True),
+        ]
+        self.socket.send.side_effect = lambda frame: len(frame)
+
+        self.assertEqual(self.bus.send_batch(msgs), 3)
+
+        sent_frames = [bytes(c[0][0]) for c in self.socket.send.call_args_list]
+        self.assertEqual(sent_frames, [build_can_frame(msg) for msg in msgs])
+        self.assertEqual(self.bus.statistics.tx_frames, 3)
+        self.assertEqual(self.bus.statistics.tx_bytes, 17)
+
+    @patch("can.interfaces.socketcan.socketcan.time.sleep")
+    def test_send_batch_retries_on_enobufs(self, sleep):
+        msgs = [can.Message(arbitration_id=i) for i in range(3)]
+        self.socket.send.side_effect = [
+            16,
+            OSError(errno.ENOBUFS, "No buffer space available"),
+            OSError(errno.ENOBUFS, "No buffer space available"),
+            16,
+            16,
+        ]
+
+        self.assertEqual(self.bus.send_batch(msgs, timeout=1.0), 3)
+        self.assertEqual(sleep.call_count, 2)
+        # the back-off grows while the queue stays full
+        self.assertLess(sleep.call_args_list[0][0][0], sleep.call_args_list[1][0][0])
+
+    @patch("can.interfaces.socketcan.socketcan.time.sleep")
+    def test_send_batch_retries_until_sent_without_timeout(self, sleep):
+        msgs = [can.Message(arbitration_id=i) for i in range(3)]
+        self.socket.send.side_effect = (
+            [16] + [OSError(errno.ENOBUFS, "No buffer space available")] * 20 + [16, 16]
+        )
+
+        self.assertEqual(self.bus.send_batch(msgs), 3)
+        self.assertEqual(sleep.call_count, 20)
+        self.assertEqual(self.bus.statistics.tx_frames, 3)
+
+    def test_send_batch_returns_partial_count_on_timeout(self):
+        msgs = [can.Message(arbitration_id=i) for i in range(3)]
+        self.socket.send.side_effect = [
+            16,
+            OSError(errno.ENOBUFS, "No buffer space available"),
+        ]
+
+        self.assertEqual(self.bus.send_batch(msgs, timeout=0), 1)
+        self.assertEqual(self.bus.statistics.tx_frames, 1)
+
+    def test_send_batch_raises_on_other_errors(self):
+        self.socket.send.side_effect = OSError(errno.ENETDOWN, "Network is down")
+
+        with self.assertRaises(can.CanError):
+            self.bus.send_batch([can.Message()])
+        self.assertEqual(self.bus.statistics.send_errors, 1)
+
+    @patch("can.interfaces.socketcan.socketcan.create_bcm_socket")
+    def test_subscribe_bcm(self, create_bcm_socket):
+        bcm_socket = create_bcm_socket.return_value
+
+        task = self.bus.subscribe_bcm(
+            0x123, is_extended_id=True, data_mask=b"\xff\x0f", timeout=0.5
+        )
+
+        create_bcm_socket.assert_called_once_with("vcan0")
+        data = bcm_socket.send.call_args[0][0]
+        header = BcmMsgHead.from_buffer_copy(data)
+        self.assertEqual(CAN_BCM_RX_SETUP, header.opcode)
+        self.assertEqual(
+            SETTIMER | STARTTIMER | RX_ANNOUNCE_RESUME | RX_CHECK_DLC, header.flags
+        )
+        self.assertEqual(0x123 | CAN_EFF_FLAG, header.can_id)
+        self.assertEqual(0, header.ival1_tv_sec)
+        self.assertEqual(500000, header.ival1_tv_usec)
+        self.assertEqual(1, header.nframes)
+        mask_frame = data[ctypes.sizeof(BcmMsgHead) :]
+        self.assertEqual(mask_frame[8:], b"\xff\x0f" + bytes(6))
+
+        task.stop()
+        header = BcmMsgHead.from_buffer_copy(bcm_socket.send.call_args[0][0])
+        self.assertEqual(CAN_BCM_RX_DELETE, header.opcode)
+        self.assertEqual(0x123 | CAN_EFF_FLAG, header.can_id)
+
+    @patch("can.interfaces.socketcan.socketcan.create_bcm_socket")
+    def test_subscribe_bcm_every_frame(self, create_bcm_socket):
+        self.bus.subscribe_bcm(0x42, only_changes=False)
+
+        data = create_bcm_socket.return_value.send.call_args[0][0]
+        header = BcmMsgHead.from_buffer_copy(data)
+        self.assertEqual(RX_FILTER_ID, header.flags)
+        self.assertEqual(0, header.nframes)
+        self.assertEqual(len(data), ctypes.sizeof(BcmMsgHead))
+
+    @patch("can.interfaces.socketcan.socketcan.fcntl.ioctl")
+    @patch("can.interfaces.socketcan.socketcan.select.select")
+    @patch("can.interfaces.socketcan.socketcan.create_bcm_socket")
+    def test_recv_bcm(self, create_bcm_socket, select, ioctl):
+        bcm_socket = create_bcm_socket.return_value
+        select.return_value = ([bcm_socket], [], [])
+        ioctl.return_value = struct.pack("@LL", 12, 500000)
+        changed = build_bcm_header(CAN_BCM_RX_CHANGED, 0, 0, 0, 0, 0, 0, 0x7FF, 1)
+        changed += build_can_frame(
+            can.Message(arbitration_id=0x7FF, is_extended_id=False, data=[1, 2])
+        )
+        timeout = build_bcm_header(CAN_BCM_RX_TIMEOUT, 0, 0, 0, 0, 0, 0, 0x7FF, 0)
+        bcm_socket.recv.side_effect = [changed, timeout]
+
+        event = self.bus.recv_bcm(1.0)
+        self.assertEqual(CAN_BCM_RX_CHANGED, event.opcode)
+        self.assertFalse(event.is_timeout)
+        self.assertEqual(0x7FF, event.arbitration_id)
+        self.assertAlmostEqual(12.5, event.timestamp)
+        self.assertEqual(0x7FF, event.message.arbitration_id)
+        self.assertEqual(bytearray([1, 2]), event.message.data)
+        self.assertEqual("vcan0", event.message.channel)
+
+        event = self.bus.recv_bcm(1.0)
+        self.assertTrue(event.is_timeout)
+        self.assertEqual(0x7FF, event.arbitration_id)
+        self.assertIsNone(event.message)
+
+        select.return_value = ([], [], [])
+        self.assertIsNone(self.bus.recv_bcm(0))
+
+    def test_socket_buffer_sizes(self):
+        self.socket.reset_mock()
+        bus = SocketcanBus(
+            channel="vcan0", receive_buffer_size=1 << 20, send_buffer_size=4096
+        )
+        self.addCleanup(bus.shutdown)
+
+        self.socket.setsockopt.assert_any_call(
+            socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20
+        )
+        self.socket.setsockopt.assert_any_call(
+            socket.SOL_SOCKET, socket.SO_SNDBUF, 4096
+        )
+
+        self.socket.getsockopt.side_effect = [2 << 20, 8192]
+        stats = bus.get_stats()
+        self.assertEqual(stats.receive_buffer_size, 2 << 20)
+        self.assertEqual(stats.send_buffer_size, 8192)
+
+    @patch("can.interfaces.socketcan.socketcan.fcntl.ioctl")
+    @patch("can.interfaces.socketcan.socketcan.select.select")
+    def test_count_dropped_frames(self, select, ioctl):
+        bus = SocketcanBus(channel="vcan0", count_dropped_frames=True)
+        self.addCleanup(bus.shutdown)
+        self.socket.setsockopt.assert_any_call(socket.SOL_SOCKET, SO_RXQ_OVFL, 1)
+
+        select.return_value = ([self.socket], [], [])
+        ioctl.return_value = struct.pack("@LL", 0, 0)
+        frame = build_can_frame(can.Message(arbitration_id=0x10))
+        self.socket.recvmsg.side_effect = [
+            (frame, [], 0, ("vcan0", 0)),
+            (
+                frame,
+                [(socket.SOL_SOCKET, SO_RXQ_OVFL, struct.pack("=I", 42))],
+                0,
+                ("vcan0", 0),
+            ),
+        ]
+
+        self.assertIsNotNone(bus.recv(0))
+        self.assertEqual(bus.get_stats().kernel_dropped, 0)
+        self.assertIsNotNone(bus.recv(0))
+        self.assertEqual(bus.get_stats().kernel_dropped, 42)
+
+        self.socket.getsockopt.return_value = 4096
+        statistics = bus.statistics
+        self.assertEqual(statistics.rx_frames, 2)
+        self.assertEqual(statistics.driver["kernel_dropped"], 42)
+        self.assertEqual(statistics.driver["receive_buffer_size"], 4096)
+
+    @patch("can.interfaces.socketcan.socketcan.fcntl.ioctl")
+    def test_capture_message_without_statistics(self, ioctl):
+        sock = Mock()
+        ioctl.return_value = struct.pack("@LL", 0, 0)
+        sock.recvmsg.return_value = (
+            build_can_frame(can.Message(arbitration_id=0x10)),
+            [],
+            0,
+            ("vcan0", 0),
+        )
+
+        msg = capture_message(sock, get_channel=True)
+        self.assertEqual(msg.arbitration_id, 0x10)
+        self.assertEqual(msg.channel, "vcan0")
+        # no room for ancillary data is requested
+        sock.recvmsg.assert_called_once_with(72, 0)
+
+    @patch("can.interfaces.socketcan.socketcan.create_bcm_socket")
+    def test_send_periodic_group(self, create_bcm_socket):
+        bcm_socket = create_bcm_socket.return_value
+        tasks = [
+            (can.Message(arbitration_id=0x100 + i, data=[i]), 0.1) for i in range(5)
+        ]
+
+        group = self.bus.send_periodic_group(tasks)
+
+        # a single TX_SETUP per task and no TX_READ round trips
+        self.assertEqual(bcm_socket.send.call_count, 5)
+        for call_args, task in zip(bcm_socket.send.call_args_list, group.tasks):
+            header = BcmMsgHead.from_buffer_copy(call_args[0][0])
+            self.assertEqual(CAN_BCM_TX_SETUP, header.opcode)
+            self.assertEqual(task.task_id, header.can_id)
+            self.assertEqual(1, header.nframes)
+        self.assertEqual(len({task.task_id for task in group.tasks}), 5)
+
+        bcm_socket.send.reset_mock()
+        self.bus.stop_all_periodic_tasks()
+        self.assertEqual(bcm_socket.send.call_count, 5)
+        for call_args in bcm_socket.send.call_args_list:
+            header = BcmMsgHead.from_buffer_copy(call_args[0][0])
+            self.assertEqual(CAN_BCM_TX_DELETE, header.opcode)
+
+    @patch("can.interfaces.socketcan.socketcan.create_bcm_socket")
+    def test_send_periodic_group_removes_tasks_on_error(self, create_bcm_socket):
+        bcm_socket = create_bcm_socket.return_value
+        bcm_socket.send.side_effect = [
+            100,
+            100,
+            OSError(errno.ENETDOWN, "Network is down"),
+            100,
+            100,
+        ]
+        tasks = [(can.Message(arbitration_id=i), 0.1) for i in range(3)]
+
+        with self.assertRaises(can.CanError):
+            self.bus.send_periodic_group(tasks)
+
+        opcodes = [
+            BcmMsgHead.from_buffer_copy(call_args[0][0]).opcode
+            for call_args in bcm_socket.send.call_args_list
+        ]
+        self.assertEqual(opcodes, [CAN_BCM_TX_SETUP] * 3 + [CAN_BCM_TX_DELETE] * 2)
+        self.assertEqual(self.bus._periodic_tasks, [])
+
+    @patch("can.interfaces.socketcan.socketcan.select.select")
+    def test_send_prepared(self, select):
+        select.return_value = ([], [self.socket], [])
+        self.socket.send.side_effect = lambda frame: len(frame)
+        msg = can.Message(arbitration_id=0x123, data=[1, 2, 3, 4])
+
+        prepared = self.bus.prepare(msg)
+        prepared.data[3] = 0xAA
+        prepared.update(b"\xBB", offset=0)
+        self.bus.send_prepared(prepared)
+
+        expected = can.Message(arbitration_id=0x123, data=[0xBB, 2, 3, 0xAA])
+        self.assertEqual(
+            bytes(self.socket.send.call_args[0][0]), build_can_frame(expected)
+        )
+        self.assertEqual(len(prepared.data), 4)
+
+    @patch("can.interfaces.socketcan.socketcan.select.select")
+    def test_send_prepared_traces_current_payload(self, select):
+        select.return_value = ([], [self.socket], [])
+        self.socket.send.side_effect = lambda frame: len(frame)
+        payloads = []
+        self.bus.add_trace_hook(
+            can.trace.TX, lambda bus, event, msg: payloads.append(bytes(msg.data))
+        )
+
+        prepared = self.bus.prepare(can.Message(arbitration_id=0x123, data=[1, 2]))
+        self.bus.send_prepared(prepared)
+        prepared.update(b"\x03\x04")
+        self.bus.send_prepared(prepared)
+
+        self.assertEqual(payloads, [b"\x01\x02", b"\x03\x04"])
+        self.assertEqual(prepared.message.data, b"\x03\x04")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,228 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+This module tests :mod:`can.server` and the socketcand interface
+against each other on localhost.
+"""
+
+import asyncio
+import re
+import socket
+import threading
+import time
+import unittest
+
+import can
+from can.interfaces.socketcand import format_frame, parse_send, split_commands
+from can.server import SocketcandServer
+
+
+class ProtocolTest(unittest.TestCase):
+    def test_split_commands(self):
+        buffer = bytearray(b"< hi >\n< send 123 1 11 >< fra")
+        self.assertEqual(split_commands(buffer), [["hi"], ["send", "123", "1", "11"]])
+        self.assertEqual(buffer, b"< fra")
+        buffer += b"me 1 2 >"
+        self.assertEqual(split_commands(buffer), [["frame", "1", "2"]])
+        self.assertEqual(buffer, b"")
+
+    def test_format_frame(self):
+        msg = can.Message(timestamp=1.5, arbitration_id=0x12, is_extended_id=False)
+        self.assertEqual(format_frame(msg), "< frame 012 1.500000 >")
+        msg = can.Message(timestamp=2, arbitration_id=0x12, data=[0xAB, 1])
+        self.assertEqual(format_frame(msg), "< frame 00000012 2.000000 AB 01 >")
+
+    def test_parse_send(self):
+        msg = parse_send(["7FF", "2", "AB", "01"])
+        self.assertEqual(msg.arbitration_id, 0x7FF)
+        self.assertFalse(msg.is_extended_id)
+        self.assertEqual(msg.data, b"\xab\x01")
+        self.assertTrue(parse_send(["00000001", "0"]).is_extended_id)
+        for args in (["800", "0"], ["123", "2", "11"], ["123"], ["xyz", "0"]):
+            with self.assertRaises(ValueError):
+                parse_send(args)
+
+
+class SocketcandServerTest(unittest.TestCase):
+    def setUp(self):
+        self.bus = can.Bus(interface="virtual", channel="socketcand_test")
+        self.addCleanup(self.bus.shutdown)
+        self.peer = can.Bus(interface="virtual", channel="socketcand_test")
+        self.addCleanup(self.peer.shutdown)
+
+        self.loop = asyncio.new_event_loop()
+        self.server = SocketcandServer(self.bus, "can0", port=0)
+        started = threading.Event()
+
+        def run():
+            asyncio.set_event_loop(self.loop)
+            self.loop.run_until_complete(self.server.start())
+            started.set()
+            self.loop.run_forever()
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        self.assertTrue(started.wait(5.0))
+        self.addCleanup(self._stop_server, thread)
+        self.host, self.port = self.server.address
+
+    def _stop_server(self, thread):
+        asyncio.run_coroutine_threadsafe(self.server.stop(), self.loop).result(5.0)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        thread.join(5.0)
+        self.loop.close()
+
+    def _client(self):
+        client = can.Bus(
+            interface="socketcand", channel="can0", host=self.host, port=self.port
+        )
+        self.addCleanup(client.shutdown)
+        return client
+
+    def _connect(self):
+        sock = socket.create_connection((self.host, self.port), timeout=2.0)
+        self.addCleanup(sock.close)
+        self.assertEqual(sock.recv(100), b"< hi >")
+        return sock
+
+    def _read_until(self, sock, end, timeout=2.0):
+        data = b""
+        end_time = time.time() + timeout
+        while not data.endswith(end) and time.time() < end_time:
+            data += sock.recv(65536)
+        return data
+
+    def test_send(self):
+        client = self._client()
+        client.send(can.Message(arbitration_id=0x123, is_extended_id=False, data=[1]))
+        msg = self.peer.recv(1.0)
+        self.assertEqual(msg.arbitration_id, 0x123)
+        self.assertFalse(msg.is_extended_id)
+        self.assertEqual(msg.data, b"\x01")
+
+        msgs = [can.Message(arbitration_id=i, data=[i]) for i in range(10)]
+        self.assertEqual(client.send_batch(msgs), 10)
+        received = [self.peer.recv(1.0) for _ in range(10)]
+        self.assertEqual([msg.arbitration_id for msg in received], list(range(10)))
+        self.assertTrue(all(msg.is_extended_id for msg in received))
+
+    def test_receive(self):
+        client = self._client()
+        second = self._client()
+        msgs = [can.Message(arbitration_id=i, data=[i % 256] * 8) for i in range(1000)]
+        for msg in msgs:
+            self.peer.send(msg)
+
+        for bus in (client, second):
+            received = []
+            batch = bus.recv_batch(1000, 1.0)
+            while batch:
+                received.extend(batch)
+                batch = bus.recv_batch(1000, 0.2)
+            self.assertEqual(len(received), 1000)
+            for msg, received_msg in zip(msgs, received):
+                self.assertEqual(msg.arbitration_id, received_msg.arbitration_id)
+                self.assertEqual(msg.data, received_msg.data)
+                self.assertEqual(received_msg.channel, "can0")
+
+    def test_receive_special_frames(self):
+        raw = self._connect()
+        raw.sendall(b"< open can0 >< rawmode >")
+        self.assertEqual(self._read_until(raw, b"< ok >< ok >"), b"< ok >< ok >")
+        bcm = self._connect()
+        bcm.sendall(
+            b"< open can0 >< subscribe 0 0 00000001 >< subscribe 0 0 00000002 >"
+        )
+        self.assertEqual(self._read_until(bcm, b"< ok >"), b"< ok >")
+        time.sleep(0.1)
+        self.peer.send(can.Message(arbitration_id=1, is_remote_frame=True, dlc=2))
+        self.peer.send(can.Message(arbitration_id=1, is_fd=True, data=range(16)))
+        self.peer.send(can.Message(arbitration_id=2, is_error_frame=True, data=[4]))
+        self.peer.send(can.Message(arbitration_id=2, data=[5]))
+
+        # remote frames and frames with more than eight bytes are not sent
+        for sock in (raw, bcm):
+            frames = re.findall(
+                rb"< (\w+) (\w+) [\d.]+([ \w]*) >", self._read_until(sock, b" 05 >")
+            )
+            self.assertEqual(
+                frames,
+                [(b"error", b"00000002", b" 04"), (b"frame", b"00000002", b" 05")],
+            )
+
+    def test_open_unknown_channel(self):
+        with self.assertRaises(can.CanError):
+            can.Bus(interface="socketcand", channel="can1", port=self.port)
+
+    def test_bcm_subscribe(self):
+        sock = self._connect()
+        sock.sendall(b"< open can0 >< subscribe 0 0 001 >< subscribe 0 0 00000002 >")
+        self.assertEqual(self._read_until(sock, b"< ok >"), b"< ok >")
+        time.sleep(0.1)
+        self.peer.send(can.Message(arbitration_id=1, is_extended_id=False, data=[1]))
+        self.peer.send(can.Message(arbitration_id=1, data=[2]))
+        self.peer.send(can.Message(arbitration_id=2, data=[3]))
+        data = self._read_until(sock, b"03 >")
+        self.assertTrue(data.startswith(b"< frame 001 "))
+        self.assertIn(b"< frame 00000002 ", data)
+        self.assertNotIn(b"02 >", data)
+
+        sock.sendall(b"< unsubscribe 001 >< unsubscribe 001 >")
+        self.assertIn(b"< error unsubscribe", self._read_until(sock, b" >"))
+
+    def test_bcm_throttle_and_filter(self):
+        sock = self._connect()
+        sock.sendall(b"< open can0 >< subscribe 0 200000 001 >< filter 0 0 002 1 F0 >")
+        self._read_until(sock, b"< ok >")
+        time.sleep(0.1)
+        for i in range(10):
+            self.peer.send(
+                can.Message(arbitration_id=1, is_extended_id=False, data=[i])
+            )
+            self.peer.send(
+                can.Message(arbitration_id=2, is_extended_id=False, data=[i + 0x0C])
+            )
+        time.sleep(0.4)
+        data = self._read_until(sock, b"09 >")
+        frames = split_commands(bytearray(data))
+        # the first frame and the newest one after the interval
+        self.assertEqual(
+            [words[3] for words in frames if words[1] == "001"], ["00", "09"]
+        )
+        # only when the upper nibble changes
+        self.assertEqual(
+            [words[3] for words in frames if words[1] == "002"], ["0C", "10"]
+        )
+
+    def test_bcm_cyclic(self):
+        sock = self._connect()
+        sock.sendall(b"< open can0 >< add 0 10000 123 1 01 >")
+        self._read_until(sock, b"< ok >")
+        msg = self.peer.recv(1.0)
+        self.assertEqual((msg.arbitration_id, msg.data), (0x123, b"\x01"))
+
+        sock.sendall(b"< update 123 1 02 >")
+        time.sleep(0.05)
+        while self.peer.recv(0) is not None:
+            pass
+        self.assertEqual(self.peer.recv(1.0).data, b"\x02")
+
+        sock.sendall(b"< delete 123 >< echo >")
+        self._read_until(sock, b"< echo >")
+        time.sleep(0.05)
+        while self.peer.recv(0) is not None:
+            pass
+        self.assertIsNone(self.peer.recv(0.1))
+
+    def test_errors(self):
+        sock = self._connect()
+        sock.sendall(b"< rawmode >")
+        self.assertIn(b"< error rawmode", self._read_until(sock, b" >"))
+        sock.sendall(b"< open can0 >< rawmode >< subscribe 0 0 001 >")
+        data = self._read_until(sock, b"Unknown command >")
+        self.assertTrue(data.startswith(b"< ok >< ok >< error subscribe"))
+
+
+if __name__ == "__main__":
+    unittest.main()
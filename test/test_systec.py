@@ -31,6 +31,7 @@ class SystecTest(unittest.TestCase):
         ucan.UcanDeinitCanEx = Mock()
         ucan.UcanDeinitHardware = Mock()
         ucan.UcanWriteCanMsgEx = Mock()
+        ucan.UcanReadCanMsgEx = Mock()
         ucan.UcanResetCanEx = Mock()
         self.bus = can.Bus(bustype="systec", channel=0, bitrate=125000)
 
@@ -133,6 +134,41 @@ class SystecTest(unittest.TestCase):
         can_msg = self.bus.recv()
         self.assertEqual(can_msg, msg)
 
+    @patch("can.interfaces.systec.ucan.UcanServer.get_msg_pending")
+    def test_recv_batch_reads_pending_messages(self, mock_get_msg_pending):
+        def read_can_msg(handle, channel, can_msg, count):
+            self.assertEqual(count._obj.value, 3)
+            for i in range(3):
+                can_msg[i] = CanMsg(i, MsgFrameFormat.MSG_FF_STD, [i])
+            count._obj.value = 3
+
+        mock_get_msg_pending.return_value = 3
+        ucan.UcanReadCanMsgEx.side_effect = read_can_msg
+
+        msgs = self.bus.recv_batch(max_messages=2, timeout=0)
+        self.assertEqual([msg.arbitration_id for msg in msgs], [0, 1])
+        # the rest is buffered, so neither the driver nor the event is asked again
+        mock_get_msg_pending.reset_mock()
+        with patch.object(self.bus._ucan._msg_received_event, "wait") as mock_wait:
+            msg = self.bus.recv(timeout=0.5)
+        self.assertEqual(
+            msg, can.Message(arbitration_id=2, data=[2], is_extended_id=False)
+        )
+        mock_wait.assert_not_called()
+        mock_get_msg_pending.assert_not_called()
+        ucan.UcanReadCanMsgEx.assert_called_once()
+
+    @patch("can.interfaces.systec.ucan.UcanServer.get_msg_pending")
+    def test_recv_waits_for_event(self, mock_get_msg_pending):
+        mock_get_msg_pending.side_effect = [0, 2]
+        with patch.object(
+            self.bus._ucan._msg_received_event, "wait", return_value=True
+        ) as mock_wait:
+            self.bus.recv_batch(timeout=0.5)
+        mock_wait.assert_called_once_with(0.5)
+        c_count = ucan.UcanReadCanMsgEx.call_args[0][3]._obj
+        self.assertEqual(c_count.value, 2)
+
     @staticmethod
     def test_bus_defaults():
         ucan.UcanInitCanEx2.reset_mock()
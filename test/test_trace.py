@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+This module tests the trace hooks in :mod:`can.trace`.
+"""
+
+import unittest
+from unittest.mock import Mock
+
+import can
+from can import trace
+
+
+class TraceTest(unittest.TestCase):
+    def setUp(self):
+        self.sender = can.Bus(bustype="virtual", channel="trace_test")
+        self.receiver = can.Bus(bustype="virtual", channel="trace_test")
+        self.addCleanup(trace.GLOBAL_HOOKS.clear)
+
+    def tearDown(self):
+        self.sender.shutdown()
+        self.receiver.shutdown()
+
+    def test_bus_hooks(self):
+        rx_hook = Mock()
+        tx_hook = Mock()
+        self.receiver.add_trace_hook(trace.RX, rx_hook)
+        self.sender.add_trace_hook(trace.TX, tx_hook)
+
+        msg = can.Message(arbitration_id=0x10)
+        self.sender.send(msg)
+        received = self.receiver.recv(0.1)
+
+        tx_hook.assert_called_once_with(self.sender, trace.TX, msg)
+        rx_hook.assert_called_once_with(self.receiver, trace.RX, received)
+
+        self.receiver.remove_trace_hook(trace.RX, rx_hook)
+        self.sender.send(msg)
+        self.receiver.recv(0.1)
+        self.assertEqual(rx_hook.call_count, 1)
+        self.assertEqual(tx_hook.call_count, 2)
+
+    def test_filtered_messages_are_not_traced(self):
+        hook = Mock()
+        self.receiver.add_trace_hook(trace.RX, hook)
+        self.receiver.set_filters([{"can_id": 0x1, "can_mask": 0x7FF}])
+        self.sender.send(can.Message(arbitration_id=0x2))
+        self.assertIsNone(self.receiver.recv(0))
+        hook.assert_not_called()
+
+    def test_global_hooks(self):
+        hook = Mock()
+        trace.add_hook(trace.RX, hook)
+        self.sender.send(can.Message())
+        msg = self.receiver.recv(0.1)
+        hook.assert_called_once_with(self.receiver, trace.RX, msg)
+
+        trace.remove_hook(trace.RX, hook)
+        self.sender.send(can.Message())
+        self.receiver.recv(0.1)
+        self.assertEqual(hook.call_count, 1)
+
+    def test_error_hook(self):
+        hook = Mock()
+        bus = can.Bus(bustype="virtual", channel="trace_test")
+        bus.add_trace_hook(trace.ERROR, hook)
+        bus.shutdown()
+        with self.assertRaises(can.CanError) as send_error:
+            bus.send(can.Message())
+        with self.assertRaises(can.CanError) as recv_error:
+            bus.recv(0)
+        self.assertEqual(
+            hook.call_args_list,
+            [
+                ((bus, trace.ERROR, send_error.exception),),
+                ((bus, trace.ERROR, recv_error.exception),),
+            ],
+        )
+
+    def test_failing_hook_does_not_break_the_bus(self):
+        self.receiver.add_trace_hook(trace.RX, Mock(side_effect=RuntimeError))
+        self.sender.send(can.Message())
+        with self.assertLogs("can.trace", level="ERROR"):
+            self.assertIsNotNone(self.receiver.recv(0.1))
+
+    def test_unknown_event(self):
+        with self.assertRaises(ValueError):
+            trace.add_hook("frame", Mock())
+        with self.assertRaises(ValueError):
+            self.receiver.remove_trace_hook(trace.RX, Mock())
+
+    def test_log_frames(self):
+        frame_logger = trace.log_frames(self.receiver)
+        self.sender.send(can.Message(arbitration_id=0x123))
+        with self.assertLogs("can.trace", level=can.BusABC.RECV_LOGGING_LEVEL) as logs:
+            self.receiver.recv(0.1)
+        self.assertEqual(len(logs.output), 1)
+        self.assertEqual(logs.records[0].levelno, can.BusABC.RECV_LOGGING_LEVEL)
+        self.assertIn("rx", logs.output[0])
+        self.assertIn("123", logs.output[0])
+        for event in trace.EVENTS:
+            self.receiver.remove_trace_hook(event, frame_logger)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,184 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+This module tests :class:`can.interfaces.udp_bridge.UdpBridgeBus` over
+localhost.
+"""
+
+import select
+import socket
+import time
+import unittest
+
+import can
+from can.interfaces import udp_bridge
+from can.interfaces.udp_bridge import DATAGRAM_HEADER, decode_frames, encode_frame
+
+from .message_helper import ComparingMessagesTestCase
+
+
+class FrameFormatTest(unittest.TestCase, ComparingMessagesTestCase):
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        ComparingMessagesTestCase.__init__(
+            self, allowed_timestamp_delta=None, preserves_channel=False
+        )
+
+    def test_wire_format(self):
+        msg = can.Message(arbitration_id=0x123, is_extended_id=False, data=[1, 2])
+        self.assertEqual(encode_frame(msg), b"\x00\x00\x01\x23\x02\x01\x02")
+        msg = can.Message(arbitration_id=0x123, is_remote_frame=True, dlc=8)
+        self.assertEqual(encode_frame(msg), b"\xc0\x00\x01\x23\x08")
+        msg = can.Message(is_fd=True, bitrate_switch=True, data=[1] * 12)
+        self.assertEqual(encode_frame(msg), b"\x80\x00\x00\x00\x8c\x01" + b"\x01" * 12)
+
+    def test_roundtrip(self):
+        msgs = [
+            can.Message(arbitration_id=0x7FF, is_extended_id=False),
+            can.Message(arbitration_id=0x1FFFFFFF, data=range(8)),
+            can.Message(arbitration_id=0x12, is_remote_frame=True, dlc=3),
+            can.Message(arbitration_id=0x4, is_error_frame=True, data=range(8)),
+            can.Message(
+                is_fd=True,
+                bitrate_switch=True,
+                error_state_indicator=True,
+                data=range(64),
+            ),
+        ]
+        datagram = DATAGRAM_HEADER.pack(2, 0, 42, len(msgs))
+        datagram += b"".join(encode_frame(msg) for msg in msgs)
+        sequence, decoded = decode_frames(datagram)
+        self.assertEqual(sequence, 42)
+        self.assertMessagesEqual(msgs, decoded)
+
+    def test_invalid_datagrams(self):
+        frame = encode_frame(can.Message(data=[1, 2, 3]))
+        for datagram in (
+            b"\x02\x00",
+            DATAGRAM_HEADER.pack(1, 0, 0, 1) + frame,
+            DATAGRAM_HEADER.pack(2, 1, 0, 0),
+            DATAGRAM_HEADER.pack(2, 0, 0, 1) + frame[:-1],
+            DATAGRAM_HEADER.pack(2, 0, 0, 2) + frame,
+        ):
+            with self.assertRaises(ValueError):
+                decode_frames(datagram)
+
+
+class UdpBridgeBusTest(unittest.TestCase):
+    def setUp(self):
+        self.receiver = can.Bus(interface="udp_bridge", channel="127.0.0.1:0")
+        self.addCleanup(self.receiver.shutdown)
+
+    def _sender(self, **kwargs):
+        sender = can.Bus(
+            interface="udp_bridge",
+            channel="127.0.0.1:0",
+            remote=self.receiver.address,
+            **kwargs
+        )
+        self.addCleanup(sender.shutdown)
+        return sender
+
+    def _receive_all(self, timeout=0.5):
+        msgs = []
+        batch = self.receiver.recv_batch(1000, timeout)
+        while batch:
+            msgs.extend(batch)
+            batch = self.receiver.recv_batch(1000, timeout)
+        return msgs
+
+    def _datagrams(self, bus):
+        return bus.statistics.driver["datagrams_sent"]
+
+    def test_send_batch(self):
+        sender = self._sender()
+        msgs = [can.Message(arbitration_id=i, data=[i % 256] * 8) for i in range(500)]
+        self.assertEqual(sender.send_batch(msgs), 500)
+        # 113 frames of 13 bytes fit into a datagram
+        self.assertEqual(self._datagrams(sender), 5)
+        self.assertEqual(sender.statistics.tx_frames, 500)
+
+        received = self._receive_all()
+        self.assertEqual([msg.arbitration_id for msg in received], list(range(500)))
+        self.assertTrue(all(msg.is_rx for msg in received))
+        self.assertEqual(self.receiver.statistics.driver["datagrams_received"], 5)
+
+    def test_send_immediately(self):
+        sender = self._sender()
+        sender.send(can.Message(arbitration_id=1))
+        sender.send(can.Message(arbitration_id=2))
+        self.assertEqual(self._datagrams(sender), 2)
+        self.assertEqual(len(self._receive_all()), 2)
+
+    def test_flush_timeout(self):
+        sender = self._sender(flush_timeout=0.05)
+        for i in range(10):
+            sender.send(can.Message(arbitration_id=i))
+        self.assertEqual(self._datagrams(sender), 0)
+        self.assertEqual(len(self._receive_all()), 10)
+        self.assertEqual(self._datagrams(sender), 1)
+
+        sender.send(can.Message(arbitration_id=10))
+        sender.flush()
+        self.assertEqual(self._datagrams(sender), 2)
+
+        sender.send(can.Message(arbitration_id=11))
+        sender.flush_tx_buffer()
+        time.sleep(0.1)
+        self.assertEqual(self._datagrams(sender), 2)
+        self.assertEqual(len(self._receive_all()), 1)
+
+    def test_reply_to_peer(self):
+        with self.assertRaises(can.CanError):
+            self.receiver.send(can.Message())
+        sender = self._sender()
+        sender.send(can.Message(arbitration_id=1))
+        self.assertIsNotNone(self.receiver.recv(1.0))
+        self.receiver.send(can.Message(arbitration_id=2))
+        self.assertEqual(sender.recv(1.0).arbitration_id, 2)
+
+    def test_lost_datagrams(self):
+        frame = encode_frame(can.Message(arbitration_id=1))
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            for sequence in (254, 255, 2, 3):
+                datagram = DATAGRAM_HEADER.pack(2, 0, sequence, 1) + frame
+                sock.sendto(datagram, self.receiver.address)
+            sock.sendto(b"invalid", self.receiver.address)
+        self.assertEqual(len(self._receive_all()), 4)
+        statistics = self.receiver.statistics.driver
+        self.assertEqual(statistics["datagrams_lost"], 2)
+        self.assertEqual(statistics["datagrams_invalid"], 1)
+
+    def test_fileno(self):
+        fileno = self.receiver.fileno()
+        self.assertFalse(select.select([fileno], [], [], 0)[0])
+        self._sender().send_batch([can.Message(arbitration_id=i) for i in range(10)])
+        self.assertTrue(select.select([fileno], [], [], 1.0)[0])
+        self.assertEqual(len(self.receiver.recv_batch(5, 0)), 5)
+        # the remaining frames of the datagram are signaled as well
+        self.assertTrue(select.select([fileno], [], [], 0.5)[0])
+        self.assertEqual(len(self.receiver.recv_batch(5, 0)), 5)
+        self.assertEqual(self.receiver.recv_batch(5, 0), [])
+
+    def test_recv_interleaved_with_traffic(self):
+        sender = self._sender()
+        msgs = [can.Message(arbitration_id=i, data=[i % 256] * 8) for i in range(5000)]
+        sender.send_batch(msgs)
+        received = [self.receiver.recv(1.0) for _ in range(4000)]
+        # reading the queued frames one at a time must not fill the socket
+        sender.send_batch(msgs)
+        received.extend(self._receive_all())
+        self.assertEqual(len(received), 10000)
+        self.assertEqual(
+            [msg.arbitration_id for msg in received], list(range(5000)) * 2
+        )
+        self.assertEqual(self.receiver.statistics.driver["datagrams_lost"], 0)
+
+    def test_invalid_address(self):
+        with self.assertRaises(ValueError):
+            udp_bridge.UdpBridgeBus(channel="localhost")
+
+
+if __name__ == "__main__":
+    unittest.main()
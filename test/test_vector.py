@@ -203,6 +203,47 @@ class TestVectorBus(unittest.TestCase):
         can.interfaces.vector.canlib.xldriver.xlCanReceive.assert_called()
         self.bus.handle_canfd_event.assert_called()
 
+    def test_receive_batch(self) -> None:
+        can.interfaces.vector.canlib.xldriver.xlReceive = Mock(
+            side_effect=xlReceive_batch
+        )
+        self.bus = can.Bus(channel=0, bustype="vector", _testing=True)
+        self.bus.handle_can_event = Mock()
+        msgs = self.bus.recv_batch(max_messages=10, timeout=0)
+        self.assertEqual([msg.arbitration_id for msg in msgs], [0, 2, 3])
+        self.assertEqual([bytes(msg.data) for msg in msgs], [b"\x00", b"\x02", b"\x03"])
+        self.bus.handle_can_event.assert_called_once()
+
+        # all events are read with a single call into the same buffer
+        xlReceive = can.interfaces.vector.canlib.xldriver.xlReceive
+        xlReceive.assert_called_once()
+        self.bus.recv_batch(max_messages=10, timeout=0)
+        self.assertIs(xlReceive.call_args_list[0][0][2], xlReceive.call_args[0][2])
+
+    def test_receive_batch_max_messages(self) -> None:
+        can.interfaces.vector.canlib.xldriver.xlReceive = Mock(
+            side_effect=xlReceive_batch
+        )
+        self.bus = can.Bus(channel=0, bustype="vector", _testing=True)
+        msgs = self.bus.recv_batch(max_messages=2, timeout=0)
+        self.assertEqual([msg.arbitration_id for msg in msgs], [0])
+        self.assertEqual(
+            can.interfaces.vector.canlib.xldriver.xlReceive.call_args[0][1].value, 2
+        )
+
+    def test_receive_fd_batch(self) -> None:
+        can.interfaces.vector.canlib.xldriver.xlCanReceive = Mock(
+            side_effect=xlCanReceive_batch(0x1, 0x2, 0x3)
+        )
+        self.bus = can.Bus(channel=0, bustype="vector", fd=True, _testing=True)
+        msgs = self.bus.recv_batch(max_messages=10, timeout=0)
+        self.assertEqual([msg.arbitration_id for msg in msgs], [1, 2, 3])
+        xlCanReceive = can.interfaces.vector.canlib.xldriver.xlCanReceive
+        self.assertEqual(xlCanReceive.call_count, 4)
+        events = {id(call[0][1]) for call in xlCanReceive.call_args_list}
+        self.assertEqual(len(events), 1)
+        self.assertEqual(self.bus.recv_batch(timeout=0), [])
+
     def test_send(self) -> None:
         self.bus = can.Bus(channel=0, bustype="vector", _testing=True)
         msg = can.Message(
@@ -352,8 +393,10 @@ def xlSetNotification(
 def xlReceive(
     port_handle: xlclass.XLportHandle,
     event_count_p: ctypes.POINTER(ctypes.c_uint),
-    event: ctypes.POINTER(xlclass.XLevent),
+    events: ctypes.POINTER(xlclass.XLevent),
 ) -> int:
+    event_count_p.value = 1
+    event = events[0]
     event.tag = xldefine.XL_EventTags.XL_RECEIVE_MSG.value
     event.tagData.msg.id = 0x123
     event.tagData.msg.dlc = 8
@@ -382,8 +425,10 @@ def xlCanReceive(
 def xlReceive_chipstate(
     port_handle: xlclass.XLportHandle,
     event_count_p: ctypes.POINTER(ctypes.c_uint),
-    event: ctypes.POINTER(xlclass.XLevent),
+    events: ctypes.POINTER(xlclass.XLevent),
 ) -> int:
+    event_count_p.value = 1
+    event = events[0]
     event.tag = xldefine.XL_EventTags.XL_CHIP_STATE.value
     event.tagData.chipState.busStatus = 8
     event.tagData.chipState.rxErrorCounter = 0
@@ -405,5 +450,52 @@ def xlCanReceive_chipstate(
     return 0
 
 
+def xlReceive_batch(
+    port_handle: xlclass.XLportHandle,
+    event_count_p: ctypes.POINTER(ctypes.c_uint),
+    events: ctypes.POINTER(xlclass.XLevent),
+) -> int:
+    # three messages with a chip state event in between
+    event_count_p.value = min(event_count_p.value, 4)
+    for idx in range(event_count_p.value):
+        event = events[idx]
+        if idx == 1:
+            event.tag = xldefine.XL_EventTags.XL_CHIP_STATE.value
+            continue
+        event.tag = xldefine.XL_EventTags.XL_RECEIVE_MSG.value
+        event.tagData.msg.id = idx
+        event.tagData.msg.dlc = 1
+        event.tagData.msg.flags = 0
+        event.tagData.msg.data[0] = idx
+        event.timeStamp = idx
+        event.chanIndex = 0
+    return 0
+
+
+def xlCanReceive_batch(*messages):
+    """Return a mock for xlCanReceive that reads the given message IDs and then
+    reports an empty queue."""
+    message_ids = list(messages)
+
+    def xlCanReceive(
+        port_handle: xlclass.XLportHandle, event: ctypes.POINTER(xlclass.XLcanRxEvent)
+    ) -> int:
+        if not message_ids:
+            raise VectorError(
+                xldefine.XL_Status.XL_ERR_QUEUE_IS_EMPTY,
+                xldefine.XL_Status.XL_ERR_QUEUE_IS_EMPTY.name,
+                "xlCanReceive",
+            )
+        event.tag = xldefine.XL_CANFD_RX_EventTags.XL_CAN_EV_TAG_RX_OK.value
+        event.tagData.canRxOkMsg.canId = message_ids.pop(0)
+        event.tagData.canRxOkMsg.dlc = 1
+        event.tagData.canRxOkMsg.msgFlags = 0
+        event.timeStamp = 0
+        event.chanIndex = 0
+        return 0
+
+    return xlCanReceive
+
+
 if __name__ == "__main__":
     unittest.main()